@@ -0,0 +1,125 @@
+"""
+Compare the hierarchical timing wheel with a heap-based timer queue.
+
+Both structures get the same simulated workload, interleaved the way a busy
+process sees it: the clock moves forward a minute at a time, and each
+minute new reminders are inserted (due seconds to weeks ahead), some
+earlier ones are cancelled or moved, and whatever came due is fired. After
+the last insert the clock runs on until everything has fired. Time is
+summed per kind of operation.
+
+    python -m benchmarks.bench_timing_wheel --n 1000000
+"""
+import argparse
+import heapq
+import itertools
+import random
+import time
+
+from core.reminders.timing_wheel import TimingWheel
+
+
+class HeapTimerQueue:
+    """The heap + lazy-cancel scheme used by ReminderScheduler, without threads."""
+    def __init__(self, now):
+        self._heap = []
+        self._live = {}
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._live)
+
+    def add(self, item_id, due, payload):
+        seq = next(self._seq)
+        self._live[item_id] = seq
+        heapq.heappush(self._heap, (due, seq, item_id, payload))
+
+    def cancel(self, item_id):
+        self._live.pop(item_id, None)
+
+    def advance(self, now):
+        fired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, seq, item_id, payload = heapq.heappop(heap)
+            if self._live.get(item_id) == seq:
+                del self._live[item_id]
+                fired.append(payload)
+        return fired
+
+
+def make_workload(n, seed=42, start=1_700_000_000, minutes=7 * 24 * 60, step=60):
+    """
+    (start, step, rounds): one round per simulated minute, each a tuple of
+    (inserts, cancels, moves) to apply before advancing the clock to the
+    round's end. Ids are insertion numbers; cancels and moves pick earlier
+    ids at random, some of which will have fired already.
+    """
+    rng = random.Random(seed)
+    spans = (60, 3600, 86400, 7 * 86400)  # seconds, minutes, hours, days ahead
+    per_round, extra = divmod(n, minutes)
+    rounds = []
+    next_id = 0
+    for m in range(minutes):
+        now = start + m * step
+        count = per_round + (m < extra)
+        inserts = [(next_id + k, now + 1 + rng.randrange(rng.choice(spans))) for k in range(count)]
+        next_id += count
+        cancels = [rng.randrange(next_id) for _ in range(count // 4)]
+        moves = [(rng.randrange(next_id), now + 1 + rng.randrange(7 * 86400)) for _ in range(count // 10)]
+        rounds.append((inserts, cancels, moves))
+    # Let everything scheduled fire
+    rounds += [((), (), ())] * (7 * 24 * 60 + 1)
+    return start, step, rounds
+
+
+def run(factory, workload):
+    start, step, rounds = workload
+    timings = dict.fromkeys(("insert", "cancel", "reschedule", "fire"), 0.0)
+    clock = time.perf_counter
+    q = factory(start)
+    fired = 0
+    now = start
+    for inserts, cancels, moves in rounds:
+        t0 = clock()
+        for i, due in inserts:
+            q.add(i, due, i)
+        t1 = clock()
+        for i in cancels:
+            q.cancel(i)
+        t2 = clock()
+        for i, due in moves:
+            q.cancel(i)
+            q.add(i, due, i)
+        t3 = clock()
+        now += step
+        fired += len(q.advance(now))
+        t4 = clock()
+        timings["insert"] += t1 - t0
+        timings["cancel"] += t2 - t1
+        timings["reschedule"] += t3 - t2
+        timings["fire"] += t4 - t3
+    timings["total"] = sum(timings.values())
+    return timings, fired
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=1_000_000, help="number of reminders")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    workload = make_workload(args.n, args.seed)
+    results = {}
+    for name, factory in (("heap", HeapTimerQueue), ("wheel", TimingWheel)):
+        results[name], fired = run(factory, workload)
+        print(f"{name:>6}: fired {fired}")
+
+    print(f"\n{'phase':<12}{'heap (s)':>12}{'wheel (s)':>12}")
+    for phase in ("insert", "cancel", "reschedule", "fire", "total"):
+        print(f"{phase:<12}{results['heap'][phase]:>12.3f}{results['wheel'][phase]:>12.3f}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Load test for the HTTP API in `server`.
+
+Simulated students keep a connection open each and loop over a mix of
+requests: read the transcript, add a subject, read the CGPA, list and add
+reminders. A few connections also run cohort CGPA requests. The script
+reports requests per second and latency percentiles for each kind of request.
+
+    python -m benchmarks.load_api                            # starts its own server
+    python -m benchmarks.load_api --url http://127.0.0.1:8765 --clients 200 --seconds 30
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+GRADES = ["A+", "A", "A-", "B+", "B", "B-", "C+", "C", "F"]
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection."""
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, body=None):
+        data = json.dumps(body).encode() if body is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+        )
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        length = 0
+        for line in lines[1:]:
+            if line.lower().startswith("content-length:"):
+                length = int(line.split(":", 1)[1])
+        payload = await self.reader.readexactly(length) if length else b""
+        return status, payload
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def percentiles(samples):
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pick(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+    return {"count": len(ordered), "p50_ms": pick(50), "p95_ms": pick(95), "p99_ms": pick(99),
+            "max_ms": ordered[-1] * 1000, "mean_ms": statistics.fmean(ordered) * 1000}
+
+
+async def student_loop(client, sid, deadline, latencies, errors, rng):
+    async def timed(kind, method, path, body=None):
+        start = time.perf_counter()
+        try:
+            status, _ = await client.request(method, path, body)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            errors[kind] = errors.get(kind, 0) + 1
+            raise e
+        latencies.setdefault(kind, []).append(time.perf_counter() - start)
+        if status >= 400:
+            errors[kind] = errors.get(kind, 0) + 1
+
+    base = f"/students/{sid}"
+    await timed("add semester", "POST", f"{base}/semesters", {"subjects": []})
+    while time.perf_counter() < deadline:
+        roll = rng.random()
+        if roll < 0.35:
+            await timed("get transcript", "GET", f"{base}/transcript")
+        elif roll < 0.55:
+            subject = {"name": f"Subject {rng.randrange(40)}", "credit": rng.choice((2, 3, 4)),
+                       "grade": rng.choice(GRADES)}
+            await timed("add subject", "POST", f"{base}/semesters/1/subjects", subject)
+        elif roll < 0.75:
+            await timed("get cgpa", "GET", f"{base}/cgpa")
+        elif roll < 0.9:
+            await timed("list reminders", "GET", f"{base}/reminders?limit=20")
+        else:
+            body = {"message": f"revise topic {rng.randrange(100)}", "in_minutes": rng.randrange(60, 60 * 24 * 30)}
+            await timed("add reminder", "POST", f"{base}/reminders", body)
+
+
+async def cohort_loop(client, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        status, _ = await client.request("POST", "/cohort/cgpa", {})
+        latencies.setdefault("cohort cgpa", []).append(time.perf_counter() - start)
+        if status >= 400:
+            errors["cohort cgpa"] = errors.get("cohort cgpa", 0) + 1
+
+
+async def run(host, port, clients, seconds, cohort_clients, seed):
+    latencies, errors = {}, {}
+    conns = [Client(host, port) for _ in range(clients + cohort_clients)]
+    await asyncio.gather(*(c.connect() for c in conns))
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    deadline = started + seconds
+    tasks = [
+        student_loop(c, f"load{seed}_{i}", deadline, latencies, errors, random.Random(rng.random()))
+        for i, c in enumerate(conns[:clients])
+    ]
+    tasks += [cohort_loop(c, deadline, latencies, errors) for c in conns[clients:]]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    for c in conns:
+        c.close()
+    failed = [r for r in results if isinstance(r, Exception)]
+
+    total = sum(len(v) for v in latencies.values())
+    report = {
+        "clients": clients,
+        "cohort_clients": cohort_clients,
+        "seconds": elapsed,
+        "requests": total,
+        "rps": total / elapsed if elapsed else 0.0,
+        "errors": errors,
+        "failed_clients": len(failed),
+        "overall": percentiles([s for v in latencies.values() for s in v]),
+        "by_request": {k: percentiles(v) for k, v in sorted(latencies.items())},
+    }
+    return report
+
+
+def print_report(report):
+    print(f"{report['requests']} requests in {report['seconds']:.1f} s from {report['clients']} clients "
+          f"(+{report['cohort_clients']} cohort): {report['rps']:.0f} req/s")
+    rows = [("overall", report["overall"])] + list(report["by_request"].items())
+    print(f"  {'request':<18}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, p in rows:
+        if p:
+            print(f"  {name:<18}{p['count']:>8}{p['p50_ms']:>10.2f}{p['p95_ms']:>10.2f}"
+                  f"{p['p99_ms']:>10.2f}{p['max_ms']:>10.1f}")
+    if report["errors"] or report["failed_clients"]:
+        print(f"  errors: {report['errors']}  failed clients: {report['failed_clients']}")
+
+
+def _start_server(port, data_dir, workers):
+    cmd = [sys.executable, "-m", "server", "--port", str(port), "--data", data_dir]
+    if workers is not None:
+        cmd += ["--workers", str(workers)]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.Popen(cmd, cwd=root, stdout=subprocess.PIPE, text=True)
+    proc.stdout.readline()  # "Serving on ..." once it is listening
+    return proc
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the local HTTP API.")
+    parser.add_argument("--url", help="server to test (default: start one with a temporary data directory)")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--cohort-clients", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for a server started here")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    proc = tmp = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        host, port = "127.0.0.1", 8765 + random.randrange(1000)
+        proc = _start_server(port, tmp.name, args.workers)
+    try:
+        report = asyncio.run(run(host, port, args.clients, args.seconds, args.cohort_clients, args.seed))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+            tmp.cleanup()
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Count the fonts the shared resource cache saves on a large transcript.
+
+Builds the GPA page in a hidden window, fills it with `--subjects` subjects
+spread over `--semesters` semesters and opens every semester's detail
+page, then compares the fonts that widgets asked for (one CTkFont each
+before shared.resources) with the CTkFont objects that were created.
+Needs customtkinter and a display.
+
+    python -m benchmarks.resource_count --subjects 200 --semesters 8
+"""
+import argparse
+import json
+import random
+import sys
+
+GRADES = ["A+", "A", "A-", "B+", "B", "B-", "C+", "C", "F"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--subjects", type=int, default=200)
+    parser.add_argument("--semesters", type=int, default=8)
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        import customtkinter as ctk
+        from gpa_calculator.page import GPACalculatorPage
+    except ImportError as e:
+        sys.exit(f"needs the GUI dependencies: {e}")
+    from core.gpa import make_semester, make_subject
+    import shared
+
+    created = [0]
+    original_init = ctk.CTkFont.__init__
+
+    def counting_init(self, *a, **kw):
+        created[0] += 1
+        original_init(self, *a, **kw)
+    ctk.CTkFont.__init__ = counting_init
+
+    class HeadlessPage(GPACalculatorPage):
+        # Leave the real gpa_data.xlsx alone
+        def save_to_excel(self, filename=None):
+            pass
+
+        def load_from_excel(self, filename=None):
+            pass
+
+    try:
+        root = ctk.CTk()
+    except Exception as e:   # no display
+        sys.exit(f"cannot open a window: {e}")
+    root.withdraw()
+    page = HeadlessPage(root)
+
+    rng = random.Random(1)
+    per = max(1, args.subjects // args.semesters)
+    for start in range(0, args.subjects, per):
+        subjects = [
+            make_subject(f"Subject {i}", rng.choice((2, 3, 4)), rng.choice(GRADES))
+            for i in range(start, min(start + per, args.subjects))
+        ]
+        sem = make_semester(f"Semester {len(page.semesters) + 1}", subjects)
+        sem.update({"detail_page": None, "card": None, "gpa_label": None})
+        page.semesters.append(sem)
+        page._create_semester_card(sem)
+        page.open_semester(sem)
+        page.close_semester(sem)
+    root.update_idletasks()
+
+    stats = shared.stats()
+    result = {
+        "subjects": args.subjects,
+        "semesters": len(page.semesters),
+        "fonts_requested": stats["requested"]["fonts"],
+        "fonts_created": created[0],
+        "fonts_saved": stats["requested"]["fonts"] - created[0],
+    }
+    root.destroy()
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['subjects']} subjects in {result['semesters']} semesters: "
+              f"{result['fonts_requested']} fonts requested, {result['fonts_created']} CTkFont objects created "
+              f"({result['fonts_saved']} saved)")
+
+
+if __name__ == "__main__":
+    main()
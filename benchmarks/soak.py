@@ -0,0 +1,121 @@
+"""
+Soak test: open and close pages thousands of times and check memory stays flat.
+
+Each iteration adds a semester on a GPA page in a hidden window, opens its
+detail page, shows an error banner, goes back and removes the semester again;
+it also shows and releases a toast, and every `--chart-every` iterations opens
+and closes the GPA chart. The LeakTracker follows every widget, and at ten
+checkpoints the script records traced memory and live widget counts. It fails
+(exit status 1) if anything outlived its widget or memory kept growing after
+the first checkpoint. Needs customtkinter and a display.
+
+    python -m benchmarks.soak --iterations 5000
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--chart-every", type=int, default=50, help="open the chart every N iterations (0 = never)")
+    parser.add_argument("--max-growth-kib", type=float, default=64,
+                        help="allowed traced memory growth per 1000 iterations after warm-up")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        import customtkinter as ctk
+        from gpa_calculator.page import GPACalculatorPage
+        from reminder.toast import ToastManager
+    except ImportError as e:
+        sys.exit(f"needs the GUI dependencies: {e}")
+    from diagnostics import LeakTracker
+
+    class HeadlessPage(GPACalculatorPage):
+        # Leave the real gpa_data.xlsx alone
+        def save_to_excel(self, filename=None):
+            pass
+
+        def load_from_excel(self, filename=None):
+            pass
+
+    try:
+        root = ctk.CTk()
+    except Exception as e:   # no display
+        sys.exit(f"cannot open a window: {e}")
+    root.withdraw()
+
+    tracker = LeakTracker(root, grace_s=0)
+    tracker.start()
+    page = HeadlessPage(root)
+    page.place(relwidth=1, relheight=1)
+    toasts = ToastManager(root)
+
+    def iteration(i):
+        page.add_semester()
+        sem = page.semesters[-1]
+        page.open_semester(sem)
+        sem["detail_page"].show_error("soak")
+        page.close_semester(sem)
+        page.remove_semester(sem)
+
+        slot = toasts.show("Soak", f"toast {i}")
+        toasts.close(slot)
+        toasts._release(slot)   # skip the fade-out animation
+
+        if args.chart_every and i % args.chart_every == 0:
+            page.open_chart_page()
+            page.chart_page.go_back()
+        root.update()
+
+    checkpoints = []
+    every = max(1, args.iterations // 10)
+    start = time.perf_counter()
+    for i in range(1, args.iterations + 1):
+        iteration(i)
+        if i % every == 0:
+            gc.collect()
+            checkpoints.append({
+                "iteration": i,
+                "traced_kib": tracemalloc.get_traced_memory()[0] / 1024,
+                "live_widgets": sum(tracker.live_counts().values()),
+            })
+    elapsed = time.perf_counter() - start
+
+    outlived = tracker.outlived()
+    first, last = checkpoints[0], checkpoints[-1]
+    span_k = max(1, last["iteration"] - first["iteration"]) / 1000
+    growth = (last["traced_kib"] - first["traced_kib"]) / span_k
+    result = {
+        "iterations": args.iterations,
+        "seconds": elapsed,
+        "checkpoints": checkpoints,
+        "growth_kib_per_1000": growth,
+        "widget_growth": last["live_widgets"] - first["live_widgets"],
+        "outlived": [{"label": label, "held_by": hint} for label, _, hint in outlived[:20]],
+    }
+    result["flat"] = not outlived and growth <= args.max_growth_kib and result["widget_growth"] <= 0
+    report = tracker.report(snapshot=True)
+    tracker.stop()
+    root.destroy()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for c in checkpoints:
+            print(f"{c['iteration']:>8}  {c['traced_kib']:>10.0f} KiB  {c['live_widgets']:>6} live widgets")
+        print(f"{args.iterations} iterations in {elapsed:.1f} s; growth after warm-up "
+              f"{growth:.1f} KiB per 1000 iterations, {result['widget_growth']:+d} widgets, "
+              f"{len(outlived)} outlived their widget")
+        print(report)
+        print("memory is flat" if result["flat"] else "memory is NOT flat")
+    sys.exit(0 if result["flat"] else 1)
+
+
+if __name__ == "__main__":
+    main()
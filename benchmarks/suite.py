@@ -0,0 +1,320 @@
+"""
+Benchmark suite for the GPA, Pomodoro and reminder subsystems.
+
+Everything runs headless: the GPA and reminder groups drive core.gpa and
+core.reminders directly, without any widgets. A benchmark whose dependencies are missing
+(openpyxl, ...) is recorded as skipped rather than failing
+the run. Results are written as JSON and can be compared with a baseline:
+
+    python -m benchmarks.suite                       # full run
+    python -m benchmarks.suite --quick --only cgpa   # smaller sizes, one group
+    python -m benchmarks.suite --save-baseline       # store this run as the baseline
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --threshold 0.2
+
+The exit status is 1 when a case is slower than the baseline by more than
+the threshold.
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+RESULTS_DIR = os.path.join(HERE, "results")
+
+GRADES = ["A+", "A", "A-", "B+", "B", "B-", "C+", "C", "F"]
+
+
+class Skip(Exception):
+    """Raised by a benchmark whose dependencies aren't available here."""
+
+
+def measure(fn, repeats=5, setup=None):
+    """Run fn `repeats` times (after optional setup each time) and return timing stats."""
+    times = []
+    for _ in range(repeats):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        fn(arg) if setup else fn()
+        times.append(time.perf_counter() - start)
+    return {"seconds": statistics.median(times), "min": min(times), "repeats": repeats}
+
+
+def _require(module_name, attr=None):
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise Skip(f"{module_name}: {e}")
+    return getattr(module, attr) if attr else module
+
+
+def synthetic_subjects(n, seed=1):
+    rng = random.Random(seed)
+    names = [f"Subject {i}" for i in range(max(1, n // 2))]  # some repeats, as after a resit
+    return [
+        {"name": rng.choice(names), "credit": float(rng.choice((2, 3, 4))), "grade": rng.choice(GRADES)}
+        for _ in range(n)
+    ]
+
+
+# --- GPA ---
+def bench_cgpa(quick):
+    cgpa_tarumt = _require("core.gpa", "cgpa_tarumt")
+    sizes = (10, 1_000, 10_000) if quick else (10, 1_000, 100_000, 1_000_000)
+    results = {}
+    for n in sizes:
+        subjects = synthetic_subjects(n)
+        results[f"n={n}"] = measure(lambda: cgpa_tarumt(subjects), repeats=3 if n >= 100_000 else 5)
+    return results
+
+
+def _synthetic_semesters(gpa, n_rows, semesters_of=8):
+    subjects = synthetic_subjects(n_rows)
+    per = max(1, n_rows // semesters_of)
+    return [gpa.make_semester(f"Sem {i // per + 1}", subjects[i:i + per]) for i in range(0, n_rows, per)]
+
+
+def bench_excel(quick):
+    gpa = _require("core.gpa")
+    _require("openpyxl")
+    sizes = (100, 1_000) if quick else (100, 1_000, 10_000)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            semesters = _synthetic_semesters(gpa, n)
+            path = os.path.join(tmp, f"gpa_{n}.xlsx")
+            results[f"save n={n}"] = measure(lambda: gpa.save_excel(semesters, path), repeats=3)
+            results[f"load n={n}"] = measure(lambda: gpa.load_excel(path), repeats=3)
+    return results
+
+
+# --- Pomodoro ---
+class _FakeCanvas:
+    def itemconfig(self, *args, **kwargs):
+        pass
+
+
+class _FakeWindow:
+    def _root(self):
+        return self
+
+    def after(self, ms, func=None, *args):
+        return "after#0"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def bench_pomodoro(quick):
+    timer_logic = _require("pomodoro.timer_logic")
+    ticks = 10_000 if quick else 100_000
+    canvas = _FakeCanvas()
+
+    def run():
+        window = _FakeWindow()   # fresh timer queue per run
+        timer_logic.is_paused = False
+        timer_logic.total_time = timer_logic.time_left = ticks + 10
+        for _ in range(ticks):
+            timer_logic.countdown(window, canvas, None, None, None, None, None, None, None,
+                                  None, None, None, None)
+            timer_logic.time_left -= 1
+
+    stats = measure(run, repeats=3)
+    stats["per_tick_us"] = stats["seconds"] / ticks * 1e6
+    return {f"countdown x{ticks}": stats}
+
+
+# --- Reminders ---
+class _FakeReminder:
+    def __init__(self, i, due):
+        self.id = f"r{i}"
+        self.message = f"reminder {i}"
+        self.remind_time = due
+        self.due_ts = due.timestamp()
+        self.stopped = False
+        self.callback = None
+
+    def advance(self):
+        return False
+
+
+def _fake_reminders(n, seed=2):
+    rng = random.Random(seed)
+    now = datetime.now()
+    # Mostly far in the future so nothing fires while we measure
+    return [_FakeReminder(i, now + timedelta(hours=2, seconds=rng.randrange(30 * 86400))) for i in range(n)]
+
+
+def bench_scheduler(quick):
+    from core.reminders.scheduler import ReminderScheduler
+    from core.reminders.tiers import TieredScheduler
+    from core.reminders.timing_wheel import TimingWheelScheduler
+
+    sizes = (1_000, 10_000) if quick else (1_000, 10_000, 100_000)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            reminders = _fake_reminders(n)
+            backends = {
+                "heap": ReminderScheduler,
+                "wheel": TimingWheelScheduler,
+                "tiered": lambda: TieredScheduler(os.path.join(tmp, f"cold_{n}.db"), resolve=lambda rid: None),
+            }
+            for name, factory in backends.items():
+                def schedule(sched):
+                    if hasattr(sched, "schedule_many"):
+                        sched.schedule_many(reminders, replace=True)
+                    else:
+                        for r in reminders:
+                            sched.schedule(r)
+                    for r in reminders[::4]:
+                        sched.cancel(r.id)
+                    sched.shutdown()
+                results[f"{name} schedule+cancel n={n}"] = measure(schedule, repeats=3, setup=factory)
+    return results
+
+
+def _reminder_service(tmp, n):
+    from core.reminders import ReminderService
+
+    service = ReminderService(os.path.join(tmp, f"reminders_{n}"))
+    now = datetime.now()
+    rng = random.Random(3)
+    service.store.add_many([
+        service.new(f"reminder {i} exam revision", now + timedelta(minutes=rng.randrange(1, 60 * 24 * 60)))
+        for i in range(n)
+    ])
+    return service
+
+
+def bench_persistence(quick):
+    from core.reminders import ReminderService
+
+    sizes = (1_000, 10_000) if quick else (1_000, 10_000, 50_000)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            service = _reminder_service(tmp, n)
+            results[f"save n={n}"] = measure(service.save, repeats=3)
+
+            def load(fresh):
+                fresh.load()
+                fresh.scheduler.shutdown()
+            results[f"load n={n}"] = measure(load, repeats=3, setup=lambda: ReminderService(service.directory))
+            service.scheduler.shutdown()
+    return results
+
+
+BENCHMARKS = {
+    "cgpa": bench_cgpa,
+    "excel": bench_excel,
+    "pomodoro": bench_pomodoro,
+    "scheduler": bench_scheduler,
+    "persistence": bench_persistence,
+}
+
+
+# --- Running and comparing ---
+def run_suite(names, quick=False):
+    results = {}
+    for name in names:
+        print(f"[{name}]", flush=True)
+        try:
+            cases = BENCHMARKS[name](quick)
+        except Skip as e:
+            print(f"  skipped: {e}")
+            results[name] = {"skipped": str(e)}
+            continue
+        for case, stats in cases.items():
+            print(f"  {case:<36}{stats['seconds'] * 1000:>12.3f} ms")
+        results[name] = cases
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Return (group, case, old, new, ratio) for cases slower than baseline by > threshold."""
+    regressions = []
+    for group, cases in results.items():
+        old_cases = baseline.get("results", {}).get(group, {})
+        if "skipped" in cases or "skipped" in old_cases:
+            continue
+        for case, stats in cases.items():
+            old = old_cases.get(case)
+            if not old or not old.get("seconds"):
+                continue
+            ratio = stats["seconds"] / old["seconds"]
+            if ratio > 1 + threshold:
+                regressions.append((group, case, old["seconds"], stats["seconds"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="run only these groups")
+    parser.add_argument("--quick", action="store_true", help="smaller sizes for a fast check")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline results to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    names = args.only or list(BENCHMARKS)
+    data = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": run_suite(names, args.quick),
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare with (use --save-baseline to create one).")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("meta", {}).get("quick") != args.quick:
+        print("Note: baseline and this run use different sizes (--quick); only matching cases are compared.")
+    regressions = compare(data["results"], baseline, args.threshold)
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}.")
+        return 0
+    print(f"\nRegressions beyond {args.threshold:.0%}:")
+    for group, case, old, new, ratio in regressions:
+        print(f"  {group}/{case}: {old * 1000:.3f} ms -> {new * 1000:.3f} ms ({ratio:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
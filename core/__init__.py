@@ -0,0 +1,7 @@
+# core/__init__.py
+"""
+GUI-free logic shared by the pages, batch jobs and services.
+
+Nothing under core imports tkinter or customtkinter, and heavy optional
+dependencies (openpyxl) are only imported by the functions that need them.
+"""
@@ -0,0 +1,12 @@
+# core/gpa/__init__.py
+"""TARUMT grade points, GPA/CGPA calculation and Excel/JSON persistence."""
+
+from .models import GRADE_POINTS, make_semester, make_subject
+from .services import Transcript, cgpa_many, cgpa_tarumt, semester_gpa
+from .storage import load_excel, load_json, save_excel, save_json
+
+__all__ = [
+    'GRADE_POINTS', 'make_semester', 'make_subject',
+    'Transcript', 'cgpa_many', 'cgpa_tarumt', 'semester_gpa',
+    'load_excel', 'load_json', 'save_excel', 'save_json',
+]
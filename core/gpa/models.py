@@ -0,0 +1,30 @@
+# TARUMT Grade → Point mapping
+GRADE_POINTS = {
+    "A+": 4.00,
+    "A": 4.00,
+    "A-": 3.67,
+    "B+": 3.33,
+    "B": 3.00,
+    "B-": 2.67,
+    "C+": 2.33,
+    "C": 2.00,
+    "F": 0.00,
+}
+
+
+def make_subject(name, credit, grade):
+    """Validated subject dict: {"name", "credit", "grade"}."""
+    credit = float(credit)
+    if credit <= 0:
+        raise ValueError("Credit hours must be positive.")
+    if grade not in GRADE_POINTS:
+        raise ValueError(f"Unknown grade: {grade}")
+    return {"name": str(name), "credit": credit, "grade": grade}
+
+
+def make_semester(name, subjects=None):
+    """Semester dict: {"name", "gpa", "subjects"}; views may add their own widget keys."""
+    from .services import semester_gpa
+
+    subjects = list(subjects or [])
+    return {"name": name, "gpa": semester_gpa(subjects), "subjects": subjects}
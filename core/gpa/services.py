@@ -0,0 +1,101 @@
+from diagnostics.tracing import traced
+
+from .models import GRADE_POINTS, make_semester, make_subject
+
+
+def semester_gpa(subjects):
+    """Calculate GPA for a list of subjects."""
+    if not subjects:
+        return 0.0
+    total_points = sum(GRADE_POINTS[s["grade"]] * s["credit"] for s in subjects)
+    total_credits = sum(s["credit"] for s in subjects)
+    return total_points / total_credits if total_credits else 0.0
+
+
+@traced(cat="gpa")
+def cgpa_tarumt(all_subjects):
+    """Calculate CGPA using TARUMT rules: exclude failed subject credits only once."""
+    if not all_subjects:
+        return 0.0
+
+    # Group subjects by name (case-insensitive)
+    subject_groups = {}
+    for subject in all_subjects:
+        name = subject["name"].strip().lower()
+        if name not in subject_groups:
+            subject_groups[name] = []
+        subject_groups[name].append(subject)
+
+    total_points = 0.0
+    total_credits = 0.0
+
+    for subject_name, subjects in subject_groups.items():
+        has_failed = any(s["grade"] == "F" for s in subjects)
+
+        # Add all grade points (including F = 0.0)
+        for subject in subjects:
+            total_points += GRADE_POINTS[subject["grade"]] * subject["credit"]
+
+        # Exclude failed subject credits only once
+        if has_failed:
+            for i, subject in enumerate(subjects):
+                if i == 0:  # Skip first attempt
+                    continue
+                total_credits += subject["credit"]
+        else:
+            for subject in subjects:
+                total_credits += subject["credit"]
+
+    return total_points / total_credits if total_credits > 0 else 0.0
+
+
+def cgpa_many(subject_lists):
+    """CGPA for each student's subject list (a module-level function, so worker processes can run it)."""
+    return [cgpa_tarumt(subjects) for subjects in subject_lists]
+
+
+class Transcript:
+    """
+    One student's semesters with GPA/CGPA kept up to date, without any UI.
+    Semesters are numbered "Semester N" in order, like the GPA page does.
+    """
+    def __init__(self, semesters=None):
+        self.semesters = list(semesters or [])
+
+    def add_semester(self, subjects=None):
+        sem = make_semester(f"Semester {len(self.semesters) + 1}", subjects)
+        self.semesters.append(sem)
+        return sem
+
+    def get_semester(self, index):
+        return self.semesters[index]
+
+    def remove_semester(self, index):
+        sem = self.semesters.pop(index)
+        self._renumber()
+        return sem
+
+    def set_subjects(self, index, subjects):
+        """Replace a semester's subjects (validated) and recompute its GPA."""
+        sem = self.semesters[index]
+        sem["subjects"] = [make_subject(s["name"], s["credit"], s["grade"]) for s in subjects]
+        sem["gpa"] = semester_gpa(sem["subjects"])
+        return sem
+
+    def all_subjects(self):
+        return [subj for sem in self.semesters for subj in sem["subjects"]]
+
+    def cgpa(self):
+        return cgpa_tarumt(self.all_subjects())
+
+    def to_dict(self):
+        return {
+            "cgpa": self.cgpa(),
+            "semesters": [
+                {"name": s["name"], "gpa": s["gpa"], "subjects": list(s["subjects"])} for s in self.semesters
+            ],
+        }
+
+    def _renumber(self):
+        for i, sem in enumerate(self.semesters, start=1):
+            sem["name"] = f"Semester {i}"
@@ -0,0 +1,86 @@
+import json
+import os
+
+from diagnostics.tracing import traced
+
+from .services import semester_gpa
+
+HEADER = ["Semester", "Subject", "Credit", "Grade", "GPA"]
+
+
+@traced(cat="gpa")
+def save_excel(semesters, file_path):
+    """Save all semester and subject data to an Excel file."""
+    import openpyxl  # only needed here, keeps importing the core cheap
+
+    folder = os.path.dirname(file_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "GPA Data"
+    ws.append(HEADER)
+
+    for sem in semesters:
+        for subj in sem["subjects"]:
+            ws.append([
+                sem["name"],
+                subj["name"],
+                subj["credit"],
+                subj["grade"],
+                f"{sem['gpa']:.4f}",
+            ])
+
+    wb.save(file_path)
+
+
+@traced(cat="gpa")
+def load_excel(file_path):
+    """Load semesters ({"name", "gpa", "subjects"}) from an Excel file; [] if it doesn't exist."""
+    if not os.path.exists(file_path):
+        return []
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file_path, read_only=True)
+    ws = wb.active
+    semesters_dict = {}
+    for row in ws.iter_rows(min_row=2, values_only=True):  # Skip header
+        sem_name, subj_name, credit, grade = row[:4]
+        if sem_name not in semesters_dict:
+            semesters_dict[sem_name] = {"name": sem_name, "gpa": 0.0, "subjects": []}
+        semesters_dict[sem_name]["subjects"].append({
+            "name": subj_name,
+            "credit": float(credit),
+            "grade": grade,
+        })
+    wb.close()
+
+    semesters = list(semesters_dict.values())
+    for sem in semesters:
+        sem["gpa"] = semester_gpa(sem["subjects"])
+    return semesters
+
+
+def save_json(semesters, file_path):
+    """Save semesters as JSON (written to a temp file first, then swapped in)."""
+    folder = os.path.dirname(file_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    data = [{"name": s["name"], "subjects": s["subjects"]} for s in semesters]
+    tmp = file_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, file_path)
+
+
+def load_json(file_path):
+    """Load semesters saved by save_json; [] if the file doesn't exist."""
+    if not os.path.exists(file_path):
+        return []
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [
+        {"name": s["name"], "gpa": semester_gpa(s["subjects"]), "subjects": s["subjects"]}
+        for s in data
+    ]
@@ -0,0 +1,18 @@
+# core/reminders/__init__.py
+"""Reminder model, recurrence, scheduling, search, storage and import/export."""
+
+from .models import Reminder
+from .recurrence import RecurrenceRule
+from .scheduler import ReminderScheduler, default_scheduler
+from .services import ReminderService
+from .storage import ReminderStorage
+from .store import ReminderStore
+from .tenants import TenantReminderService, TenantScheduler
+from .tiers import TieredScheduler
+
+__all__ = [
+    'Reminder', 'RecurrenceRule',
+    'ReminderScheduler', 'default_scheduler', 'TieredScheduler',
+    'ReminderService', 'ReminderStorage', 'ReminderStore',
+    'TenantReminderService', 'TenantScheduler',
+]
@@ -0,0 +1,135 @@
+"""
+Parsing for bulk quick-add: many reminders pasted as text or loaded from CSV.
+
+Text lines look like
+
+    2025-06-02 09:00 | Calculus exam
+    2025-06-03 2:30pm | Revise chapter 4 | every 2 days
+
+and CSV rows carry date, time, message and an optional repeat column (a
+header row is skipped). Every line is validated in one pass: valid lines
+become BulkEntry objects and the rest are reported with their line number.
+"""
+import csv
+import re
+from datetime import datetime
+
+from .recurrence import DAILY, MINUTELY, MONTHLY, MONTHLY_NTH, WEEKDAYS, WEEKLY, RecurrenceRule
+
+_TIME_RE = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*([ap]\.?m\.?)?$", re.IGNORECASE)
+_EVERY_RE = re.compile(r"^every\s+(\d+)?\s*(minute|hour|day|week|month)s?$")
+_REPEAT_WORDS = {
+    "daily": (DAILY, 1),
+    "weekdays": (WEEKDAYS, 1),
+    "weekly": (WEEKLY, 1),
+    "monthly": (MONTHLY, 1),
+    "monthly by weekday": (MONTHLY_NTH, 1),
+    "hourly": (MINUTELY, 60),
+}
+_UNIT_FREQ = {"minute": (MINUTELY, 1), "hour": (MINUTELY, 60), "day": (DAILY, 1),
+              "week": (WEEKLY, 1), "month": (MONTHLY, 1)}
+
+
+class BulkEntry:
+    def __init__(self, line_no, message, remind_time, rule=None):
+        self.line_no = line_no
+        self.message = message
+        self.remind_time = remind_time
+        self.rule = rule
+
+
+class BulkError:
+    def __init__(self, line_no, text, reason):
+        self.line_no = line_no
+        self.text = text
+        self.reason = reason
+
+    def __str__(self):
+        return f"Line {self.line_no}: {self.reason}"
+
+
+def parse_time(text):
+    m = _TIME_RE.match(text.strip())
+    if not m:
+        raise ValueError(f"invalid time '{text.strip()}'")
+    hour, minute, ampm = int(m.group(1)), int(m.group(2) or 0), m.group(3)
+    if ampm:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"invalid time '{text.strip()}'")
+        hour = hour % 12 + (12 if ampm.lower().startswith("p") else 0)
+    if hour > 23 or minute > 59:
+        raise ValueError(f"invalid time '{text.strip()}'")
+    return hour, minute
+
+
+def parse_repeat(text):
+    """'weekly', 'every 3 days', 'hourly', ... -> RecurrenceRule (None for blank)."""
+    text = " ".join(text.lower().split())
+    if not text or text in ("no", "none", "once"):
+        return None
+    if text in _REPEAT_WORDS:
+        freq, interval = _REPEAT_WORDS[text]
+        return RecurrenceRule(freq, interval)
+    m = _EVERY_RE.match(text)
+    if m:
+        freq, scale = _UNIT_FREQ[m.group(2)]
+        interval = int(m.group(1) or 1) * scale
+        if interval <= 0:
+            raise ValueError("repeat interval must be positive")
+        return RecurrenceRule(freq, interval)
+    raise ValueError(f"unknown repeat '{text}'")
+
+
+def _entry(line_no, date_text, time_text, message, repeat_text, now):
+    message = message.strip()
+    if not message:
+        raise ValueError("missing message")
+    try:
+        day = datetime.strptime(date_text.strip(), "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"invalid date '{date_text.strip()}' (use yyyy-mm-dd)")
+    hour, minute = parse_time(time_text)
+    remind_time = day.replace(hour=hour, minute=minute)
+    rule = parse_repeat(repeat_text)
+    if rule is None and remind_time <= now:
+        raise ValueError("time is in the past")
+    return BulkEntry(line_no, message, remind_time, rule)
+
+
+def parse_text(text, now=None):
+    """Parse pasted 'date time | message [| repeat]' lines -> (entries, errors)."""
+    now = now or datetime.now()
+    entries, errors = [], []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        parts = [p.strip() for p in line.split("|")]
+        try:
+            if len(parts) not in (2, 3):
+                raise ValueError("expected 'date time | message [| repeat]'")
+            when = parts[0].split(None, 1)
+            if len(when) != 2:
+                raise ValueError("expected a date and a time before the first '|'")
+            entries.append(_entry(line_no, when[0], when[1], parts[1],
+                                  parts[2] if len(parts) == 3 else "", now))
+        except ValueError as e:
+            errors.append(BulkError(line_no, line, str(e)))
+    return entries, errors
+
+
+def parse_csv(f, now=None):
+    """Parse CSV rows of date, time, message[, repeat] from a file -> (entries, errors)."""
+    now = now or datetime.now()
+    entries, errors = [], []
+    for line_no, row in enumerate(csv.reader(f), 1):
+        if not any(cell.strip() for cell in row):
+            continue
+        if line_no == 1 and row[0].strip().lower() == "date":
+            continue  # header
+        try:
+            if len(row) not in (3, 4):
+                raise ValueError("expected date, time, message[, repeat]")
+            entries.append(_entry(line_no, row[0], row[1], row[2], row[3] if len(row) == 4 else "", now))
+        except ValueError as e:
+            errors.append(BulkError(line_no, ",".join(row), str(e)))
+    return entries, errors
@@ -0,0 +1,173 @@
+import gzip
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+
+class HistoryArchive:
+    """
+    Record of reminders that fired or were dismissed, kept apart from
+    reminders.json so the active store only holds pending reminders.
+
+    Entries are appended to one JSON-lines segment per day. Day segments
+    older than `keep_days` are compacted in a background thread into one
+    gzipped segment per month, so recent queries ("today", "this week") only
+    read a few small files and old history takes little space.
+    """
+    DAY_FMT = "%Y-%m-%d"
+    MONTH_FMT = "%Y-%m"
+
+    def __init__(self, directory, keep_days=14):
+        self.directory = directory
+        self.keep_days = keep_days
+        self._lock = threading.Lock()   # serializes compaction runs
+        self._compacting = False
+        self._last_day = None
+
+    # --- Writing ---
+    def append(self, event, reminder, when=None):
+        self.append_many(event, [reminder], when)
+
+    def append_many(self, event, reminders, when=None):
+        """Record `event` ("fired", "dismissed", ...) for several reminders at once."""
+        when = when or datetime.now()
+        lines = "".join(
+            json.dumps({
+                "t": when.isoformat(timespec="seconds"),
+                "event": event,
+                "id": r.id,
+                "message": r.message,
+                "repeat": r.repeat,
+            }, ensure_ascii=False) + "\n"
+            for r in reminders
+        )
+        if not lines:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._day_path(when.date()), "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError:
+            return
+        # A new day segment was started: older ones may be due for compaction
+        if self._last_day != when.date():
+            self._last_day = when.date()
+            self.compact_async()
+
+    # --- Queries ---
+    def between(self, start, end):
+        """Entries with start <= time < end, oldest first."""
+        entries = []
+        for path in self._segments_overlapping(start, end):
+            for entry in self._read(path):
+                t = datetime.fromisoformat(entry["t"])
+                if start <= t < end:
+                    entry["t"] = t
+                    entries.append(entry)
+        entries.sort(key=lambda e: e["t"])
+        return entries
+
+    def today(self, now=None):
+        now = now or datetime.now()
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.between(start, start + timedelta(days=1))
+
+    def this_week(self, now=None):
+        now = now or datetime.now()
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=now.weekday())
+        return self.between(start, start + timedelta(days=7))
+
+    # --- Compaction ---
+    def compact_async(self):
+        """Start a background compaction unless one is already running."""
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+        threading.Thread(target=self._compact_worker, name="history-compaction", daemon=True).start()
+
+    def compact(self, now=None):
+        """Merge day segments older than keep_days into their month segments."""
+        cutoff = (now or datetime.now()).date() - timedelta(days=self.keep_days)
+        by_month = {}
+        for name in self._list():
+            day = self._parse_name(name, ".jsonl", self.DAY_FMT)
+            if day is not None and day < cutoff:
+                by_month.setdefault(day.strftime(self.MONTH_FMT), []).append(os.path.join(self.directory, name))
+
+        for month, day_paths in by_month.items():
+            month_path = os.path.join(self.directory, f"{month}.jsonl.gz")
+            entries = list(self._read(month_path))
+            for path in sorted(day_paths):
+                entries.extend(self._read(path))
+            entries.sort(key=lambda e: e["t"])
+            tmp = month_path + ".tmp"
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp, month_path)
+            # Only drop the day files once the month segment is safely in place
+            for path in day_paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _compact_worker(self):
+        try:
+            self.compact()
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    # --- Segments ---
+    def _day_path(self, day):
+        return os.path.join(self.directory, day.strftime(self.DAY_FMT) + ".jsonl")
+
+    def _list(self):
+        try:
+            return os.listdir(self.directory)
+        except OSError:
+            return []
+
+    @staticmethod
+    def _parse_name(name, suffix, fmt):
+        if not name.endswith(suffix):
+            return None
+        try:
+            return datetime.strptime(name[:-len(suffix)], fmt).date()
+        except ValueError:
+            return None
+
+    def _segments_overlapping(self, start, end):
+        # Segment names are dates, so only files covering [start, end) are opened
+        first, last = start.date(), (end - timedelta(microseconds=1)).date()
+        months = set()
+        day = first.replace(day=1)
+        while day <= last:
+            months.add(day.strftime(self.MONTH_FMT))
+            day = (day + timedelta(days=32)).replace(day=1)
+        paths = []
+        for name in self._list():
+            d = self._parse_name(name, ".jsonl", self.DAY_FMT)
+            if d is not None and first <= d <= last:
+                paths.append(os.path.join(self.directory, name))
+            elif name.endswith(".jsonl.gz") and name[:-len(".jsonl.gz")] in months:
+                paths.append(os.path.join(self.directory, name))
+        return paths
+
+    @staticmethod
+    def _read(path):
+        opener = gzip.open if path.endswith(".gz") else open
+        try:
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # torn write at the end of a segment
+        except (OSError, EOFError):
+            return
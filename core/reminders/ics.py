@@ -0,0 +1,283 @@
+"""
+Streaming iCalendar (.ics) import and export for reminders.
+
+Files are read and written line by line: only the event being parsed is
+held in memory, so large calendars import with bounded memory. VEVENTs map
+to reminders (SUMMARY -> message, DTSTART plus an optional VALARM trigger ->
+due time, RRULE -> RecurrenceRule where the model can express it).
+
+Exported times carry the reminder's zone (DTSTART;TZID=<IANA name>, UNTIL
+in UTC), so a file imported on a machine in another zone keeps the same
+instants and repeats on the original wall clock.
+"""
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from . import zones
+from .recurrence import DAILY, MINUTELY, MONTHLY, MONTHLY_NTH, WEEKDAYS, WEEKLY, RecurrenceRule
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+
+PRODID = "-//Student Tools//Reminders//EN"
+UID_DOMAIN = "@student-tools"
+_WEEKDAY_CODES = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+_DURATION_RE = re.compile(r"^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+class IcsEvent:
+    """The parts of a VEVENT that reminders use."""
+    def __init__(self):
+        self.uid = None
+        self.summary = ""
+        self.dtstart = None
+        self.tzid = None          # IANA zone DTSTART was given in, if a known one
+        self.rrule = None
+        self.alarm_offset = None  # timedelta relative to DTSTART from the first VALARM
+
+    def remind_time(self):
+        return self.dtstart + self.alarm_offset if self.alarm_offset is not None else self.dtstart
+
+    def reminder_id(self):
+        """Stable reminder id, so importing the same file twice doesn't duplicate events."""
+        if not self.uid:
+            return uuid.uuid4().hex
+        if self.uid.endswith(UID_DOMAIN):
+            return self.uid[:-len(UID_DOMAIN)]
+        return uuid.uuid5(uuid.NAMESPACE_URL, self.uid).hex
+
+
+# --- Reading ---
+def _unfolded_lines(lines):
+    """Join RFC 5545 folded lines (continuations start with a space or tab)."""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _split_property(line):
+    """'DTSTART;TZID=Asia/Kuala_Lumpur:20250101T090000' -> (name, params, value)."""
+    head, _, value = line.partition(":")
+    name, *param_parts = head.split(";")
+    params = {}
+    for part in param_parts:
+        key, _, val = part.partition("=")
+        params[key.upper()] = val.strip('"')
+    return name.upper(), params, value
+
+
+def _unescape(text):
+    return (text.replace("\\n", "\n").replace("\\N", "\n")
+            .replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\"))
+
+
+def parse_datetime(value, params=None):
+    """Parse an iCalendar DATE or DATE-TIME into a naive local datetime."""
+    params = params or {}
+    value = value.strip()
+    if len(value) == 8 or params.get("VALUE") == "DATE":
+        return datetime.strptime(value[:8], "%Y%m%d")
+    if value.endswith("Z"):
+        utc = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+        return zones.get().to_wall(utc.timestamp())
+    dt = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    tzid = _zone_name(params)
+    if tzid:
+        return zones.get().to_wall(dt.replace(tzinfo=ZoneInfo(tzid)).timestamp())
+    return dt  # floating, or an unknown zone: local time
+
+
+def _zone_name(params):
+    """The TZID parameter if it names a zone zoneinfo knows, else None."""
+    tzid = params.get("TZID")
+    if not tzid or not ZoneInfo:
+        return None
+    try:
+        ZoneInfo(tzid)
+    except Exception:
+        return None
+    return tzid
+
+
+def parse_duration(value):
+    m = _DURATION_RE.match(value.strip())
+    if not m:
+        raise ValueError(f"Invalid duration: {value}")
+    sign, weeks, days, hours, minutes, seconds = m.groups()
+    delta = timedelta(weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+                      minutes=int(minutes or 0), seconds=int(seconds or 0))
+    return -delta if sign == "-" else delta
+
+
+def iter_events(lines):
+    """Yield an IcsEvent per VEVENT in an iterable of text lines (e.g. an open file)."""
+    event = None
+    in_alarm = False
+    for line in _unfolded_lines(lines):
+        if not line:
+            continue
+        name, params, value = _split_property(line)
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event, in_alarm = IcsEvent(), False
+        elif event is None:
+            continue
+        elif name == "BEGIN" and value.upper() == "VALARM":
+            in_alarm = True
+        elif name == "END" and value.upper() == "VALARM":
+            in_alarm = False
+        elif name == "END" and value.upper() == "VEVENT":
+            if event.dtstart is not None:
+                yield event
+            event = None
+        elif in_alarm:
+            if name == "TRIGGER" and event.alarm_offset is None and params.get("VALUE") != "DATE-TIME":
+                try:
+                    event.alarm_offset = parse_duration(value)
+                except ValueError:
+                    pass
+        elif name == "UID":
+            event.uid = value
+        elif name == "SUMMARY":
+            event.summary = _unescape(value)
+        elif name == "DTSTART":
+            try:
+                event.dtstart = parse_datetime(value, params)
+                event.tzid = _zone_name(params)
+            except ValueError:
+                event.dtstart = None
+        elif name == "RRULE":
+            event.rrule = value
+
+
+def rule_from_rrule(rrule, start, tz=None):
+    """
+    Map an RRULE value to a RecurrenceRule, or None if the model can't express
+    it. `start` is the first occurrence's wall time in `tz` (the DTSTART zone).
+    Raises ValueError for a malformed or non-positive INTERVAL or COUNT.
+    """
+    parts = dict(p.partition("=")[::2] for p in rrule.upper().split(";") if p)
+    freq = parts.get("FREQ")
+    interval = int(parts.get("INTERVAL", 1))
+    byday = parts.get("BYDAY", "")
+    count = int(parts["COUNT"]) if "COUNT" in parts else None
+    until = parse_datetime(parts["UNTIL"]) if "UNTIL" in parts else None
+
+    weekdays = {"MO", "TU", "WE", "TH", "FR"}
+    if freq == "MINUTELY":
+        kind = MINUTELY
+    elif freq == "HOURLY":
+        kind, interval = MINUTELY, interval * 60
+    elif freq in ("DAILY", "WEEKLY") and byday and set(byday.split(",")) == weekdays and interval == 1:
+        kind = WEEKDAYS
+    elif freq == "DAILY" and not byday:
+        kind = DAILY
+    elif freq == "WEEKLY" and byday in ("", _WEEKDAY_CODES[start.weekday()]):
+        kind = WEEKLY
+    elif freq == "MONTHLY" and not byday and parts.get("BYMONTHDAY", str(start.day)) == str(start.day):
+        kind = MONTHLY
+    elif freq == "MONTHLY" and re.fullmatch(r"(-1|[1-4])" + _WEEKDAY_CODES[start.weekday()], byday):
+        kind = MONTHLY_NTH
+    else:
+        return None
+    return RecurrenceRule(kind, interval, until=until, count=count, tz=tz)
+
+
+# --- Writing ---
+def _escape(text):
+    return (text.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _fold(line):
+    """Fold a content line to 75 octets as RFC 5545 requires."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+    out, chunk = [], b""
+    limit = 75
+    for ch in line:
+        enc = ch.encode("utf-8")
+        if len(chunk) + len(enc) > limit:
+            out.append(chunk.decode("utf-8"))
+            chunk, limit = b"", 74  # continuation lines start with a space
+        chunk += enc
+    out.append(chunk.decode("utf-8"))
+    return "\r\n ".join(out) + "\r\n"
+
+
+def _format_local(dt):
+    return dt.strftime("%Y%m%dT%H%M%S")
+
+
+def _format_utc(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def rrule_from_rule(rule, start):
+    """RRULE value for `rule`; `start` is the first occurrence's wall time in the rule's zone."""
+    if rule.freq == MINUTELY:
+        if rule.interval % 60 == 0:
+            parts = ["FREQ=HOURLY", f"INTERVAL={rule.interval // 60}"]
+        else:
+            parts = ["FREQ=MINUTELY", f"INTERVAL={rule.interval}"]
+    elif rule.freq == DAILY:
+        parts = ["FREQ=DAILY", f"INTERVAL={rule.interval}"]
+    elif rule.freq == WEEKDAYS:
+        parts = ["FREQ=WEEKLY", "BYDAY=MO,TU,WE,TH,FR"]
+    elif rule.freq == WEEKLY:
+        parts = ["FREQ=WEEKLY", f"INTERVAL={rule.interval}", f"BYDAY={_WEEKDAY_CODES[start.weekday()]}"]
+    elif rule.freq == MONTHLY:
+        parts = ["FREQ=MONTHLY", f"INTERVAL={rule.interval}", f"BYMONTHDAY={start.day}"]
+    else:
+        nth = (start.day - 1) // 7 + 1
+        nth = -1 if nth == 5 else nth
+        parts = ["FREQ=MONTHLY", f"INTERVAL={rule.interval}", f"BYDAY={nth}{_WEEKDAY_CODES[start.weekday()]}"]
+    if rule.count:
+        parts.append(f"COUNT={rule.count}")
+    if rule.until:
+        parts.append(f"UNTIL={_format_utc(zones.get().from_wall(rule.until))}")
+    return ";".join(parts)
+
+
+def write_calendar(f, reminders):
+    """Write reminders to a text file object as a VCALENDAR, one event at a time."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n" + _fold(f"PRODID:{PRODID}"))
+    count = 0
+    for r in reminders:
+        start_ts = zones.get().from_wall(r.start_time) if r.repeat else r.due_ts
+        tz = (r.rule.tz if r.rule else None) or r.tz
+        start = zones.get(tz).to_wall(start_ts) if tz else zones.get().to_wall(start_ts)
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{r.id}{UID_DOMAIN}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;TZID={tz}:{_format_local(start)}" if tz else f"DTSTART:{_format_utc(start_ts)}",
+            f"SUMMARY:{_escape(r.message)}",
+        ]
+        if r.rule:
+            lines.append(f"RRULE:{rrule_from_rule(r.rule, start)}")
+        lines += [
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            f"DESCRIPTION:{_escape(r.message)}",
+            "TRIGGER:PT0S",
+            "END:VALARM",
+            "END:VEVENT",
+        ]
+        f.write("".join(_fold(line) for line in lines))
+        count += 1
+    f.write("END:VCALENDAR\r\n")
+    return count
@@ -0,0 +1,61 @@
+import json
+import os
+import time
+
+
+class ReminderJournal:
+    """
+    Append-only log of small reminder changes (e.g. a snooze) kept next to
+    reminders.json, so they can be persisted without rewriting the whole
+    store. Entries are replayed over the saved items on load and the file is
+    cleared whenever the full store is written again. Each entry records when
+    it was logged, so entries a later save already includes (the process
+    died before the clear) are not replayed over it.
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def append(self, op, reminder_id, **fields):
+        entry = {"op": op, "id": reminder_id, **fields, "at": time.time()}
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+        except OSError:
+            pass
+
+    def entries(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # torn write at the end of the file
+        return entries
+
+    def replay(self, items, saved_at=None):
+        """
+        Apply logged changes to the saved item dicts (in place) and return
+        them, skipping entries logged before the items were saved at `saved_at`.
+        """
+        by_id = {item.get("id"): item for item in items}
+        for entry in self.entries():
+            item = by_id.get(entry.get("id"))
+            if item is None:
+                continue
+            if saved_at is not None and entry.get("at", saved_at) < saved_at:
+                continue  # written before the last full save, which holds it already
+            if entry["op"] == "snooze":
+                item["remind_time"] = entry["remind_time"]
+        return items
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,92 @@
+import uuid
+from datetime import timedelta
+
+from . import zones
+from .recurrence import MINUTELY, RecurrenceRule
+from .scheduler import default_scheduler
+
+
+class Reminder:
+    """
+    One reminder: its message, next due time and optional recurrence rule.
+    Scheduling is delegated to a ReminderScheduler, which calls
+    `callback(reminder, message)` from its worker thread when it fires.
+    """
+    def __init__(self, message, remind_time, repeat=False, interval_minutes=0, callback=None,
+                 reminder_id=None, rule=None, start=None, scheduler=None, tz=None):
+        self.id = reminder_id or uuid.uuid4().hex
+        self.message = message
+        self.tz = tz or zones.local_name()  # IANA zone the reminder was set in
+        self.remind_time = remind_time
+        self.interval = timedelta(minutes=interval_minutes)
+        # A plain "repeat every N minutes" is the simplest recurrence rule
+        if rule is None and repeat and interval_minutes > 0:
+            rule = RecurrenceRule(MINUTELY, interval_minutes)
+        if rule is not None and rule.tz is None:
+            rule.tz = self.tz  # repeat on the wall clock of the zone it was set in
+        self.rule = rule
+        self.repeat = rule is not None
+        self.start_time = start or remind_time  # first occurrence, anchors the rule
+        self._recurrence = rule.compile(self.start_time) if rule else None
+        if self._recurrence and start is None:
+            # A new rule may not match its start (e.g. weekdays starting on a Saturday)
+            self.remind_time = self._recurrence.next_after(remind_time - timedelta(microseconds=1)) or remind_time
+        self.callback = callback  # Function to call for UI updates
+        self.scheduler = scheduler if scheduler is not None else default_scheduler()
+        self.stopped = False
+        self.finished = False
+
+    @property
+    def remind_time(self):
+        """Next due time as a naive local datetime (what the UI shows and sorts by)."""
+        return self._remind_time
+
+    @remind_time.setter
+    def remind_time(self, value):
+        self._remind_time = value
+        # The scheduler orders by this UTC instant, converted once per change
+        self.due_ts = zones.get().from_wall(value)
+
+    def set_due(self, ts):
+        """Move the next occurrence to UTC epoch `ts` (exact where a wall time repeats)."""
+        self._remind_time = zones.get().to_wall(ts)
+        self.due_ts = ts
+
+    def start(self):
+        self.stopped = False
+        self.scheduler.schedule(self)
+
+    def stop(self):
+        self.stopped = True
+        self.scheduler.cancel(self.id)
+
+    def snooze(self, until):
+        """Move the pending occurrence to `until`, keeping this object and its id."""
+        self.remind_time = until
+        self.finished = False
+        self.start()
+
+    def advance(self):
+        """Move to the next occurrence; returns False once there are none left."""
+        nxt = self._recurrence.next_ts_after(self.due_ts) if self._recurrence else None
+        if nxt is None:
+            self.finished = True
+            return False
+        self.set_due(nxt)
+        return True
+
+    def catch_up(self, now):
+        """Skip occurrences already in the past; returns False if none remain."""
+        if self.remind_time > now:
+            return True
+        nxt = self._recurrence.next_after(now) if self._recurrence else None
+        if nxt is None:
+            return False
+        self.remind_time = nxt
+        return True
+
+    def display_text(self):
+        text = f"{self.remind_time.strftime('%Y-%m-%d %H:%M')} | {self.message}"
+        if self.repeat:
+            text += f" ({self.rule.describe(self.start_time)})"
+        return text
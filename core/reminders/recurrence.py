@@ -0,0 +1,238 @@
+import calendar
+from datetime import date, datetime, timedelta
+
+from . import zones
+
+
+MINUTELY = "minutely"
+DAILY = "daily"
+WEEKDAYS = "weekdays"
+WEEKLY = "weekly"
+MONTHLY = "monthly"            # same day of month as the start (clamped to month end)
+MONTHLY_NTH = "monthly_nth"    # same nth weekday of month as the start, e.g. 2nd Tuesday
+
+FREQUENCIES = (MINUTELY, DAILY, WEEKDAYS, WEEKLY, MONTHLY, MONTHLY_NTH)
+
+_WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+_ORDINALS = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th", -1: "last"}
+
+
+class RecurrenceRule:
+    """
+    Describes how a reminder repeats. The first occurrence (the reminder's
+    start) supplies the time of day, weekday and day of month; the rule adds
+    the frequency, step and optional end (`until` datetime or `count`).
+    """
+    def __init__(self, freq, interval=1, until=None, count=None, tz=None):
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unknown repeat frequency: {freq}")
+        if int(interval) <= 0:
+            raise ValueError("Repeat interval must be a positive number.")
+        if count is not None and int(count) <= 0:
+            raise ValueError("Repeat count must be a positive number.")
+        self.freq = freq
+        self.interval = int(interval)
+        self.until = until
+        self.count = int(count) if count is not None else None
+        self.tz = tz
+
+    def compile(self, start):
+        return CompiledRecurrence(self, start)
+
+    def describe(self, start):
+        n = self.interval
+        at = start.strftime("%H:%M")
+        if self.freq == MINUTELY:
+            text = f"every {n} min"
+        elif self.freq == DAILY:
+            text = f"daily at {at}" if n == 1 else f"every {n} days at {at}"
+        elif self.freq == WEEKDAYS:
+            text = f"weekdays at {at}"
+        elif self.freq == WEEKLY:
+            day = _WEEKDAY_NAMES[start.weekday()]
+            text = f"every {day}" if n == 1 else f"every {n} weeks on {day}"
+        elif self.freq == MONTHLY:
+            text = f"monthly on day {start.day}" if n == 1 else f"every {n} months on day {start.day}"
+        else:
+            nth = _ORDINALS[_nth_of_month(start)]
+            text = f"monthly on the {nth} {_WEEKDAY_NAMES[start.weekday()]}"
+        if self.count:
+            text += f", {self.count} times"
+        if self.until:
+            text += f", until {self.until.strftime('%Y-%m-%d')}"
+        return text
+
+    def to_dict(self):
+        return {
+            "freq": self.freq,
+            "interval": self.interval,
+            "until": self.until.isoformat() if self.until else None,
+            "count": self.count,
+            "tz": self.tz,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        until = data.get("until")
+        return cls(
+            data["freq"],
+            interval=data.get("interval", 1),
+            until=datetime.fromisoformat(until) if until else None,
+            count=data.get("count"),
+            tz=data.get("tz"),
+        )
+
+
+class CompiledRecurrence:
+    """
+    A rule bound to its first occurrence. The k-th occurrence is computed
+    arithmetically, so `next_after` is O(1) however far away `t` is and
+    nothing is ever expanded into a list.
+
+    Times passed in and returned are naive local datetimes, like the rest of
+    the reminder code. If the rule has a `tz`, wall-clock arithmetic happens
+    in that zone, so "daily at 08:00" stays at 08:00 across DST changes
+    there; conversions go through the cached transitions in `zones`.
+    """
+    def __init__(self, rule, start):
+        self.rule = rule
+        self.zone = zones.get(rule.tz) if rule.tz else None
+        self._local = zones.get()
+        self.start = start
+        # Start as wall time in the rule's zone. A start given in that zone is
+        # kept as asked even if a DST gap skips it that day; each occurrence
+        # resolves gaps and folds for its own date.
+        self._wall = start if self.zone is self._local else self._to_wall(start)
+        self._time = self._wall.time()
+        self._d0 = self._wall.date()
+        if rule.freq == WEEKDAYS:
+            # First business day on or after the start date
+            wd = self._d0.weekday()
+            self._d0 = self._d0 + timedelta(days=7 - wd) if wd >= 5 else self._d0
+        self._nth = _nth_of_month(self._wall)
+        self._weekday = self._wall.weekday()
+        self._start_ts = (self.zone or self._local).from_wall(self._wall)
+
+    # --- Public API ---
+    def occurrence(self, k):
+        """The k-th occurrence (0-based), ignoring count/until."""
+        rule = self.rule
+        if rule.freq == MINUTELY:
+            step = timedelta(minutes=rule.interval * k)
+            if self.zone is None:
+                return self.start + step
+            # Minutes step in absolute time, so a DST change doesn't stretch one interval
+            return self._local.to_wall(self._start_ts + step.total_seconds())
+
+        if rule.freq == DAILY:
+            day = self._d0 + timedelta(days=rule.interval * k)
+        elif rule.freq == WEEKLY:
+            day = self._d0 + timedelta(weeks=rule.interval * k)
+        elif rule.freq == WEEKDAYS:
+            weeks, rem = divmod(k, 5)
+            day = self._d0 + timedelta(weeks=weeks)
+            while rem:
+                day += timedelta(days=1)
+                if day.weekday() < 5:
+                    rem -= 1
+        else:
+            y, m = _add_months(self._d0.year, self._d0.month, rule.interval * k)
+            if rule.freq == MONTHLY:
+                day = date(y, m, min(self._d0.day, calendar.monthrange(y, m)[1]))
+            else:
+                day = _nth_weekday(y, m, self._weekday, self._nth)
+        return self._from_wall(datetime.combine(day, self._time))
+
+    def next_after(self, t):
+        """First occurrence strictly after `t`, or None when the rule has ended."""
+        k = max(0, self._estimate_index(t))
+        while self.occurrence(k) <= t:
+            k += 1
+        while k > 0 and self.occurrence(k - 1) > t:
+            k -= 1
+        if self.rule.count is not None and k >= self.rule.count:
+            return None
+        nxt = self.occurrence(k)
+        if self.rule.until is not None and nxt > self.rule.until:
+            return None
+        return nxt
+
+    def next_ts_after(self, ts):
+        """
+        `next_after` for UTC epoch seconds. Minute steps are counted from the
+        start instant, so the hour repeated when clocks go back is not
+        skipped (its naive local times compare equal to the first pass).
+        """
+        if self.rule.freq != MINUTELY:
+            nxt = self.next_after(self._local.to_wall(ts))
+            return None if nxt is None else self._local.from_wall(nxt)
+        step = self.rule.interval * 60
+        k = max(0, int((ts - self._start_ts) // step) + 1)
+        if self.rule.count is not None and k >= self.rule.count:
+            return None
+        nxt = self._start_ts + k * step
+        if self.rule.until is not None and nxt > self._local.from_wall(self.rule.until):
+            return None
+        return nxt
+
+    def __iter__(self):
+        t = self.start - timedelta(microseconds=1)
+        while True:
+            t = self.next_after(t)
+            if t is None:
+                return
+            yield t
+
+    # --- Helpers ---
+    def _estimate_index(self, t):
+        rule = self.rule
+        if rule.freq == MINUTELY:
+            return int((t - self.start).total_seconds() // (rule.interval * 60))
+        day = self._to_wall(t).date()
+        if rule.freq == DAILY:
+            return (day - self._d0).days // rule.interval
+        if rule.freq == WEEKLY:
+            return (day - self._d0).days // (7 * rule.interval)
+        if rule.freq == WEEKDAYS:
+            return _business_days_between(self._d0, day)
+        months = (day.year - self._d0.year) * 12 + (day.month - self._d0.month)
+        return months // rule.interval
+
+    def _to_wall(self, t):
+        if self.zone is None:
+            return t
+        return self.zone.to_wall(self._local.from_wall(t))
+
+    def _from_wall(self, wall):
+        if self.zone is None:
+            return wall
+        return self._local.to_wall(self.zone.from_wall(wall))
+
+
+def _nth_of_month(d):
+    """1..4 for the nth weekday of its month, -1 for a 5th (i.e. last) one."""
+    nth = (d.day - 1) // 7 + 1
+    return -1 if nth == 5 else nth
+
+
+def _nth_weekday(year, month, weekday, nth):
+    days_in_month = calendar.monthrange(year, month)[1]
+    if nth == -1:
+        last = date(year, month, days_in_month)
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (nth - 1))
+
+
+def _add_months(year, month, n):
+    y, m = divmod(month - 1 + n, 12)
+    return year + y, m + 1
+
+
+def _business_days_between(start, end):
+    """Number of Mon-Fri days in [start, end)."""
+    if end <= start:
+        return 0
+    weeks, rem = divmod((end - start).days, 7)
+    wd = start.weekday()
+    return weeks * 5 + sum(1 for i in range(rem) if (wd + i) % 7 < 5)
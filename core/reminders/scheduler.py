@@ -0,0 +1,141 @@
+import heapq
+import itertools
+import threading
+import time
+
+from diagnostics.tracing import span
+
+
+class ReminderScheduler:
+    """
+    Fires reminders from one background thread.
+
+    Only each reminder's next due time is kept in a heap; after a repeating
+    reminder fires it computes its following occurrence and is pushed again.
+    Cancelled or rescheduled entries are dropped lazily when they surface.
+
+    Due times are UTC epoch seconds (`reminder.due_ts`), so neither the local
+    timezone nor DST is consulted while waiting; the waits themselves run on
+    the monotonic clock.
+    """
+    MAX_WAIT = 1.0  # re-check the clock at least this often (sleep/resume, clock changes)
+
+    def __init__(self):
+        self._heap = []            # (due_ts, seq, key)
+        self._live = {}            # key -> (seq, reminder) of its current entry
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def schedule(self, reminder):
+        """Add a reminder, or move it to its current `remind_time`."""
+        with self._cond:
+            self._push(reminder)
+            self._ensure_thread()
+            self._cond.notify()
+
+    def schedule_many(self, reminders, replace=False):
+        """Add or move a batch under one lock (`replace` only matters to tiered schedulers)."""
+        with self._cond:
+            for reminder in reminders:
+                self._push(reminder)
+            self._ensure_thread()
+            self._cond.notify()
+
+    def cancel(self, reminder_id):
+        with self._cond:
+            self._live.pop(reminder_id, None)
+
+    def __len__(self):
+        return len(self._live)
+
+    def __contains__(self, reminder_id):
+        return reminder_id in self._live
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    # --- Worker ---
+    def _before_wait(self, now):
+        """Hook run by the worker (under the lock) each time it checks the clock."""
+
+    def _idle_timeout(self):
+        """How long the worker may sleep with an empty heap (None = until notified)."""
+        return None
+
+    def _reschedule_active(self, reminder):
+        # Checked under the lock so a concurrent stop() can't be undone
+        with self._cond:
+            if not reminder.stopped:
+                self._push(reminder)
+
+    def _key(self, reminder):
+        """What `cancel` and `in` identify a reminder by (its id here)."""
+        return reminder.id
+
+    def _push(self, reminder):
+        seq = next(self._seq)
+        key = self._key(reminder)
+        self._live[key] = (seq, reminder)
+        heapq.heappush(self._heap, (reminder.due_ts, seq, key))
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _pop_due(self):
+        """Block until a live entry is due; return its reminder or None on shutdown."""
+        with self._cond:
+            while not self._closed:
+                self._before_wait(time.time())
+
+                # Drop stale heads (cancelled or superseded entries)
+                while self._heap:
+                    due, seq, key = self._heap[0]
+                    entry = self._live.get(key)
+                    if entry is not None and entry[0] == seq:
+                        break
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._cond.wait(self._idle_timeout())
+                    continue
+                wait = self._heap[0][0] - time.time()
+                if wait > 0:
+                    self._cond.wait(min(wait, self.MAX_WAIT))
+                    continue
+
+                _, seq, key = heapq.heappop(self._heap)
+                return self._live.pop(key)[1]
+            return None
+
+    def _run(self):
+        while True:
+            reminder = self._pop_due()
+            if reminder is None:
+                return
+            # Advance first so the callback sees the next due time
+            message = reminder.message
+            if reminder.advance():
+                self._reschedule_active(reminder)
+            if reminder.callback:
+                try:
+                    with span("reminder.fire", cat="reminder", id=reminder.id):
+                        reminder.callback(reminder, message)
+                except Exception:
+                    pass
+
+
+_default_scheduler = None
+
+
+def default_scheduler():
+    """Process-wide scheduler for reminders created without one."""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = ReminderScheduler()
+    return _default_scheduler
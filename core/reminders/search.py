@@ -0,0 +1,166 @@
+import bisect
+import heapq
+import itertools
+import re
+from datetime import datetime, timedelta
+
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_NEXT_RE = re.compile(r"\bnext\s+(\d+)\s+(hour|day|week)s?\b")
+_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_EMPTY = frozenset()
+
+# Costs in steps of the due-order walk, measured with CPython 3.11
+_INTERSECT_COST = 0.2   # per posting, set intersection or union in C
+_ORDER_COST = 4.0       # per match, key lookup and heap or range check
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def parse_query(query, now=None):
+    """
+    Split a search string into (words, start, end).
+
+    Understands "today", "tomorrow", "this week", "next week",
+    "next N hours/days/weeks" and a yyyy-mm-dd date; everything else is a
+    word to match. start/end are None when no range was given.
+    """
+    now = now or datetime.now()
+    text = query.lower()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    start = end = None
+
+    m = _NEXT_RE.search(text)
+    if m:
+        n, unit = int(m.group(1)), m.group(2)
+        start, end = now, now + timedelta(**{unit + "s": n})
+        text = text[:m.start()] + text[m.end():]
+    elif "this week" in text:
+        start = today - timedelta(days=today.weekday())
+        end = start + timedelta(weeks=1)
+        text = text.replace("this week", " ")
+    elif "next week" in text:
+        start = today - timedelta(days=today.weekday()) + timedelta(weeks=1)
+        end = start + timedelta(weeks=1)
+        text = text.replace("next week", " ")
+    elif re.search(r"\btomorrow\b", text):
+        start, end = today + timedelta(days=1), today + timedelta(days=2)
+        text = re.sub(r"\btomorrow\b", " ", text)
+    elif re.search(r"\btoday\b", text):
+        start, end = today, today + timedelta(days=1)
+        text = re.sub(r"\btoday\b", " ", text)
+    else:
+        m = _DATE_RE.search(text)
+        if m:
+            try:
+                start = datetime.strptime(m.group(1), "%Y-%m-%d")
+                end = start + timedelta(days=1)
+                text = text[:m.start()] + text[m.end():]
+            except ValueError:
+                pass
+
+    return tokenize(text), start, end
+
+
+class ReminderIndex:
+    """
+    Inverted token index over reminder messages, used together with the
+    due-time order of a ReminderStore. Updated per add/remove; never rebuilt.
+
+    Every word in a query must match; the last word also matches as a prefix
+    so results narrow while typing.
+    """
+    def __init__(self, store):
+        self.store = store
+        self._postings = {}   # token -> set of reminder ids
+        self._tokens_of = {}  # reminder id -> tokens of its message
+        self._vocab = []      # sorted tokens, for prefix lookups
+
+    def add(self, reminder):
+        if reminder.id in self._tokens_of:
+            self.remove(reminder.id)
+        tokens = frozenset(tokenize(reminder.message))
+        self._tokens_of[reminder.id] = tokens
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                bisect.insort(self._vocab, token)
+            ids.add(reminder.id)
+
+    def add_many(self, reminders):
+        for reminder in reminders:
+            self.add(reminder)
+
+    def remove(self, reminder_id):
+        for token in self._tokens_of.pop(reminder_id, ()):
+            ids = self._postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(reminder_id)
+            if not ids:
+                del self._postings[token]
+                i = bisect.bisect_left(self._vocab, token)
+                if i < len(self._vocab) and self._vocab[i] == token:
+                    del self._vocab[i]
+
+    def search(self, query, limit=500, now=None):
+        """Reminders matching `query`, in due order (at most `limit`)."""
+        words, start, end = parse_query(query, now)
+        lo, hi = (0, len(self.store)) if start is None else self.store.span(start, end)
+
+        if not words:
+            return [self.store.get(rid) for rid in self.store.iter_ids(lo, min(hi, lo + limit))]
+
+        prefix = words[-1]
+        sets = [self._postings.get(w, _EMPTY) for w in words[:-1]]
+        prefix_sets = self._prefix_sets(prefix)
+        total = max(1, len(self.store))
+        sizes = [len(ids) for ids in sets] + [min(total, sum(map(len, prefix_sets)))]
+        if not min(sizes):
+            return []
+
+        # Estimate the share of reminders that match, assuming words are
+        # independent, then compare the cost of the two plans in walk steps:
+        # the walk visits reminders in due order until the page is full; the
+        # other plan intersects the postings and orders every match by due time.
+        density = 1.0
+        for size in sizes:
+            density *= size / total
+        walk_cost = min(hi - lo, limit / density)
+        sort_cost = _INTERSECT_COST * sum(sizes) + _ORDER_COST * density * total
+
+        if walk_cost <= sort_cost:
+            # Common words: filter the due order and stop once the page is full
+            found = self.store.iter_ids(lo, hi)
+            for ids in sorted(sets, key=len):
+                found = filter(ids.__contains__, found)
+            if len(prefix_sets) == 1:
+                found = filter(prefix_sets[0].__contains__, found)
+            else:
+                tokens_of = self._tokens_of
+                found = (rid for rid in found if any(t.startswith(prefix) for t in tokens_of[rid]))
+            matched = list(itertools.islice(found, limit))
+        else:
+            # Rare words: intersect them and order just the matches by due time
+            sets.append(prefix_sets[0] if len(prefix_sets) == 1 else set().union(*prefix_sets))
+            sets.sort(key=len)
+            key = self.store.key_of
+            ids = sets[0].intersection(*sets[1:])
+            if start is not None:
+                ids = [rid for rid in ids if start <= key(rid)[0] < end]
+            matched = heapq.nsmallest(limit, ids, key=key)
+        return [self.store.get(rid) for rid in matched]
+
+    def _prefix_sets(self, prefix):
+        """Postings of every indexed word that is `prefix` or starts with it."""
+        sets = []
+        if prefix in self._postings:
+            sets.append(self._postings[prefix])
+        i = bisect.bisect_right(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            sets.append(self._postings[self._vocab[i]])
+            i += 1
+        return sets
@@ -0,0 +1,168 @@
+import functools
+import os
+from datetime import datetime
+
+from . import ics, zones
+from .history import HistoryArchive
+from .models import Reminder
+from .search import ReminderIndex
+from .storage import ReminderStorage
+from .store import ReminderStore
+from .tiers import TieredScheduler
+
+
+class ReminderService:
+    """
+    Everything the reminder page does except drawing it: the sorted store,
+    search index, tiered scheduler, persistence and history archive, all kept
+    in `directory`. `callback(reminder, message)` runs on the scheduler
+    thread when a reminder fires; a GUI hands it on to its own thread.
+    Pass `scheduler` to share one scheduler between several services, and
+    `io(key, write)` to run file writes elsewhere (a GUI's worker pool); `key`
+    is the file or folder written, so writes to it can be kept in order.
+    By default writes run inline.
+    """
+    def __init__(self, directory, callback=None, scheduler=None, io=None):
+        self.directory = directory
+        self.callback = callback
+        self.io = io
+        os.makedirs(directory, exist_ok=True)
+        self.storage = ReminderStorage(os.path.join(directory, "reminders.json"))
+        self.store = ReminderStore()   # Reminder instances sorted by next due time
+        # One thread fires every reminder; only the next hour is kept in memory
+        if scheduler is None:
+            scheduler = TieredScheduler(
+                os.path.join(directory, "reminders_schedule.db"),
+                resolve=self.store.get,
+            )
+        self.scheduler = scheduler
+        self.search_index = ReminderIndex(self.store)
+        # Fired and dismissed reminders are archived here instead of in reminders.json
+        self.history = HistoryArchive(os.path.join(directory, "history"))
+
+    # --- Creating and removing ---
+    def new(self, message, remind_time, repeat=False, interval_minutes=0, rule=None,
+            reminder_id=None, start=None, tz=None):
+        """A Reminder wired to this service's callback and scheduler (not yet added)."""
+        return Reminder(
+            message, remind_time, repeat, interval_minutes, self.callback,
+            reminder_id=reminder_id, rule=rule, start=start, scheduler=self.scheduler, tz=tz,
+        )
+
+    def add(self, reminder):
+        reminder.start()
+        self.store.add(reminder)
+        self.search_index.add(reminder)
+        return reminder
+
+    def add_many(self, reminders):
+        """Insert a batch into the store, search index and scheduler (callers save)."""
+        self.store.add_many(reminders)
+        self.search_index.add_many(reminders)
+        self.scheduler.schedule_many(reminders)
+
+    def remove_many(self, reminders):
+        """Stop and drop reminders; returns the ids that were actually removed."""
+        removed = []
+        for reminder in reminders:
+            reminder.stop()
+            if self.store.remove(reminder.id) is not None:
+                self.search_index.remove(reminder.id)
+                removed.append(reminder.id)
+        return removed
+
+    def get(self, reminder_id):
+        return self.store.get(reminder_id)
+
+    # --- Lifecycle events ---
+    def fired(self, reminder):
+        """Record a firing; returns True if a repeating reminder moved in the list."""
+        moved = False
+        if reminder.repeat and reminder.id in self.store:
+            self.store.refresh(reminder.id)
+            moved = True
+        self._archive("fired", [reminder])
+        return moved
+
+    def dismissed(self, reminders):
+        self._archive("dismissed", reminders)
+
+    def snooze(self, reminders, until):
+        """Re-key the reminders to `until`; only the change is appended to disk."""
+        for reminder in reminders:
+            if reminder.id not in self.store:
+                continue
+            reminder.snooze(until)
+            self.store.refresh(reminder.id)
+            self._write(self.storage.path, self.storage.snooze_writer(reminder))
+
+    # --- Queries ---
+    def search(self, query, limit=1000):
+        return self.search_index.search(query, limit=limit)
+
+    # --- Persistence ---
+    def save(self):
+        self.storage.save(self.store)
+
+    def dump(self):
+        """A copy of the store as saved items; `storage.write` it from any thread."""
+        return self.storage.dump(self.store)
+
+    def load(self, now=None):
+        return self.restore(self.read(now))
+
+    def read(self, now=None):
+        """Read and parse the saved reminders without touching the store (safe off the GUI thread)."""
+        return self.storage.load(self.callback, self.scheduler, now)
+
+    def restore(self, loaded):
+        """Add reminders from `read` to the store, search index and scheduler."""
+        self.store.add_many(loaded)
+        self.search_index.add_many(loaded)
+        self.scheduler.schedule_many(loaded, replace=True)
+        return loaded
+
+    # --- Import / export ---
+    def from_event(self, event, now=None):
+        """A Reminder for an iCalendar event, or None if it is past or already present."""
+        reminder_id = event.reminder_id()
+        if reminder_id in self.store:
+            return None
+        rule = None
+        if event.rrule:
+            # The rule repeats on the wall clock of the zone DTSTART was given in
+            wall = event.dtstart
+            if event.tzid:
+                wall = zones.get(event.tzid).to_wall(zones.get().from_wall(event.dtstart))
+            rule = ics.rule_from_rrule(event.rrule, wall, tz=event.tzid)
+        # The alarm offset applies to every occurrence, so the anchor is shifted too
+        start = event.remind_time()
+        reminder = self.new(event.summary, start, rule=rule, reminder_id=reminder_id,
+                            start=start if rule is not None else None, tz=event.tzid)
+        return reminder if reminder.catch_up(now or datetime.now()) else None
+
+    def from_entries(self, entries, now=None):
+        """Reminders for parsed bulk entries, skipping any that are already over."""
+        now = now or datetime.now()
+        batch = []
+        for e in entries:
+            reminder = self.new(e.message, e.remind_time, rule=e.rule)
+            # A repeating reminder that started in the past begins at its next occurrence
+            if reminder.catch_up(now):
+                batch.append(reminder)
+        return batch
+
+    def export_ics(self, f):
+        return ics.write_calendar(f, self.store)
+
+    # --- Internals ---
+    def _write(self, key, write):
+        if self.io is None:
+            write()
+        else:
+            self.io(key, write)
+
+    def _archive(self, event, reminders):
+        # Timestamped now rather than whenever the write runs
+        write = functools.partial(self.history.append_many, event, list(reminders), datetime.now())
+        self._write(self.history.directory, write)
@@ -0,0 +1,105 @@
+import functools
+import json
+import os
+from datetime import datetime
+
+from . import zones
+from .journal import ReminderJournal
+from .models import Reminder
+from .recurrence import RecurrenceRule
+
+
+class ReminderStorage:
+    """
+    reminders.json plus its journal of small changes. Times are written in
+    UTC with the reminder's IANA zone; files with naive local times from
+    older versions still load.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.journal = ReminderJournal(os.path.splitext(path)[0] + ".journal")
+
+    @staticmethod
+    def to_item(r):
+        return {
+            "id": r.id,
+            "message": r.message,
+            "remind_time": zones.utc_iso(r.due_ts),
+            "tz": r.tz,
+            "repeat": r.repeat,
+            "interval_minutes": int(r.interval.total_seconds() // 60) if r.repeat else 0,
+            "rule": r.rule.to_dict() if r.rule else None,
+            "start": zones.to_utc_iso(r.start_time),
+        }
+
+    @staticmethod
+    def from_item(item, callback=None, scheduler=None):
+        rule = RecurrenceRule.from_dict(item["rule"]) if item.get("rule") else None
+        reminder = Reminder(
+            item.get("message", ""),
+            # Times are saved in UTC; older files hold naive local times
+            zones.parse_stored(item.get("remind_time")),
+            bool(item.get("repeat", False)),
+            int(item.get("interval_minutes", 0)),
+            callback,
+            reminder_id=item.get("id"),
+            rule=rule,
+            start=zones.parse_stored(item["start"]) if item.get("start") else None,
+            scheduler=scheduler,
+            tz=item.get("tz"),
+        )
+        due = zones.stored_ts(item.get("remind_time"))
+        if due is not None:
+            reminder.set_due(due)   # the naive local time can't tell a repeated hour apart
+        return reminder
+
+    def save(self, reminders):
+        self.write(self.dump(reminders))
+
+    def dump(self, reminders):
+        """The items `save` writes, so they can be written later or on another thread."""
+        return [self.to_item(r) for r in reminders]
+
+    def write(self, data):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+        # The full store now includes everything the journal recorded
+        self.journal.clear()
+
+    def load(self, callback=None, scheduler=None, now=None):
+        """Reminders that are still pending, with repeats moved to their next occurrence."""
+        try:
+            if not os.path.exists(self.path):
+                return []
+            saved_at = os.path.getmtime(self.path)
+            with open(self.path, "r", encoding="utf-8") as f:
+                items = self.journal.replay(json.load(f), saved_at)
+        except Exception:
+            return []
+
+        now = now or datetime.now()
+        loaded = []
+        for item in items:
+            try:
+                reminder = self.from_item(item, callback, scheduler)
+                # Skip past non-repeating reminders; move repeating ones to their next occurrence
+                if reminder.catch_up(now):
+                    loaded.append(reminder)
+            except Exception:
+                continue
+        return loaded
+
+    def log_snooze(self, reminder):
+        """Persist a snooze without rewriting the whole file."""
+        self.snooze_writer(reminder)()
+
+    def snooze_writer(self, reminder):
+        """`log_snooze` as a callable that no longer reads `reminder` (for running it elsewhere)."""
+        return functools.partial(
+            self.journal.append, "snooze", reminder.id, remind_time=zones.utc_iso(reminder.due_ts),
+        )
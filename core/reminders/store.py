@@ -0,0 +1,135 @@
+import bisect
+
+
+class ReminderStore:
+    """
+    Holds reminders sorted by next due time and addressable by id.
+
+    The sort key of each reminder is remembered separately, so a reminder whose
+    `remind_time` moved on (e.g. a repeat fired) can be found and re-keyed.
+    """
+    def __init__(self):
+        self._keys = []    # sorted (remind_time, id)
+        self._key_of = {}  # id -> key currently in _keys
+        self._by_id = {}   # id -> Reminder
+        self._day_counts = {}     # date -> number of reminders next due that day
+        self._dirty_days = set()  # days whose count changed since take_dirty_days()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        """Reminders in due order."""
+        return (self._by_id[rid] for _, rid in self._keys)
+
+    def __getitem__(self, index):
+        """Reminder at a position in due order (supports slices)."""
+        if isinstance(index, slice):
+            return [self._by_id[rid] for _, rid in self._keys[index]]
+        return self._by_id[self._keys[index][1]]
+
+    def __contains__(self, reminder_id):
+        return reminder_id in self._by_id
+
+    def get(self, reminder_id):
+        return self._by_id.get(reminder_id)
+
+    def add(self, reminder):
+        if reminder.id in self._by_id:
+            self.remove(reminder.id)
+        key = (reminder.remind_time, reminder.id)
+        bisect.insort(self._keys, key)
+        self._key_of[reminder.id] = key
+        self._by_id[reminder.id] = reminder
+        self._count_day(key[0], 1)
+
+    def add_many(self, reminders):
+        """Insert a batch with one sort instead of one insort per reminder."""
+        batch = {r.id: r for r in reminders}
+        if len(batch) < 16:
+            for reminder in batch.values():
+                self.add(reminder)
+            return
+        for reminder_id in batch:
+            if reminder_id in self._by_id:
+                self._discard_key(reminder_id)
+        for reminder_id, reminder in batch.items():
+            key = (reminder.remind_time, reminder_id)
+            self._keys.append(key)
+            self._key_of[reminder_id] = key
+            self._by_id[reminder_id] = reminder
+            self._count_day(key[0], 1)
+        self._keys.sort()
+
+    def remove(self, reminder_id):
+        """Remove and return a reminder, or None if the id is unknown."""
+        reminder = self._by_id.pop(reminder_id, None)
+        if reminder is not None:
+            self._discard_key(reminder_id)
+        return reminder
+
+    def refresh(self, reminder_id):
+        """Re-key a reminder after its remind_time changed."""
+        reminder = self._by_id.get(reminder_id)
+        if reminder is None or self._key_of[reminder_id][0] == reminder.remind_time:
+            return
+        self._discard_key(reminder_id)
+        key = (reminder.remind_time, reminder_id)
+        bisect.insort(self._keys, key)
+        self._key_of[reminder_id] = key
+        self._count_day(key[0], 1)
+
+    def index_of(self, reminder_id):
+        """Position of a reminder in due order, or -1."""
+        key = self._key_of.get(reminder_id)
+        if key is None:
+            return -1
+        return bisect.bisect_left(self._keys, key)
+
+    def key_of(self, reminder_id):
+        """Sort key (remind_time, id) of a stored reminder."""
+        return self._key_of[reminder_id]
+
+    def span(self, start, end):
+        """Index range (lo, hi) of the reminders due in [start, end)."""
+        return bisect.bisect_left(self._keys, (start,)), bisect.bisect_left(self._keys, (end,))
+
+    def between(self, start, end):
+        """Reminders due in [start, end), in due order."""
+        lo, hi = self.span(start, end)
+        return [self._by_id[rid] for _, rid in self._keys[lo:hi]]
+
+    def iter_ids(self, lo=0, hi=None):
+        """Ids from position lo up to hi in due order, without copying."""
+        keys = self._keys
+        hi = len(keys) if hi is None else min(hi, len(keys))
+        for i in range(lo, hi):
+            yield keys[i][1]
+
+    def day_count(self, day):
+        """Number of reminders whose next occurrence falls on `day` (a date)."""
+        return self._day_counts.get(day, 0)
+
+    def day_counts(self):
+        return dict(self._day_counts)
+
+    def take_dirty_days(self):
+        """Days whose count changed since the last call, for incremental UI updates."""
+        days, self._dirty_days = self._dirty_days, set()
+        return days
+
+    def _count_day(self, when, delta):
+        day = when.date()
+        count = self._day_counts.get(day, 0) + delta
+        if count:
+            self._day_counts[day] = count
+        else:
+            del self._day_counts[day]
+        self._dirty_days.add(day)
+
+    def _discard_key(self, reminder_id):
+        key = self._key_of.pop(reminder_id)
+        self._count_day(key[0], -1)
+        idx = bisect.bisect_left(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            del self._keys[idx]
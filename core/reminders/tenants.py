@@ -0,0 +1,292 @@
+"""
+Reminders for many users in one process.
+
+Each user is a partition: a ReminderService over its own folder
+(`<directory>/<user id>/`), loaded on first use. All partitions share one
+TenantScheduler thread, which only holds reminders due within `horizon`.
+A periodic sweep promotes reminders as the horizon moves forward, loads
+users whose next reminder is coming up, and unloads users that have been
+idle for `idle_after` seconds and have nothing due soon. An unloaded user
+costs one row in a sqlite wake index, so memory follows active users
+rather than all users.
+"""
+import contextlib
+import functools
+import os
+import re
+import threading
+import time
+import weakref
+from datetime import timedelta
+
+from .scheduler import ReminderScheduler
+from .services import ReminderService
+from .storage import ReminderStorage
+from .tiers import ColdIndex
+
+_USER_RE = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+class TenantScheduler(ReminderScheduler):
+    """
+    One scheduler thread for every user. Entries are keyed by (user id,
+    reminder id), so ids only have to be unique per user, and reminders
+    due after `horizon` are left in their partition instead of the heap.
+    """
+    def __init__(self, horizon=timedelta(hours=1)):
+        super().__init__()
+        self.horizon = horizon
+
+    def _key(self, reminder):
+        return (reminder.scheduler.user_id, reminder.id)
+
+    def _push(self, reminder):
+        if reminder.due_ts > time.time() + self.horizon.total_seconds():
+            self._live.pop(self._key(reminder), None)  # the sweep promotes it later
+        else:
+            super()._push(reminder)
+
+
+class UserScheduler:
+    """A user's view of the shared TenantScheduler, used as their reminders' `scheduler`."""
+    __slots__ = ("shared", "user_id")
+
+    def __init__(self, shared, user_id):
+        self.shared = shared
+        self.user_id = user_id
+
+    def schedule(self, reminder):
+        self.shared.schedule(reminder)
+
+    def schedule_many(self, reminders, replace=False):
+        self.shared.schedule_many(reminders)
+
+    def cancel(self, reminder_id):
+        self.shared.cancel((self.user_id, reminder_id))
+
+    def __contains__(self, reminder_id):
+        return (self.user_id, reminder_id) in self.shared
+
+    def shutdown(self):
+        pass  # the shared thread belongs to the TenantReminderService
+
+
+class TenantReminderService:
+    """
+    Partitions of ReminderService per user over one shared scheduler.
+
+    Use `with service.user(user_id) as reminders:` to work with a user's
+    ReminderService; that user's lock is held inside the block, so callers
+    on different threads (API handlers, the scheduler, the sweep) don't race
+    on one user and don't wait for each other across users. Loading, saving
+    and history writes happen under the user's lock only; the service lock
+    covers the partition table and the wake index.
+    `on_fire(user_id, reminder, message)` runs on the scheduler thread after
+    the firing has been recorded in the user's store and history.
+    """
+    def __init__(self, directory, on_fire=None, horizon=timedelta(hours=1), idle_after=600,
+                 sweep_interval=30):
+        self.directory = directory
+        self.on_fire = on_fire
+        self.idle_after = idle_after
+        self.sweep_interval = sweep_interval
+        self.scheduler = TenantScheduler(horizon)
+        os.makedirs(directory, exist_ok=True)
+        self.wake = ColdIndex(os.path.join(directory, "wake.db"))   # unloaded user -> next due
+        # Loaded users have no wake row until they are unloaded, and the index
+        # isn't synced, so it is only trusted after a clean close
+        self._open_marker = os.path.join(directory, "wake.open")
+        unclean = os.path.exists(self._open_marker)
+        _touch_synced(self._open_marker)
+        self._users = {}       # user id -> ReminderService
+        self._last_used = {}   # user id -> time.monotonic() of the last `user()` call
+        self._user_locks = weakref.WeakValueDictionary()   # user id -> RLock, while anyone holds it
+        self._lock = threading.RLock()   # guards the dicts above and the wake index; never held for file I/O
+        self._stop = threading.Event()
+        self._sweeper = None
+        if unclean or not len(self.wake):
+            self.rebuild_wake_index()
+
+    # --- Access ---
+    @contextlib.contextmanager
+    def user(self, user_id):
+        """Lock the user and yield their ReminderService, loading it if needed."""
+        with self._user_lock(user_id):
+            partition = self._partition(user_id)
+            with self._lock:
+                self._last_used[user_id] = time.monotonic()
+            yield partition
+
+    def loaded_users(self):
+        with self._lock:
+            return list(self._users)
+
+    def is_loaded(self, user_id):
+        return user_id in self._users
+
+    # --- Lifecycle ---
+    def start(self):
+        """Run `sweep` every `sweep_interval` seconds on a background thread."""
+        if self._sweeper is None:
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="reminder-sweep", daemon=True)
+            self._sweeper.start()
+
+    def close(self):
+        """Stop the sweep, save and unload every user, and stop the scheduler."""
+        self._stop.set()
+        for user_id in self.loaded_users():
+            with self._user_lock(user_id):
+                self._unload(user_id)
+        self.scheduler.shutdown()
+        self.wake.close()
+        try:
+            os.remove(self._open_marker)
+        except OSError:
+            pass
+
+    def sweep(self, now=None):
+        """
+        Wake users with reminders due within the horizon, promote loaded
+        users' reminders into it and unload idle users. Returns
+        (woken, unloaded) user counts.
+        """
+        now = now or time.time()
+        limit = now + self.scheduler.horizon.total_seconds()
+        idle_before = time.monotonic() - self.idle_after
+        due = []
+        with self._lock:
+            while True:
+                batch = self.wake.take_due(limit, 500)
+                due += batch
+                if len(batch) < 500:
+                    break
+
+        # One user at a time, so requests for other users go on meanwhile
+        woken = 0
+        for user_id in due:
+            with self._user_lock(user_id):
+                if not self.is_loaded(user_id):
+                    self._partition(user_id)
+                    woken += 1
+
+        unloaded = 0
+        for user_id in self.loaded_users():
+            with self._user_lock(user_id):
+                partition = self._users.get(user_id)
+                if partition is None:
+                    continue
+                self._promote(partition, limit)
+                if self._last_used.get(user_id, 0) < idle_before and not self._due_soon(partition, limit):
+                    self._unload(user_id)
+                    unloaded += 1
+        return woken, unloaded
+
+    def rebuild_wake_index(self):
+        """
+        Rebuild the wake index from every partition's next due time, after
+        an unclean shutdown or for data written without an index.
+        """
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        entries = []
+        for name in names:
+            path = os.path.join(self.directory, name, "reminders.json")
+            if not _USER_RE.match(name) or not os.path.exists(path):
+                continue
+            scheduler = UserScheduler(self.scheduler, name)
+            due = [r.due_ts for r in ReminderStorage(path).load(scheduler=scheduler)]
+            if due:
+                entries.append((name, min(due)))
+        with self._lock:
+            self.wake.clear()
+            self.wake.put_many([e for e in entries if e[0] not in self._users])
+
+    # --- Internals ---
+    # Lock order: a user's lock, then the service lock, then the scheduler's.
+    def _user_lock(self, user_id):
+        with self._lock:
+            lock = self._user_locks.get(user_id)
+            if lock is None:
+                lock = self._user_locks[user_id] = threading.RLock()
+            return lock
+
+    def _partition(self, user_id):
+        """The user's ReminderService, loaded from disk if needed (user's lock held)."""
+        partition = self._users.get(user_id)
+        if partition is None:
+            if not _USER_RE.match(user_id):
+                raise ValueError("user id may only use letters, digits, '.', '_' and '-'")
+            partition = ReminderService(
+                os.path.join(self.directory, user_id),
+                callback=functools.partial(self._fired, user_id),
+                scheduler=UserScheduler(self.scheduler, user_id),
+            )
+            partition.load()
+            with self._lock:
+                self.wake.delete(user_id)   # loaded users are covered by the sweep instead
+                self._users[user_id] = partition
+                self._last_used.setdefault(user_id, 0)
+        return partition
+
+    def _unload(self, user_id):
+        """Save the user and swap their partition for a wake row (user's lock held)."""
+        partition = self._users.get(user_id)
+        if partition is None:
+            return
+        try:
+            partition.save()
+        except OSError:
+            pass
+        nxt = None
+        for reminder in partition.store:
+            self.scheduler.cancel((user_id, reminder.id))
+            if reminder.stopped or reminder.finished:
+                continue   # nothing left to wake the user for
+            if nxt is None or reminder.due_ts < nxt:
+                nxt = reminder.due_ts
+        with self._lock:
+            del self._users[user_id]
+            self._last_used.pop(user_id, None)
+            if nxt is not None:
+                self.wake.put_many([(user_id, nxt)])
+
+    @staticmethod
+    def _head(partition, limit):
+        """Pending reminders due by `limit` (finished one-offs wait in the store to be removed)."""
+        for reminder in partition.store:   # due order, so stop at the horizon
+            if reminder.due_ts > limit:
+                break
+            if not reminder.stopped and not reminder.finished:
+                yield reminder
+
+    def _promote(self, partition, limit):
+        head = [r for r in self._head(partition, limit) if r.id not in partition.scheduler]
+        if head:
+            self.scheduler.schedule_many(head)
+
+    def _due_soon(self, partition, limit):
+        return next(self._head(partition, limit), None) is not None
+
+    def _fired(self, user_id, reminder, message):
+        with self._user_lock(user_id):
+            partition = self._users.get(user_id)
+            if partition is not None:
+                partition.fired(reminder)
+                self._promote(partition, time.time() + self.scheduler.horizon.total_seconds())
+        if self.on_fire is not None:
+            self.on_fire(user_id, reminder, message)
+
+    def _sweep_loop(self):
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except Exception:
+                pass
+
+
+def _touch_synced(path):
+    with open(path, "w") as f:
+        f.flush()
+        os.fsync(f.fileno())
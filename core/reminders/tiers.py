@@ -0,0 +1,123 @@
+import sqlite3
+import time
+from datetime import timedelta
+
+from .scheduler import ReminderScheduler
+
+
+class ColdIndex:
+    """
+    On-disk index of (reminder id, due UTC epoch) sorted by due time, backed
+    by sqlite. Callers serialize access (the scheduler's lock does this).
+    """
+    def __init__(self, path):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # Rebuilt from reminders.json at startup, so it doesn't need to survive a crash
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("PRAGMA journal_mode = MEMORY")
+        self._db.execute("CREATE TABLE IF NOT EXISTS cold (id TEXT PRIMARY KEY, due REAL NOT NULL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS cold_due ON cold (due)")
+        self._db.commit()
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM cold").fetchone()[0]
+
+    def put_many(self, entries):
+        """Insert or move (reminder_id, due) pairs in one transaction."""
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO cold (id, due) VALUES (?, ?)", entries)
+
+    def delete(self, reminder_id):
+        with self._db:
+            self._db.execute("DELETE FROM cold WHERE id = ?", (reminder_id,))
+
+    def clear(self):
+        with self._db:
+            self._db.execute("DELETE FROM cold")
+
+    def next_due(self):
+        return self._db.execute("SELECT MIN(due) FROM cold").fetchone()[0]
+
+    def take_due(self, before, limit):
+        """Remove and return up to `limit` ids due at or before `before`, earliest first."""
+        rows = self._db.execute(
+            "SELECT id FROM cold WHERE due <= ? ORDER BY due LIMIT ?",
+            (before, limit),
+        ).fetchall()
+        ids = [r[0] for r in rows]
+        if ids:
+            with self._db:
+                self._db.executemany("DELETE FROM cold WHERE id = ?", ((rid,) for rid in ids))
+        return ids
+
+    def close(self):
+        self._db.close()
+
+
+class TieredScheduler(ReminderScheduler):
+    """
+    ReminderScheduler that only keeps reminders due within `horizon` in its
+    in-memory heap. Later ones are parked in a ColdIndex on disk and promoted
+    in batches as the horizon moves forward; `resolve(reminder_id)` turns a
+    promoted id back into its Reminder (or None if it has gone away).
+    """
+    def __init__(self, cold_path, resolve, horizon=timedelta(hours=1), batch_size=500):
+        super().__init__()
+        self.cold = ColdIndex(cold_path)
+        self.resolve = resolve
+        self.horizon = horizon
+        self.batch_size = batch_size
+        self._cold_next = self.cold.next_due()
+
+    def schedule_many(self, reminders, replace=False):
+        """Schedule a batch; with replace=True the cold tier is rebuilt from it."""
+        with self._cond:
+            limit = time.time() + self.horizon.total_seconds()
+            cold = []
+            if replace:
+                self.cold.clear()
+            for reminder in reminders:
+                if reminder.due_ts > limit:
+                    self._live.pop(reminder.id, None)
+                    cold.append((reminder.id, reminder.due_ts))
+                else:
+                    super()._push(reminder)
+            if cold:
+                self.cold.put_many(cold)
+            self._cold_next = self.cold.next_due()
+            self._ensure_thread()
+            self._cond.notify()
+
+    def cancel(self, reminder_id):
+        with self._cond:
+            self._live.pop(reminder_id, None)
+            self.cold.delete(reminder_id)
+
+    def __len__(self):
+        with self._cond:
+            return len(self._live) + len(self.cold)
+
+    def hot_count(self):
+        return len(self._live)
+
+    def _push(self, reminder):
+        if reminder.due_ts > time.time() + self.horizon.total_seconds():
+            self._live.pop(reminder.id, None)
+            self.cold.put_many([(reminder.id, reminder.due_ts)])
+            if self._cold_next is None or reminder.due_ts < self._cold_next:
+                self._cold_next = reminder.due_ts
+        else:
+            self.cold.delete(reminder.id)
+            super()._push(reminder)
+
+    def _before_wait(self, now):
+        limit = now + self.horizon.total_seconds()
+        while self._cold_next is not None and self._cold_next <= limit:
+            for rid in self.cold.take_due(limit, self.batch_size):
+                reminder = self.resolve(rid)
+                if reminder is not None and not reminder.stopped:
+                    super()._push(reminder)
+            self._cold_next = self.cold.next_due()
+
+    def _idle_timeout(self):
+        return self.MAX_WAIT if self._cold_next is not None else None
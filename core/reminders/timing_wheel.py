@@ -0,0 +1,174 @@
+import math
+import time
+from collections import deque
+
+from .scheduler import ReminderScheduler
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel with second, minute, hour and day buckets.
+
+    Insert and cancel are O(1): an item goes into the bucket of the coarsest
+    level whose span still covers its due time, and each bucket is a dict.
+    When a coarser level rolls over to a new bucket, that bucket is cascaded
+    into the finer levels. Items further away than the day wheel wait in an
+    overflow bucket that is re-examined on every day rollover.
+    """
+    GRANULARITY = (1, 60, 3600, 86400)   # seconds per bucket at each level
+    SIZES = (60, 60, 24, 512)            # buckets per level
+
+    def __init__(self, now):
+        self.current = int(now)          # last tick processed
+        self._levels = [[{} for _ in range(size)] for size in self.SIZES]
+        self._counts = [0] * len(self.SIZES)
+        self._overflow = {}
+        self._where = {}                 # item id -> bucket dict holding it
+        self._expired = {}               # items added with a due time already passed
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, item_id):
+        return item_id in self._where
+
+    def add(self, item_id, due, payload):
+        """Schedule payload at `due` (epoch seconds), replacing any entry for item_id."""
+        if item_id in self._where:
+            self.cancel(item_id)
+        due = math.ceil(due)   # a tick never fires an item before its due time
+        if due <= self.current:
+            self._expired[item_id] = (due, payload, None)
+            self._where[item_id] = self._expired
+            return
+        self._place(item_id, due, payload)
+
+    def cancel(self, item_id):
+        bucket = self._where.pop(item_id, None)
+        if bucket is None:
+            return
+        entry = bucket.pop(item_id, None)
+        if entry is not None and entry[2] is not None:
+            self._counts[entry[2]] -= 1
+
+    def advance(self, now):
+        """Move time forward to `now` and return the payloads that came due, in order."""
+        now = int(now)
+        fired = []
+        if self._expired:
+            for item_id, (_, payload, _) in sorted(self._expired.items(), key=lambda kv: kv[1][0]):
+                del self._where[item_id]
+                fired.append(payload)
+            self._expired.clear()
+
+        while self.current < now:
+            if not self._where:
+                self.current = now
+                break
+            t = self._next_tick(now)
+            self.current = t
+            # Cascade coarse levels first so items due exactly at t reach level 0
+            for level in range(len(self.SIZES) - 1, 0, -1):
+                if t % self.GRANULARITY[level] == 0:
+                    self._cascade(level, (t // self.GRANULARITY[level]) % self.SIZES[level])
+            if t % self.GRANULARITY[-1] == 0 and self._overflow:
+                self._rehome_overflow()
+
+            bucket = self._levels[0][t % self.SIZES[0]]
+            if bucket:
+                self._counts[0] -= len(bucket)
+                for item_id, (_, payload, _) in bucket.items():
+                    del self._where[item_id]
+                    fired.append(payload)
+                bucket.clear()
+        return fired
+
+    def seconds_to_next_tick(self, now):
+        return max(0.0, self.current + 1 - now)
+
+    # --- Internals ---
+    def _place(self, item_id, due, payload):
+        current = self.current
+        level = 0
+        for gran, size in zip(self.GRANULARITY, self.SIZES):
+            slot = due // gran
+            if slot - current // gran < size:
+                bucket = self._levels[level][slot % size]
+                bucket[item_id] = (due, payload, level)
+                self._counts[level] += 1
+                self._where[item_id] = bucket
+                return
+            level += 1
+        self._overflow[item_id] = (due, payload, None)
+        self._where[item_id] = self._overflow
+
+    def _cascade(self, level, slot):
+        bucket = self._levels[level][slot]
+        if not bucket:
+            return
+        entries = list(bucket.items())
+        bucket.clear()
+        self._counts[level] -= len(entries)
+        for item_id, (due, payload, _) in entries:
+            self._place(item_id, due, payload)
+
+    def _rehome_overflow(self):
+        entries = list(self._overflow.items())
+        self._overflow.clear()
+        for item_id, (due, payload, _) in entries:
+            self._place(item_id, due, payload)
+
+    def _next_tick(self, now):
+        """Next tick worth visiting: skip ahead to a rollover when finer levels are empty."""
+        t = self.current + 1
+        for level in range(len(self.SIZES) - 1):
+            if self._counts[level]:
+                break
+            coarser = self.GRANULARITY[level + 1]
+            t = max(t, (self.current // coarser + 1) * coarser)
+        return min(t, now)
+
+
+class TimingWheelScheduler(ReminderScheduler):
+    """
+    ReminderScheduler backend that keeps reminders in a TimingWheel instead
+    of a heap: O(1) schedule/cancel, and the worker advances the wheel once
+    per second. Suited to processes holding very many reminders.
+
+    Entries remember the due time they were scheduled for, so one that came
+    due while its reminder was being snoozed or moved is dropped as stale.
+    """
+    TICK = 1.0
+
+    def __init__(self):
+        super().__init__()
+        self.wheel = TimingWheel(time.time())
+        self._ready = deque()
+
+    def cancel(self, reminder_id):
+        with self._cond:
+            self.wheel.cancel(reminder_id)
+
+    def __len__(self):
+        return len(self.wheel)
+
+    def __contains__(self, reminder_id):
+        return reminder_id in self.wheel
+
+    def _push(self, reminder):
+        self.wheel.add(reminder.id, reminder.due_ts, (reminder.due_ts, reminder))
+
+    def _pop_due(self):
+        with self._cond:
+            while not self._closed:
+                while self._ready:
+                    due, reminder = self._ready.popleft()
+                    # Moved since (a newer entry is in the wheel or the due time changed) or stopped
+                    if not reminder.stopped and reminder.due_ts == due and reminder.id not in self.wheel:
+                        return reminder
+                now = time.time()
+                self._ready.extend(self.wheel.advance(now))
+                if self._ready:
+                    continue
+                self._cond.wait(self.wheel.seconds_to_next_tick(now) if len(self.wheel) else None)
+            return None
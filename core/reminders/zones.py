@@ -0,0 +1,186 @@
+"""
+UTC offsets with cached transitions.
+
+Reminders are stored as a UTC instant plus an IANA zone name, while the rest
+of the reminder code works with naive local datetimes. Converting between
+the two goes through a Zone, which finds each year's offset transitions once
+(by sampling zoneinfo) and afterwards answers with a bisect over plain
+numbers, so firing and repeat computations never call into zoneinfo again.
+"""
+import bisect
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+_EPOCH = datetime(1970, 1, 1)
+_DAY = 86400
+
+
+class Zone:
+    """
+    Offsets of one zone as sorted (UTC epoch, offset seconds) periods,
+    loaded a calendar year at a time on first use.
+    """
+    def __init__(self, name=None):
+        self.name = name
+        if name and ZoneInfo:
+            info = ZoneInfo(name)
+            self._offset_of = lambda ts: int(datetime.fromtimestamp(ts, info).utcoffset().total_seconds())
+        else:
+            # The system zone when no IANA name is known
+            self._offset_of = lambda ts: time.localtime(ts).tm_gmtoff
+        # (UTC epochs where an offset period begins, offset in seconds east of
+        # UTC from that epoch on); replaced as a whole so readers need no lock
+        self._table = ((), ())
+        self._years = set()
+        self._lock = threading.Lock()   # serializes loading only
+
+    def offset_at(self, ts):
+        """UTC offset in seconds at epoch `ts`."""
+        year = int(ts // (365.2425 * _DAY)) + 1970
+        if year not in self._years:
+            self._load_around(ts)
+        starts, offsets = self._table
+        return offsets[bisect.bisect_right(starts, ts) - 1]
+
+    def to_wall(self, ts):
+        """Epoch seconds -> naive wall-clock datetime in this zone."""
+        return _EPOCH + timedelta(seconds=ts + self.offset_at(ts))
+
+    def from_wall(self, wall):
+        """Naive wall-clock datetime -> epoch seconds (earlier instant when ambiguous)."""
+        w = (wall - _EPOCH).total_seconds()
+        before = self.offset_at(w - _DAY)
+        if self.offset_at(w - before) == before:
+            return w - before
+        after = self.offset_at(w + _DAY)
+        if self.offset_at(w - after) == after:
+            return w - after
+        # Wall time falls in a gap (clocks jumped forward): read it with the old offset, like zoneinfo
+        return w - before
+
+    # --- Transition cache ---
+    def _load_around(self, ts):
+        year = datetime.fromtimestamp(ts, timezone.utc).year
+        with self._lock:
+            for y in (year - 1, year, year + 1):
+                if y not in self._years:
+                    self._load_year(y)
+
+    def _load_year(self, year):
+        start = (datetime(year, 1, 1) - _EPOCH).total_seconds()
+        end = (datetime(year + 1, 1, 1) - _EPOCH).total_seconds()
+        periods = [(start, self._offset_of(start))]
+        t, off = start, periods[0][1]
+        while t < end:
+            nxt = min(t + _DAY, end)
+            nxt_off = self._offset_of(nxt)
+            if nxt_off != off:
+                # Binary search the exact second the offset changed
+                lo, hi = t, nxt
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if self._offset_of(mid) == off:
+                        lo = mid
+                    else:
+                        hi = mid
+                periods.append((hi, nxt_off))
+            t, off = nxt, nxt_off
+
+        # Merge into new sorted tables and publish them (then the year) in one assignment each
+        merged = sorted(list(zip(*self._table)) + periods)
+        self._table = tuple(zip(*merged))
+        self._years.add(year)
+
+
+_zones = {}
+_local_name = None
+
+
+def local_name():
+    """
+    IANA name of the system zone, or None if it can't be determined.
+
+    Read once per process, like the zone behind datetime.now() (which only
+    changes on time.tzset()): after the system zone changes, new reminders
+    are still tagged with the old zone until the app restarts.
+    """
+    global _local_name
+    if _local_name is None:
+        _local_name = _detect_local_name() or ""
+    return _local_name or None
+
+
+def get(name=None):
+    """Cached Zone for an IANA name; None means the system zone."""
+    name = name or local_name()
+    zone = _zones.get(name)
+    if zone is None:
+        try:
+            zone = Zone(name)
+        except Exception:
+            zone = Zone(None)  # unknown zone name: fall back to the system zone
+        zone = _zones.setdefault(name, zone)
+    return zone
+
+
+def to_utc_iso(local):
+    """Naive local datetime -> ISO string of the same instant in UTC."""
+    return utc_iso(get().from_wall(local))
+
+
+def utc_iso(ts):
+    """Epoch seconds -> ISO string in UTC (exact, even in a repeated hour)."""
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def parse_stored(text):
+    """Stored ISO datetime -> naive local datetime (old naive values are already local)."""
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is None:
+        return dt
+    return get().to_wall(dt.timestamp())
+
+
+def stored_ts(text):
+    """Epoch seconds of a stored ISO datetime, or None for an old naive one."""
+    dt = datetime.fromisoformat(text)
+    return dt.timestamp() if dt.tzinfo is not None else None
+
+
+def _detect_local_name():
+    tz = os.environ.get("TZ", "").lstrip(":")
+    if tz and ZoneInfo and _valid(tz):
+        return tz
+    try:
+        with open("/etc/timezone", "r", encoding="utf-8") as f:
+            name = f.read().strip()
+        if _valid(name):
+            return name
+    except OSError:
+        pass
+    try:
+        target = os.path.realpath("/etc/localtime")
+        if "zoneinfo/" in target:
+            name = target.split("zoneinfo/", 1)[1]
+            if _valid(name):
+                return name
+    except OSError:
+        pass
+    return None
+
+
+def _valid(name):
+    if not ZoneInfo or not name:
+        return False
+    try:
+        ZoneInfo(name)
+        return True
+    except Exception:
+        return False
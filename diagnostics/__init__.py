@@ -0,0 +1,17 @@
+# diagnostics/__init__.py
+"""Opt-in runtime diagnostics for the multi-tool app."""
+# The latency monitor and leak tracker (and with them tkinter) are imported on
+# first use, so the tracing hooks can be used by headless modules too.
+
+
+def __getattr__(name):
+    if name == "LatencyMonitor":
+        from .latency import LatencyMonitor
+        return LatencyMonitor
+    if name == "LeakTracker":
+        from .leaks import LeakTracker
+        return LeakTracker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['LatencyMonitor', 'LeakTracker']
@@ -0,0 +1,252 @@
+import bisect
+import functools
+import os
+import threading
+import time
+import tkinter as tk
+from collections import Counter, deque
+
+
+class LatencyHistogram:
+    """Fixed log-scale buckets of latencies in milliseconds (constant memory)."""
+    # Bucket upper bounds: 0.25ms .. ~16s, roughly 12% apart
+    BOUNDS = [0.25 * 1.12 ** i for i in range(100)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.counts[bisect.bisect_left(self.BOUNDS, ms)] += 1
+        self.total += 1
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (0 < p <= 100)."""
+        if not self.total:
+            return 0.0
+        rank = p / 100 * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.BOUNDS[i], self.max) if i < len(self.BOUNDS) else self.max
+        return self.max
+
+
+def callback_name(func):
+    """Readable name for a Tk callback (unwrapping the closure `after` registers)."""
+    code = getattr(func, "__code__", None)
+    if code is not None and code.co_name == "callit" and func.__closure__:
+        cells = dict(zip(code.co_freevars, func.__closure__))
+        if "func" in cells:
+            return callback_name(cells["func"].cell_contents)
+    func = getattr(func, "__func__", func)  # bound method -> function
+    name = getattr(func, "__qualname__", None) or type(func).__name__
+    code = getattr(func, "__code__", None)
+    if code is not None and "<lambda>" in name:
+        name += f" ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return name
+
+
+def stall_name(func):
+    """
+    Name to file a stall under: for a TimerService wakeup (which runs a batch
+    of timer callbacks) the slowest callback of that batch, else the callback.
+    """
+    slowest = getattr(getattr(func, "__self__", None), "slowest", None)
+    if getattr(func, "__name__", None) == "_wake" and slowest is not None:
+        return f"{callback_name(slowest[0])} (timer)"
+    return callback_name(func)
+
+
+class LatencyMonitor:
+    """
+    Measures how responsive the Tk event loop is.
+
+    A heartbeat `after` callback is scheduled every `interval_ms`; how late
+    it actually runs goes into a histogram (p50/p95/p99). Every Tk callback
+    is also timed through tkinter's CallWrapper, and callbacks that block the
+    loop for longer than `stall_ms` are recorded by name, together with the
+    slowest watched method that ran inside them (see `watch`). A stall in a
+    TimerService wakeup is recorded under the slowest timer callback it ran. Stalls are
+    appended to `log_path` and, with `overlay=True`, shown in a small window.
+
+    Enable from the environment with MULTITOOL_LATENCY=log or =overlay.
+    """
+    def __init__(self, root, interval_ms=100, stall_ms=50, log_path=None, overlay=False):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.log_path = log_path
+        self.histogram = LatencyHistogram()
+        self.stalls = deque(maxlen=200)    # (wall time, callback, ms, slowest section)
+        self.stall_counts = Counter()      # callback name -> number of stalls
+        self._running = False
+        self._expected = None
+        self._after_id = None
+        self._original_call = None
+        self._section = None               # (name, ms) of the slowest watched call so far
+        self._overlay = None
+        self._overlay_label = None
+        self._want_overlay = overlay
+        self._log_lock = threading.Lock()
+        self._tk_thread = threading.get_ident()
+
+    @classmethod
+    def from_env(cls, root, var="MULTITOOL_LATENCY"):
+        """Start a monitor if the environment asks for one; returns it or None."""
+        mode = os.environ.get(var, "").strip().lower()
+        if not mode:
+            return None
+        log_path = os.environ.get(var + "_LOG") or os.path.join(os.getcwd(), "latency.log")
+        monitor = cls(root, log_path=log_path, overlay=(mode == "overlay"))
+        monitor.start()
+        return monitor
+
+    # --- Control ---
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._patch_callwrapper()
+        if self._want_overlay:
+            self._build_overlay()
+        self._log(f"monitor started: heartbeat {self.interval_ms} ms, stall threshold {self.stall_ms} ms")
+        self._schedule_beat()
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+        if self._original_call is not None:
+            tk.CallWrapper.__call__ = self._original_call
+            self._original_call = None
+        self._log(self.report())
+
+    def watch(self, owner, *names):
+        """
+        Wrap methods/functions of a class or module so a stall names the slowest
+        one that ran inside the blocking callback (e.g. save_to_excel).
+        """
+        for name in names:
+            original = getattr(owner, name, None)
+            if original is None or getattr(original, "_latency_watched", False):
+                continue
+            setattr(owner, name, self._timed(original, f"{getattr(owner, '__name__', owner)}.{name}"))
+
+    # --- Reporting ---
+    def percentiles(self):
+        h = self.histogram
+        return {"p50": h.percentile(50), "p95": h.percentile(95), "p99": h.percentile(99), "max": h.max}
+
+    def report(self):
+        p = self.percentiles()
+        lines = [
+            f"heartbeats: {self.histogram.total}  lag p50 {p['p50']:.1f} ms  p95 {p['p95']:.1f} ms  "
+            f"p99 {p['p99']:.1f} ms  max {p['max']:.1f} ms"
+        ]
+        for name, count in self.stall_counts.most_common(10):
+            lines.append(f"  {count:>5} stall(s)  {name}")
+        return "\n".join(lines)
+
+    # --- Heartbeat ---
+    def _schedule_beat(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self.root.after(self.interval_ms, self._beat)
+
+    def _beat(self):
+        if not self._running:
+            return
+        lag_ms = max(0.0, (time.perf_counter() - self._expected) * 1000)
+        self.histogram.add(lag_ms)
+        self._schedule_beat()
+        if self._overlay_label is not None and self.histogram.total % max(1, 1000 // self.interval_ms) == 0:
+            self._update_overlay()
+
+    # --- Callback timing ---
+    def _patch_callwrapper(self):
+        self._original_call = original = tk.CallWrapper.__call__
+        monitor = self
+
+        def timed_call(wrapper, *args):
+            if not monitor._running:
+                return original(wrapper, *args)
+            outer = monitor._section
+            monitor._section = None
+            start = time.perf_counter()
+            try:
+                return original(wrapper, *args)
+            finally:
+                ms = (time.perf_counter() - start) * 1000
+                if ms >= monitor.stall_ms:
+                    monitor._record_stall(stall_name(wrapper.func), ms, monitor._section)
+                monitor._section = outer
+
+        tk.CallWrapper.__call__ = timed_call
+
+    def _timed(self, func, label):
+        monitor = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if threading.get_ident() != monitor._tk_thread:
+                return func(*args, **kwargs)  # only calls on the Tk thread can block it
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                ms = (time.perf_counter() - start) * 1000
+                if monitor._section is None or ms > monitor._section[1]:
+                    monitor._section = (label, ms)
+
+        wrapper._latency_watched = True
+        return wrapper
+
+    def _record_stall(self, name, ms, section):
+        self.stalls.append((time.time(), name, ms, section))
+        self.stall_counts[name] += 1
+        detail = f" (slowest inside: {section[0]} {section[1]:.0f} ms)" if section else ""
+        self._log(f"stall {ms:.0f} ms in {name}{detail}")
+
+    # --- Output ---
+    def _log(self, text):
+        if not self.log_path:
+            return
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self._log_lock:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(f"{stamp}  {text}\n")
+            except OSError:
+                pass
+
+    def _build_overlay(self):
+        self._overlay = tk.Toplevel(self.root)
+        self._overlay.title("Event loop latency")
+        self._overlay.attributes("-topmost", True)
+        self._overlay.resizable(False, False)
+        self._overlay_label = tk.Label(
+            self._overlay, justify="left", anchor="w", font=("Consolas", 9),
+            bg="#1f1f1f", fg="#d6d6d6", padx=8, pady=6,
+        )
+        self._overlay_label.pack(fill="both")
+        self._overlay.protocol("WM_DELETE_WINDOW", self._overlay.withdraw)
+        self._update_overlay()
+
+    def _update_overlay(self):
+        text = self.report()
+        if self.stalls:
+            _, name, ms, _ = self.stalls[-1]
+            text += f"\nlast stall: {ms:.0f} ms  {name}"
+        try:
+            self._overlay_label.configure(text=text)
+        except tk.TclError:
+            self._overlay_label = None
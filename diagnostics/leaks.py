@@ -0,0 +1,231 @@
+import functools
+import gc
+import os
+import threading
+import time
+import tkinter as tk
+import tracemalloc
+import weakref
+from collections import Counter
+
+
+class _Record:
+    __slots__ = ("ref", "label", "created", "destroyed", "owner")
+
+    def __init__(self, ref, label, owner=None):
+        self.ref = ref
+        self.label = label
+        self.created = time.monotonic()
+        self.destroyed = None   # time.monotonic() when the widget (or its owner) was destroyed
+        self.owner = owner      # key of the owning widget's record, for tracked non-widgets
+
+
+class LeakTracker:
+    """
+    Finds widgets and pages that stay in memory after they are gone.
+
+    Every Tk widget created while the tracker runs is tracked through a
+    weakref; `destroy()` marks it dead. A destroyed widget whose Python object
+    survives a garbage collection is reported as having outlived its widget,
+    with a hint of what still refers to it (usually a lambda or a dict such as
+    a semester's). Other objects can be tied to a widget with `track(obj,
+    owner=widget)` and are expected to go when it does.
+
+    tracemalloc snapshots are taken on demand (`snapshot()`, or Ctrl+Shift+M
+    in the app) and each report compares the latest with the first. Live counts per class
+    are reported against the first report, which shows slow growth such as
+    pages that are hidden rather than destroyed.
+    """
+    def __init__(self, root=None, log_path=None, frames=10, grace_s=2.0):
+        self.root = root
+        self.log_path = log_path
+        self.frames = frames
+        self.grace_s = grace_s      # a widget destroyed this recently may still be on the stack
+        self.snapshots = []         # (label, tracemalloc.Snapshot)
+        self._records = {}          # id(obj) -> _Record
+        self._owned = {}            # id(owner widget) -> ids of objects tracked with it
+        self._baseline = None       # live counts at the first report
+        self._patched = []          # (cls, name, original)
+        self._running = False
+        self._own_tracemalloc = False
+        self._log_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, root, var="MULTITOOL_LEAKS"):
+        """Start a tracker if the environment asks for one; returns it or None."""
+        if not os.environ.get(var, "").strip():
+            return None
+        log_path = os.environ.get(var + "_LOG") or os.path.join(os.getcwd(), "leaks.log")
+        tracker = cls(root, log_path=log_path)
+        tracker.start()
+        return tracker
+
+    # --- Control ---
+    def start(self, classes=(tk.BaseWidget,)):
+        if self._running:
+            return
+        self._running = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._own_tracemalloc = True
+        for cls in classes:
+            self._patch(cls)
+        if self.root is not None:
+            self.root.bind_all("<Control-Shift-M>", lambda e: self._log(self.report(snapshot=True)), add="+")
+        self.snapshot("start")
+        self._log(f"leak tracker started: watching {', '.join(c.__name__ for c in classes)}")
+
+    def stop(self):
+        if not self._running:
+            return
+        self._log(self.report(snapshot=True))
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched.clear()
+        self._running = False
+        if self._own_tracemalloc:
+            tracemalloc.stop()
+            self._own_tracemalloc = False
+
+    # --- Tracking ---
+    def track(self, obj, label=None, owner=None):
+        """Track `obj`; with `owner` (a widget), it should be freed once the owner is destroyed."""
+        key = id(obj)
+        try:
+            ref = weakref.ref(obj, lambda r, key=key: self._forget(key, r))
+        except TypeError:
+            return False   # dicts, lists and the like can't be weakly referenced
+        owner_key = id(owner) if owner is not None else None
+        if owner_key is not None:
+            if owner_key not in self._records:
+                self.track(owner)
+            self._owned.setdefault(owner_key, []).append(key)
+        self._records[key] = _Record(ref, label or type(obj).__name__, owner_key)
+        return True
+
+    def mark_destroyed(self, obj):
+        now = time.monotonic()
+        key = id(obj)
+        record = self._records.get(key)
+        if record is not None and record.destroyed is None:
+            record.destroyed = now
+            for owned in self._owned.pop(key, ()):
+                other = self._records.get(owned)
+                if other is not None and other.owner == key and other.destroyed is None:
+                    other.destroyed = now
+
+    def live_counts(self):
+        return Counter(r.label for r in self._records.values() if r.destroyed is None)
+
+    def outlived(self):
+        """(label, seconds since destroyed, referrer hint) for destroyed objects still in memory."""
+        gc.collect()
+        now = time.monotonic()
+        found = []
+        for record in list(self._records.values()):
+            if record.destroyed is None or now - record.destroyed < self.grace_s:
+                continue
+            obj = record.ref()
+            if obj is not None:
+                found.append((record.label, now - record.destroyed, _referrer_hint(obj)))
+        return found
+
+    # --- Snapshots ---
+    def snapshot(self, label=None):
+        if not tracemalloc.is_tracing():
+            return None
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        self.snapshots.append((label or f"#{len(self.snapshots)}", snap))
+        del self.snapshots[1:-1]   # keep the first and the latest
+        return snap
+
+    def compare(self, top=10):
+        """Largest allocation growth (by line) between the first and latest snapshots."""
+        if len(self.snapshots) < 2:
+            return []
+        diff = self.snapshots[-1][1].compare_to(self.snapshots[0][1], "lineno")
+        return [stat for stat in diff if stat.size_diff > 0][:top]
+
+    def report(self, snapshot=False, top=10):
+        if snapshot:
+            self.snapshot()
+        counts = self.live_counts()
+        if self._baseline is None:
+            self._baseline = counts
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        lines = [f"traced memory {current / 1024:.0f} KiB (peak {peak / 1024:.0f} KiB), "
+                 f"{sum(counts.values())} live tracked objects"]
+        for label, count in counts.most_common(top):
+            delta = count - self._baseline.get(label, 0)
+            lines.append(f"  {count:>6} {label}" + (f" ({delta:+d})" if delta else ""))
+        leaked = self.outlived()
+        if leaked:
+            lines.append(f"{len(leaked)} object(s) outlived their widget:")
+            for label, age, hint in leaked[:top]:
+                lines.append(f"  {label} destroyed {age:.0f} s ago, held by {hint}")
+        stats = self.compare(top)
+        if stats:
+            lines.append(f"allocation growth since {self.snapshots[0][0]}:")
+            lines.extend(f"  {stat}" for stat in stats)
+        return "\n".join(lines)
+
+    # --- Internals ---
+    def _patch(self, cls):
+        tracker = self
+        original_init, original_destroy = cls.__init__, cls.destroy
+
+        @functools.wraps(original_init)
+        def init(widget, *args, **kwargs):
+            original_init(widget, *args, **kwargs)
+            if tracker._running and id(widget) not in tracker._records:
+                tracker.track(widget)
+
+        @functools.wraps(original_destroy)
+        def destroy(widget):
+            if tracker._running:
+                tracker.mark_destroyed(widget)
+            original_destroy(widget)
+
+        cls.__init__, cls.destroy = init, destroy
+        self._patched += [(cls, "__init__", original_init), (cls, "destroy", original_destroy)]
+
+    def _forget(self, key, ref):
+        record = self._records.get(key)
+        if record is not None and record.ref is ref:
+            del self._records[key]
+            self._owned.pop(key, None)
+
+    def _log(self, text):
+        if not self.log_path:
+            return
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self._log_lock:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(f"{stamp}  {text}\n")
+            except OSError:
+                pass
+
+
+def _referrer_hint(obj, limit=3):
+    """Short description of what refers to `obj`, e.g. a lambda or a dict's keys."""
+    hints = []
+    for ref in gc.get_referrers(obj):
+        if type(ref).__name__ == "frame":
+            continue
+        if callable(ref) and hasattr(ref, "__qualname__"):
+            hints.append(f"function {ref.__qualname__}")
+        elif isinstance(ref, dict):
+            keys = []   # a plain loop: a comprehension would close over obj and show up as a referrer
+            for key, value in ref.items():
+                if value is obj:
+                    keys.append(key)
+            hints.append(f"dict[{', '.join(map(repr, keys[:2] or list(ref)[:3]))}]")
+        else:
+            hints.append(type(ref).__name__)
+        if len(hints) >= limit:
+            break
+    return ", ".join(hints) or "nothing reachable (a reference cycle gc can't free)"
@@ -0,0 +1,168 @@
+"""
+Opt-in tracing that writes Chrome trace-event JSON.
+
+Hot paths are marked with the `traced` decorator or the `span` context
+manager. While tracing is off both reduce to a single global check, so they
+can stay in the code permanently. Turn it on with enable(path) or by setting
+MULTITOOL_TRACE=<file.json>, then load the file in chrome://tracing or
+https://ui.perfetto.dev.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+_tracer = None
+
+
+class Tracer:
+    """Collects complete ("X") and instant ("i") events in memory until written."""
+    def __init__(self, path, max_events=1_000_000):
+        self.path = path
+        self.max_events = max_events
+        self.events = []
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._t0 = time.perf_counter()
+
+    def now_us(self):
+        return (time.perf_counter() - self._t0) * 1e6
+
+    def add(self, event):
+        event["pid"] = self._pid
+        event["tid"] = threading.get_ident()
+        with self._lock:
+            if len(self.events) < self.max_events:
+                self.events.append(event)
+            else:
+                self.dropped += 1
+
+    def complete(self, name, cat, start_us, args=None):
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start_us, "dur": self.now_us() - start_us}
+        if args:
+            event["args"] = args
+        self.add(event)
+
+    def write(self):
+        with self._lock:
+            events = list(self.events)
+        names = {}
+        for t in threading.enumerate():
+            names[t.ident] = t.name
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in names.items()
+        ]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({
+                "traceEvents": meta + events,
+                "displayTimeUnit": "ms",
+                "otherData": {"dropped_events": self.dropped},
+            }, f)
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = _tracer.now_us() if _tracer else None
+        return self
+
+    def __exit__(self, *exc):
+        tracer = _tracer
+        if tracer is not None and self.start is not None:
+            tracer.complete(self.name, self.cat, self.start, self.args)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def enabled():
+    return _tracer is not None
+
+
+def enable(path, max_events=1_000_000):
+    """Start recording; the trace is written to `path` on disable() or exit."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path, max_events)
+        atexit.register(disable)
+    return _tracer
+
+
+def disable():
+    """Stop recording and write the trace file."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        try:
+            tracer.write()
+        except OSError:
+            pass
+    return tracer
+
+
+def enable_from_env(var="MULTITOOL_TRACE"):
+    path = os.environ.get(var, "").strip()
+    return enable(path) if path else None
+
+
+def span(name, cat="app", **args):
+    """Context manager timing a block as one trace event."""
+    if _tracer is None:
+        return _NO_SPAN
+    return _Span(name, cat, args or None)
+
+
+def instant(name, cat="app", **args):
+    """Mark a point in time (e.g. a reminder firing)."""
+    tracer = _tracer
+    if tracer is not None:
+        event = {"name": name, "cat": cat, "ph": "i", "s": "t", "ts": tracer.now_us()}
+        if args:
+            event["args"] = args
+        tracer.add(event)
+
+
+def traced(name=None, cat="app"):
+    """
+    Decorator recording each call as a trace event. Use as @traced, or
+    @traced("label", cat="gpa") to choose the event name and category.
+    """
+    def decorate(func, label=None):
+        label = label or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            start = tracer.now_us()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.complete(label, cat, start)
+        return wrapper
+
+    if callable(name):
+        return decorate(name)
+    return lambda func: decorate(func, name)
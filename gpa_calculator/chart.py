@@ -2,6 +2,9 @@ import customtkinter as ctk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from diagnostics.tracing import traced
+from shared import COLORS, font, render_scheduler
+
 
 class GPAChartPage(ctk.CTkFrame):
     """Page displaying GPA trend chart with bar and line visualization."""
@@ -19,7 +22,7 @@ class GPAChartPage(ctk.CTkFrame):
         back_btn = ctk.CTkButton(
             header_frame,
             text="← Back",
-            font=ctk.CTkFont(size=12),
+            font=font(size=12),
             height=30,
             width=70,
             corner_radius=8,
@@ -30,8 +33,8 @@ class GPAChartPage(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame,
             text="GPA Trend",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#ffffff"
+            font=font(size=16, weight="bold"),
+            text_color=COLORS["text"]
         )
         title_label.pack(side="right")
 
@@ -63,6 +66,7 @@ class GPAChartPage(ctk.CTkFrame):
         self.ax.set_yticks([0, 1, 2, 3, 4])
         self.ax.grid(True, alpha=0.3, color='gray')
 
+    @traced(cat="gpa")
     def draw_chart(self):
         """Draw GPA trend chart with bars and line, or show no data message."""
         gpas = [sem["gpa"] for sem in self.semesters if sem.get("gpa", 0) > 0]
@@ -111,4 +115,5 @@ class GPAChartPage(ctk.CTkFrame):
     def go_back(self):
         """Hide chart page and return to main page."""
         self.place_forget()
+        render_scheduler().set_visible(self, False)
         self.go_back_callback()
@@ -1,8 +1,9 @@
 import customtkinter as ctk
-import openpyxl
 import os
-from .semester_detail_page import SemesterDetailPage, GRADE_POINTS
-from .chart import GPAChartPage
+from core.gpa import cgpa_tarumt, load_excel, save_excel, semester_gpa
+from diagnostics.tracing import traced
+from shared import COLORS, font, io_pool, render_scheduler
+from .semester_detail_page import SemesterDetailPage
 
 
 class GPACalculatorPage(ctk.CTkFrame):
@@ -21,19 +22,19 @@ class GPACalculatorPage(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             header_frame, 
             text="GPA Calculator", 
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color="#ffffff"
+            font=font(size=20, weight="bold"),
+            text_color=COLORS["text"]
         )
         title_label.pack(pady=(0, 10))
 
-        cgpa_frame = ctk.CTkFrame(header_frame, fg_color="#1a2b4c", corner_radius=10)
+        cgpa_frame = ctk.CTkFrame(header_frame, fg_color=COLORS["accent"], corner_radius=10)
         cgpa_frame.pack(fill="x")
         
         self.cgpa_label = ctk.CTkLabel(
             cgpa_frame, 
             text="Total CGPA: 0.00", 
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#ffffff"
+            font=font(size=16, weight="bold"),
+            text_color=COLORS["text"]
         )
         self.cgpa_label.pack(pady=12, padx=15)
 
@@ -45,7 +46,7 @@ class GPACalculatorPage(ctk.CTkFrame):
         self.add_sem_btn = ctk.CTkButton(
             button_frame,
             text="Add Semester",
-            font=ctk.CTkFont(size=14),
+            font=font(size=14),
             height=35,
             corner_radius=8,
             command=self.add_semester,
@@ -55,7 +56,7 @@ class GPACalculatorPage(ctk.CTkFrame):
         self.chart_btn = ctk.CTkButton(
             button_frame,
             text="View Charts",
-            font=ctk.CTkFont(size=14),
+            font=font(size=14),
             height=35,
             corner_radius=8,
             command=self.open_chart_page,
@@ -103,8 +104,8 @@ class GPACalculatorPage(ctk.CTkFrame):
         name_label = ctk.CTkLabel(
             left_frame, 
             text=sem["name"], 
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#ffffff",
+            font=font(size=14, weight="bold"),
+            text_color=COLORS["text"],
             anchor="w"
         )
         name_label.pack(fill="x", pady=(0, 3))
@@ -113,8 +114,8 @@ class GPACalculatorPage(ctk.CTkFrame):
         gpa_label = ctk.CTkLabel(
             left_frame, 
             text=f"GPA: {sem['gpa']:.4f}", 
-            font=ctk.CTkFont(size=12),
-            text_color="#d1d5db",
+            font=font(size=12),
+            text_color=COLORS["text_muted"],
             anchor="w"
         )
         gpa_label.pack(fill="x")
@@ -125,12 +126,12 @@ class GPACalculatorPage(ctk.CTkFrame):
             text="×",
             width=25,
             height=25,
-            fg_color="#dc2626",
-            hover_color="#b91c1c",
+            fg_color=COLORS["danger"],
+            hover_color=COLORS["danger_hover"],
             corner_radius=12,
             border_width=0,
             text_color="white",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=font(size=12, weight="bold"),
             command=lambda s=sem: self.remove_semester(s),
         )
         remove_btn.pack(side="right", padx=(10, 0))
@@ -180,7 +181,7 @@ class GPACalculatorPage(ctk.CTkFrame):
         """Update semester data and recalculate GPA."""
         sem = next(s for s in self.semesters if s["name"] == semester_name)
         sem["subjects"] = subjects
-        sem["gpa"] = self._calculate_semester_gpa(subjects)
+        sem["gpa"] = semester_gpa(subjects)
 
         if sem["gpa_label"]:
             sem["gpa_label"].configure(text=f"GPA: {sem['gpa']:.4f}")
@@ -188,53 +189,11 @@ class GPACalculatorPage(ctk.CTkFrame):
         self._update_total_cgpa()
         self._update_chart()
 
-    def _calculate_semester_gpa(self, subjects):
-        """Calculate GPA for a list of subjects."""
-        if not subjects:
-            return 0.0
-        total_points = sum(GRADE_POINTS[s["grade"]] * s["credit"] for s in subjects)
-        total_credits = sum(s["credit"] for s in subjects)
-        return total_points / total_credits if total_credits else 0.0
-
-    def _calculate_cgpa_tarumt(self, all_subjects):
-        """Calculate CGPA using TARUMT rules: exclude failed subject credits only once."""
-        if not all_subjects:
-            return 0.0
-        
-        # Group subjects by name (case-insensitive)
-        subject_groups = {}
-        for subject in all_subjects:
-            name = subject["name"].strip().lower()
-            if name not in subject_groups:
-                subject_groups[name] = []
-            subject_groups[name].append(subject)
-        
-        total_points = 0.0
-        total_credits = 0.0
-        
-        for subject_name, subjects in subject_groups.items():
-            has_failed = any(s["grade"] == "F" for s in subjects)
-            
-            # Add all grade points (including F = 0.0)
-            for subject in subjects:
-                total_points += GRADE_POINTS[subject["grade"]] * subject["credit"]
-            
-            # Exclude failed subject credits only once
-            if has_failed:
-                for i, subject in enumerate(subjects):
-                    if i == 0:  # Skip first attempt
-                        continue
-                    total_credits += subject["credit"]
-            else:
-                for subject in subjects:
-                    total_credits += subject["credit"]
-        
-        return total_points / total_credits if total_credits > 0 else 0.0
-
+    @traced(cat="gpa")
     def _update_total_cgpa(self, save_data=True):
         """Calculate and display total CGPA using TARUMT rules."""
         all_subjects = [subj for sem in self.semesters for subj in sem["subjects"]]
-        cgpa = self._calculate_cgpa_tarumt(all_subjects)
+        cgpa = cgpa_tarumt(all_subjects)
         self.cgpa_label.configure(text=f"Total CGPA: {cgpa:.4f}")
         if save_data:
             self.save_to_excel()
@@ -252,79 +211,66 @@ class GPACalculatorPage(ctk.CTkFrame):
     def open_chart_page(self):
         """Open or refresh the GPA trend chart page."""
         if not hasattr(self, "chart_page") or self.chart_page is None:
+            from .chart import GPAChartPage   # matplotlib; imported on first use or by the app's prewarm
             self.chart_page = GPAChartPage(
                 self.parent, self.semesters, go_back_callback=self.show_main_page
             )
-            self.chart_page.place(relwidth=1, relheight=1)
+            render_scheduler().register(self.chart_page, visible=True)
         else:
-            self.chart_page.draw_chart()
-            self.chart_page.place(relwidth=1, relheight=1)
+            # Redraws only if the data changed while the chart was hidden
+            render_scheduler().set_visible(self.chart_page, True)
+        self.chart_page.place(relwidth=1, relheight=1)
 
         self.chart_page.lift()
 
     def _update_chart(self):
-        """Update chart data and redraw if chart page exists."""
+        """Update chart data and redraw it, or once it is next shown if it is hidden."""
         if hasattr(self, "chart_page") and self.chart_page is not None:
             self.chart_page.semesters = self.semesters
-            self.chart_page.draw_chart()
+            render_scheduler().render(self.chart_page, "draw", self.chart_page.draw_chart)
 
+    @traced(cat="gpa")
     def save_to_excel(self, filename="gpa_data.xlsx"):
-        """Save all semester and subject data to Excel file."""
-        folder = os.path.dirname(__file__)
-        os.makedirs(folder, exist_ok=True)
-        file_path = os.path.join(folder, filename)
-
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "GPA Data"
-        ws.append(["Semester", "Subject", "Credit", "Grade", "GPA"])
-
-        for sem in self.semesters:
-            for subj in sem["subjects"]:
-                ws.append([
-                    sem["name"],
-                    subj["name"],
-                    subj["credit"],
-                    subj["grade"],
-                    f"{sem['gpa']:.4f}",
-                ])
-
-        wb.save(file_path)
-        print(f"Data saved automatically to {os.path.abspath(file_path)}")
+        """Save all semester and subject data to Excel file (written on the I/O pool)."""
+        file_path = os.path.join(os.path.dirname(__file__), filename)
+        # Copy what gets written; the widgets in each semester dict stay here
+        data = [
+            {"name": s["name"], "gpa": s["gpa"], "subjects": [dict(subj) for subj in s["subjects"]]}
+            for s in self.semesters
+        ]
+        io_pool().submit(
+            save_excel, data, file_path, key=file_path, coalesce=True, widget=self,
+            on_done=lambda _: print(f"Data saved automatically to {os.path.abspath(file_path)}"),
+            on_error=lambda e: print(f"Could not save {os.path.abspath(file_path)}: {e}"),
+        )
 
+    @traced(cat="gpa")
     def load_from_excel(self, filename="gpa_data.xlsx"):
-        """Load semester and subject data from Excel file."""
-        folder = os.path.dirname(__file__)
-        file_path = os.path.join(folder, filename)
+        """Load semester and subject data from Excel file (read on the I/O pool)."""
+        file_path = os.path.join(os.path.dirname(__file__), filename)
         if not os.path.exists(file_path):
             return
 
-        wb = openpyxl.load_workbook(file_path)
-        ws = wb.active
-        data_rows = list(ws.iter_rows(values_only=True))[1:]  # Skip header
-
-        semesters_dict = {}
-        for sem_name, subj_name, credit, grade, gpa in data_rows:
-            if sem_name not in semesters_dict:
-                semesters_dict[sem_name] = {
-                    "name": sem_name,
-                    "gpa": 0.0,
-                    "subjects": [],
-                    "detail_page": None,
-                    "card": None,
-                    "gpa_label": None,
-                }
-            semesters_dict[sem_name]["subjects"].append({
-                "name": subj_name,
-                "credit": float(credit),
-                "grade": grade,
-            })
+        # No new semesters until the saved ones are in, so a save can't overwrite them
+        self.add_sem_btn.configure(state="disabled")
+        io_pool().submit(
+            load_excel, file_path, key=file_path, widget=self,
+            on_done=lambda semesters: self._on_loaded(semesters, file_path),
+            on_error=lambda e: self._on_loaded([], file_path, e),
+        )
+
+    def _on_loaded(self, semesters, file_path, error=None):
+        self.add_sem_btn.configure(state="normal")
+        if error is not None:
+            print(f"Could not load {os.path.abspath(file_path)}: {error}")
+            return
 
         self.semesters.clear()
-        for sem in semesters_dict.values():
-            sem["gpa"] = self._calculate_semester_gpa(sem["subjects"])
+        for sem in semesters:
+            sem.update({"detail_page": None, "card": None, "gpa_label": None})
             self.semesters.append(sem)
             self._create_semester_card(sem)
 
         self._update_total_cgpa(save_data=False)
+        self._update_chart()
         print(f"Data loaded from {os.path.abspath(file_path)}")
@@ -1,17 +1,6 @@
 import customtkinter as ctk
-
-# TARUMT Grade → Point mapping
-GRADE_POINTS = {
-    "A+": 4.00,
-    "A": 4.00,
-    "A-": 3.67,
-    "B+": 3.33,
-    "B": 3.00,
-    "B-": 2.67,
-    "C+": 2.33,
-    "C": 2.00,
-    "F": 0.00,
-}
+from core.gpa import GRADE_POINTS, semester_gpa
+from shared import COLORS, font, timers
 
 
 class SemesterDetailPage(ctk.CTkFrame):
@@ -42,7 +31,7 @@ class SemesterDetailPage(ctk.CTkFrame):
         back_btn = ctk.CTkButton(
             top_row,
             text="← Back",
-            font=ctk.CTkFont(size=12),
+            font=font(size=12),
             height=30,
             width=70,
             corner_radius=8,
@@ -53,19 +42,19 @@ class SemesterDetailPage(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             top_row, 
             text=semester_name, 
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#ffffff"
+            font=font(size=16, weight="bold"),
+            text_color=COLORS["text"]
         )
         title_label.pack(side="right")
         
-        gpa_frame = ctk.CTkFrame(header_frame, fg_color="#1a2b4c", corner_radius=8)
+        gpa_frame = ctk.CTkFrame(header_frame, fg_color=COLORS["accent"], corner_radius=8)
         gpa_frame.pack(fill="x")
         
         self.gpa_label = ctk.CTkLabel(
             gpa_frame, 
             text="GPA: 0.00", 
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color="#ffffff"
+            font=font(size=14, weight="bold"),
+            text_color=COLORS["text"]
         )
         self.gpa_label.pack(pady=10, padx=12)
 
@@ -74,16 +63,16 @@ class SemesterDetailPage(ctk.CTkFrame):
         form_frame.pack(fill="x", pady=(0, 15), padx=20)
         form_frame.grid_columnconfigure((0, 1), weight=1)
 
-        ctk.CTkLabel(form_frame, text="Course Name:", font=ctk.CTkFont(size=12), text_color="#d1d5db").grid(row=0, column=0, sticky="w", pady=3)
+        ctk.CTkLabel(form_frame, text="Course Name:", font=font(size=12), text_color=COLORS["text_muted"]).grid(row=0, column=0, sticky="w", pady=3)
         self.subject_entry = ctk.CTkEntry(form_frame, height=30, corner_radius=6)
         self.subject_entry.grid(row=0, column=1, sticky="ew", padx=(10, 0), pady=3)
 
-        ctk.CTkLabel(form_frame, text="Credit Hours:", font=ctk.CTkFont(size=12), text_color="#d1d5db").grid(row=1, column=0, sticky="w", pady=3)
+        ctk.CTkLabel(form_frame, text="Credit Hours:", font=font(size=12), text_color=COLORS["text_muted"]).grid(row=1, column=0, sticky="w", pady=3)
         self.credit_entry = ctk.CTkEntry(form_frame, height=30, corner_radius=6)
         self.credit_entry.grid(row=1, column=1, sticky="ew", padx=(10, 0), pady=3)
         self.credit_entry.bind("<KeyPress>", self.handle_credit_input)
 
-        ctk.CTkLabel(form_frame, text="Grade:", font=ctk.CTkFont(size=12), text_color="#d1d5db").grid(row=2, column=0, sticky="w", pady=3)
+        ctk.CTkLabel(form_frame, text="Grade:", font=font(size=12), text_color=COLORS["text_muted"]).grid(row=2, column=0, sticky="w", pady=3)
         self.grade_option = ctk.CTkOptionMenu(
             form_frame, 
             values=list(GRADE_POINTS.keys()),
@@ -98,7 +87,7 @@ class SemesterDetailPage(ctk.CTkFrame):
             text="Add Course", 
             command=self.add_subject, 
             height=32,
-            font=ctk.CTkFont(size=12),
+            font=font(size=12),
             corner_radius=8
         )
         add_btn.grid(row=3, column=0, columnspan=2, pady=(10, 0))
@@ -179,7 +168,7 @@ class SemesterDetailPage(ctk.CTkFrame):
             row_container,
             height=28,
             corner_radius=6,
-            font=ctk.CTkFont(size=11)
+            font=font(size=11)
         )
         name_entry.insert(0, str(name) if name is not None else "")
         name_entry.pack(side="left", fill="x", expand=True, padx=(8, 4), pady=6)
@@ -190,7 +179,7 @@ class SemesterDetailPage(ctk.CTkFrame):
             width=45,
             height=28,
             corner_radius=6,
-            font=ctk.CTkFont(size=11)
+            font=font(size=11)
         )
         credit_entry.insert(0, str(credit) if credit is not None else "")
         credit_entry.pack(side="left", padx=(0, 4), pady=6)
@@ -202,7 +191,7 @@ class SemesterDetailPage(ctk.CTkFrame):
             width=55,
             height=28,
             corner_radius=6,
-            font=ctk.CTkFont(size=11)
+            font=font(size=11)
         )
         grade_option.set(grade if grade is not None else "A")
         grade_option.pack(side="left", padx=(0, 4), pady=6)
@@ -212,12 +201,12 @@ class SemesterDetailPage(ctk.CTkFrame):
             text="×",
             width=18,
             height=28,
-            fg_color="#dc2626",
-            hover_color="#b91c1c",
+            fg_color=COLORS["danger"],
+            hover_color=COLORS["danger_hover"],
             corner_radius=6,
             border_width=0,
             text_color="white",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=font(size=14, weight="bold"),
             command=lambda r=row_container: self.remove_subject(r),
         )
         del_btn.pack(side="right", padx=(0, 6), pady=6)
@@ -251,11 +240,7 @@ class SemesterDetailPage(ctk.CTkFrame):
 
     def _calculate_gpa(self, subjects_data):
         """Calculate semester GPA from subjects data."""
-        if not subjects_data:
-            return 0.0
-        total_points = sum(GRADE_POINTS[s["grade"]] * s["credit"] for s in subjects_data)
-        total_credits = sum(s["credit"] for s in subjects_data)
-        return total_points / total_credits if total_credits > 0 else 0.0
+        return semester_gpa(subjects_data)
 
     def get_subjects_data(self):
         """Extract subject data from UI widgets for storage."""
@@ -273,24 +258,28 @@ class SemesterDetailPage(ctk.CTkFrame):
 
     def show_error(self, text, duration=3000):
         """Display error message with auto-hide timer."""
-        if hasattr(self, 'message_timer'):
-            self.after_cancel(self.message_timer)
         self.hide_message()
         
         self.current_message = ctk.CTkLabel(
             self, text=text, text_color="white",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            fg_color="#ff4757", corner_radius=15, padx=20, pady=8
+            font=font(size=12, weight="bold"),
+            fg_color=COLORS["error_banner"], corner_radius=15, padx=20, pady=8
         )
         self.current_message.place(relx=0.5, rely=0.95, anchor="s")
         
-        self.message_timer = self.after(duration, self.hide_message)
+        self.message_timer = timers(self).call_later(duration, self.hide_message, owner=self)
     
     def hide_message(self):
         """Hide current error message and clean up timer."""
         if hasattr(self, 'message_timer'):
-            self.after_cancel(self.message_timer)
+            timers(self).cancel(self.message_timer)
             delattr(self, 'message_timer')
         if hasattr(self, 'current_message') and self.current_message:
             self.current_message.destroy()
             self.current_message = None
+
+    def destroy(self):
+        """Cancel a pending banner timer so it doesn't keep this page alive."""
+        if hasattr(self, 'message_timer'):
+            timers(self).cancel(self.message_timer)
+        super().destroy()
@@ -1,13 +1,21 @@
 import customtkinter as ctk
-from PIL import Image
 
 # Global appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
-from gpa_calculator import GPACalculatorPage
-from pomodoro import PomodoroPage
-from reminder import ReminderPage
+import importlib
+
+from diagnostics import LatencyMonitor, LeakTracker, tracing
+from shared import COLORS, Prewarmer, icon, io_pool, render_scheduler, timers
+
+# Page name -> (module, class); imported when the page is first needed
+PAGES = {
+    "gpa": ("gpa_calculator.page", "GPACalculatorPage"),
+    "pomodoro": ("pomodoro.page", "PomodoroPage"),
+    "reminder": ("reminder.page", "ReminderPage"),
+}
+
 
 class MultiToolApp(ctk.CTk):
     def __init__(self):
@@ -16,12 +24,26 @@ class MultiToolApp(ctk.CTk):
         self.geometry("360x640")
         self.resizable(False, False)
 
+        # Opt-in trace file (MULTITOOL_TRACE=trace.json), event loop latency
+        # monitor (MULTITOOL_LATENCY=log or overlay) and widget leak tracker
+        # (MULTITOOL_LEAKS=1, Ctrl+Shift+M writes a report to leaks.log)
+        tracing.enable_from_env()
+        self.latency = LatencyMonitor.from_env(self)
+        if self.latency:
+            self.watch_hot_paths(self.latency)
+        self.leaks = LeakTracker.from_env(self)
+
+        # App-wide timer queue; its cross-thread poll runs on this (the Tk) thread
+        timers(self)
+
         # Container for pages
         self.container = ctk.CTkFrame(self)
         self.container.pack(expand=True, fill="both")
 
-        # Dictionary to hold page objects
+        # Dictionary to hold page objects; the render scheduler knows which one is shown
         self.pages = {}
+        self.current_page = None
+        self.render = render_scheduler()
 
         # --- Load images ---
         self.icon_size = (28, 28)
@@ -40,7 +62,7 @@ class MultiToolApp(ctk.CTk):
             image=self.calc_icon,
             text="",
             command=lambda: self.show_page("gpa"),
-            hover_color="#1a2b4c",
+            hover_color=COLORS["accent"],
         ).grid(row=0, column=0, sticky="nsew")
 
         ctk.CTkButton(
@@ -48,7 +70,7 @@ class MultiToolApp(ctk.CTk):
             image=self.timer_icon,
             text="",
             command=lambda: self.show_page("pomodoro"),
-            hover_color="#1a2b4c",
+            hover_color=COLORS["accent"],
         ).grid(row=0, column=1, sticky="nsew")
 
         ctk.CTkButton(
@@ -56,31 +78,81 @@ class MultiToolApp(ctk.CTk):
             image=self.remind_icon,
             text="",
             command=lambda: self.show_page("reminder"),
-            hover_color="#1a2b4c",
+            hover_color=COLORS["accent"],
         ).grid(row=0, column=2, sticky="nsew")
 
-        # Start with GPA page
+        # Start with GPA page, then build the others while the app is idle
         self.show_page("gpa")
+        self.prewarm = Prewarmer(self)
+        self.prewarm.add("gpa.chart", lambda: importlib.import_module("gpa_calculator.chart"))
+        self.prewarm.add("pomodoro", lambda: self.prewarm_page("pomodoro"))
+        self.prewarm.add("reminder.import", lambda: importlib.import_module("reminder.page"))
+        self.prewarm.add("reminder", lambda: self.prewarm_page("reminder"))
+        self.prewarm.start(delay_ms=250)   # after the first paint
+
+    def watch_hot_paths(self, monitor):
+        """Name the usual suspects when the latency monitor reports a stall."""
+        from gpa_calculator import GPACalculatorPage
+        from gpa_calculator.chart import GPAChartPage
+        from pomodoro import timer_logic
+        from reminder import ReminderPage
+        from reminder.toast import ToastManager
+
+        monitor.watch(GPACalculatorPage, "save_to_excel", "load_from_excel", "_update_total_cgpa")
+        monitor.watch(GPAChartPage, "draw_chart")
+        monitor.watch(timer_logic, "countdown")
+        monitor.watch(ToastManager, "_tick")
+        monitor.watch(ReminderPage, "save_reminders", "_refresh_list", "_on_reminder_fired")
 
     def load_icon(self, path):
-        """Helper to load and resize icons as CTkImage."""
-        img = Image.open(path)
-        return ctk.CTkImage(light_image=img, dark_image=img, size=self.icon_size)
+        """Icon as a CTkImage at the navbar size (cached in shared.resources)."""
+        return icon(path, self.icon_size)
+
+    def page_class(self, page_name):
+        module, name = PAGES[page_name]
+        return getattr(importlib.import_module(module), name)
+
+    def prewarm_page(self, page_name):
+        """One idle-time step of building a page; returns True while steps remain."""
+        page = self.pages.get(page_name)
+        if page is None:
+            # Created unplaced so it doesn't cover the visible page
+            page = self.pages[page_name] = self.page_class(page_name)(self.container, defer_build=True)
+            self.render.register(page)
+            return True
+        return page.build_step()
 
     def show_page(self, page_name):
-        if page_name not in self.pages:
-            if page_name == "gpa":
-                self.pages[page_name] = GPACalculatorPage(self.container)
-            elif page_name == "pomodoro":
-                self.pages[page_name] = PomodoroPage(self.container)
-            elif page_name == "reminder":
-                self.pages[page_name] = ReminderPage(self.container)
-
-            self.pages[page_name].place(relwidth=1, relheight=1)
-
-        self.pages[page_name].lift()
+        page = self.pages.get(page_name)
+        if page is None:
+            page = self.pages[page_name] = self.page_class(page_name)(self.container)
+            self.render.register(page)
+        elif not getattr(page, "built", True):
+            page.finish_build()   # clicked before the prewarm got to it
+        page.place(relwidth=1, relheight=1)
+        page.lift()
+        self.set_page_visible(page_name)
+
+    def set_page_visible(self, page_name):
+        """
+        Visibility API: mark `page_name` shown and every other page hidden.
+        Pages get `on_shown()` / `on_hidden()` calls if they define them, and
+        drawing deferred while hidden is caught up in one pass on show.
+        """
+        self.current_page = page_name
+        for name, page in self.pages.items():
+            if name != page_name:
+                self.render.set_visible(page, False)
+        self.render.set_visible(self.pages[page_name], True)
 
 
 if __name__ == "__main__":
     app = MultiToolApp()
     app.mainloop()
+    # Let saves still queued on the I/O pool reach the disk
+    io_pool().shutdown(wait=True)
+    if app.latency:
+        app.latency.stop()
+        print(timers(app).report())
+    if app.leaks:
+        app.leaks.stop()
@@ -1,2 +1,10 @@
 # pomodoro/__init__.py
-from .page import PomodoroPage
+# The page (and with it customtkinter) is imported on first use, so the
+# timer logic can be driven without a GUI (e.g. by the benchmarks).
+
+
+def __getattr__(name):
+    if name == "PomodoroPage":
+        from .page import PomodoroPage
+        return PomodoroPage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,13 @@
 import tkinter as tk
 import customtkinter as ctk
+from shared import COLORS, IncrementalBuild, font
+
 from .constants import THEME
 from .timer_logic import start_timer, reset_timer, pause_timer, resume_timer, is_paused
 
 
-class PomodoroPage(ctk.CTkFrame):
-    def __init__(self, parent):
+class PomodoroPage(IncrementalBuild, ctk.CTkFrame):
+    def __init__(self, parent, defer_build=False):
         self.current_theme = THEME
         super().__init__(parent, width=360, height=640, fg_color=self.current_theme["bg"])
 
@@ -18,21 +20,21 @@ class PomodoroPage(ctk.CTkFrame):
         self.grid_rowconfigure(list(range(9)), weight=1)
         self.grid_columnconfigure(list(range(3)), weight=1)
 
-        # Build UI
-        self.build_ui()
-
+        # Build UI (the app builds it a section at a time while idle)
+        self.start_build(defer_build)
 
-    def build_ui(self):
+    def build_steps(self):
 
         # Mode Label
         self.mode_label = ctk.CTkLabel(
             self,
             text="🕓 Ready?",
             text_color=self.current_theme["text"],
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=font(size=22, weight="bold"),
         )
         self.mode_label.grid(column=0, row=0, columnspan=3, pady=(10, 0), sticky="n")
 
+        yield
         # Canvas Timer
         self.canvas = tk.Canvas(
             self,
@@ -68,16 +70,17 @@ class PomodoroPage(ctk.CTkFrame):
             110,
             text="00:00",
             fill=self.current_theme["text"],
-            font=ctk.CTkFont(size=34, weight="bold"),
+            font=font(size=34, weight="bold"),
         )
         self.canvas.grid(column=0, row=1, columnspan=3, pady=(5, 5))
 
+        yield
         # Labels & Inputs
         self.work_label = ctk.CTkLabel(
             self,
             text="Focus (min)",
             text_color=self.current_theme["text"],
-            font=ctk.CTkFont(size=10),
+            font=font(size=10),
         )
         self.work_label.grid(column=0, row=2, pady=(2, 0))
         self.work_entry = ctk.CTkEntry(
@@ -96,7 +99,7 @@ class PomodoroPage(ctk.CTkFrame):
             self,
             text="Break (min)",
             text_color=self.current_theme["text"],
-            font=ctk.CTkFont(size=10),
+            font=font(size=10),
         )
         self.break_label.grid(column=2, row=2, pady=(2, 0))
         self.break_entry = ctk.CTkEntry(
@@ -111,11 +114,12 @@ class PomodoroPage(ctk.CTkFrame):
         self.break_entry.insert(0, "5")
         self.break_entry.grid(column=2, row=3, pady=(0, 2))
 
+        yield
         # Buttons
         self.start_button = ctk.CTkButton(
             self,
             text="🚀 FOCUS",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=font(size=10, weight="bold"),
             fg_color=self.current_theme["button_bg"],
             text_color=self.current_theme["button_fg"],
             hover_color=self.current_theme["button_bg_hover"],
@@ -143,10 +147,10 @@ class PomodoroPage(ctk.CTkFrame):
         self.pause_button = ctk.CTkButton(
             self,
             text="⏸ PAUSE",
-            font=ctk.CTkFont(size=10, weight="bold"),
-            fg_color="#4A90E2",
+            font=font(size=10, weight="bold"),
+            fg_color=COLORS["primary"],
             text_color="white",
-            hover_color="#357ABD",
+            hover_color=COLORS["primary_hover"],
             width=70,
             height=28,
             corner_radius=8,
@@ -158,17 +162,17 @@ class PomodoroPage(ctk.CTkFrame):
 
             if not is_paused:
                 pause_timer()
-                self.pause_button.configure(text="▶ RESUME", fg_color="#4A90E2", text_color="white")
+                self.pause_button.configure(text="▶ RESUME", fg_color=COLORS["primary"], text_color="white")
             else:
                 resume_timer()
-                self.pause_button.configure(text="⏸ PAUSE", fg_color="#4A90E2", text_color="white")
+                self.pause_button.configure(text="⏸ PAUSE", fg_color=COLORS["primary"], text_color="white")
 
         self.pause_button.configure(command=toggle_pause)
 
         self.reset_button = ctk.CTkButton(
             self,
             text="🔄 RESET",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=font(size=10, weight="bold"),
             fg_color=self.current_theme["reset_bg"],
             text_color=self.current_theme["reset_fg"],
             hover_color=self.current_theme["reset_bg_hover"],
@@ -193,12 +197,13 @@ class PomodoroPage(ctk.CTkFrame):
         )
         self.reset_button.grid(column=2, row=4, pady=(15, 5), padx=(5, 10))
 
+        yield
         # Info Labels
         self.quote_label = ctk.CTkLabel(
             self,
             text="Let's begin a session.",
             text_color=self.current_theme["text"],
-            font=ctk.CTkFont(size=11, slant="italic"),
+            font=font(size=11, slant="italic"),
             wraplength=300,
         )
         self.quote_label.grid(column=0, row=5, columnspan=3, pady=(5, 5))
@@ -207,7 +212,7 @@ class PomodoroPage(ctk.CTkFrame):
             self,
             text="Completed Focus Sessions: 0",
             text_color=self.current_theme["text"],
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=font(size=10, weight="bold"),
         )
         self.session_label.grid(column=0, row=6, columnspan=3, pady=2)
 
@@ -215,7 +220,7 @@ class PomodoroPage(ctk.CTkFrame):
             self,
             text="Total Focus Minutes: 0",
             text_color=self.current_theme["text"],
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=font(size=10, weight="bold"),
         )
         self.minutes_label.grid(column=0, row=7, columnspan=3, pady=2)
 
@@ -223,7 +228,7 @@ class PomodoroPage(ctk.CTkFrame):
             self,
             text="",
             text_color=self.current_theme["arc"],
-            font=ctk.CTkFont(size=14),
+            font=font(size=14),
         )
         self.check_marks.grid(column=1, row=8, pady=2)
 
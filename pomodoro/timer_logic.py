@@ -1,6 +1,9 @@
 import math
 import random
 import tkinter.messagebox as messagebox
+
+from diagnostics.tracing import traced
+from shared import render_scheduler, timers
 from .constants import (
     DEFAULT_WORK_MIN,
     DEFAULT_BREAK_MIN,
@@ -36,6 +39,18 @@ skipped_current = False
 skipped_elapsed_seconds = 0
 
 
+def _draw_clock(canvas, timer_text, progress_arc):
+    """Draw the current time_left; deferred while the Pomodoro page is hidden."""
+    def draw():
+        minutes = math.floor(time_left / 60)
+        seconds = time_left % 60
+        canvas.itemconfig(timer_text, text=f"{minutes:02}:{seconds:02}")
+        if total_time > 0:
+            canvas.itemconfig(progress_arc, extent=(1 - time_left / total_time) * 360)
+
+    render_scheduler().render(canvas, "pomodoro.clock", draw)
+
+
 def reset_timer(
     window,
     canvas,
@@ -53,7 +68,7 @@ def reset_timer(
 ):
     global reps, timer, is_paused, time_left, completed_focus_sessions, total_focus_minutes
     if timer:
-        window.after_cancel(timer)
+        timers(window).cancel(timer)
         timer = None  # clear leftover callback
 
     reps = 0
@@ -62,8 +77,10 @@ def reset_timer(
     completed_focus_sessions = 0
     total_focus_minutes = 0
 
-    canvas.itemconfig(timer_text, text="00:00")
-    canvas.itemconfig(progress_arc, extent=0)
+    def draw():
+        canvas.itemconfig(timer_text, text="00:00")
+        canvas.itemconfig(progress_arc, extent=0)
+    render_scheduler().render(canvas, "pomodoro.clock", draw)
     mode_label.configure(text="🕓 Ready?", text_color=theme["text"])
     quote_label.configure(text="Let's begin a session.")
     check_marks.configure(text="")
@@ -120,7 +137,7 @@ def start_timer(
 
     # Cancel any old timer
     if timer:
-        window.after_cancel(timer)
+        timers(window).cancel(timer)
         timer = None
 
     # ✅ Change to Skip button
@@ -211,10 +228,7 @@ def start_timer(
 
     # ✅ Initialize display cleanly (no 00:00 flash)
     time_left = total_time
-    minutes = time_left // 60
-    seconds = time_left % 60
-    canvas.itemconfig(timer_text, text=f"{minutes:02}:{seconds:02}")
-    canvas.itemconfig(progress_arc, extent=0)
+    _draw_clock(canvas, timer_text, progress_arc)
 
     # Start countdown loop
     countdown(
@@ -235,6 +249,7 @@ def start_timer(
     )
 
 
+@traced(cat="pomodoro")
 def countdown(
     window,
     canvas,
@@ -255,13 +270,7 @@ def countdown(
 
     if not is_paused and time_left >= 0:
         # Update display
-        minutes = math.floor(time_left / 60)
-        seconds = time_left % 60
-        canvas.itemconfig(timer_text, text=f"{minutes:02}:{seconds:02}")
-
-        if total_time > 0:
-            progress = (1 - time_left / total_time) * 360
-            canvas.itemconfig(progress_arc, extent=progress)
+        _draw_clock(canvas, timer_text, progress_arc)
 
         if time_left == 0:
             # Finished session
@@ -320,7 +329,7 @@ def countdown(
                     start_button,
                 )
 
-            timer = window.after(1000, tick)
+            timer = timers(window).call_later(1000, tick)
 
 
 def decrement_and_continue(
@@ -364,7 +373,7 @@ def pause_timer():
     # Cancel any pending tick so time doesn't decrement while paused
     if window_ref is not None and timer is not None:
         try:
-            window_ref.after_cancel(timer)
+            timers(window_ref).cancel(timer)
         except Exception:
             pass
         timer = None
@@ -375,7 +384,7 @@ def resume_timer():
     if is_paused and time_left > 0:
         if timer and window_ref is not None:
             try:
-                window_ref.after_cancel(timer)
+                timers(window_ref).cancel(timer)
             except Exception:
                 pass
         is_paused = False
@@ -402,7 +411,7 @@ def skip_current_session():
     global time_left, timer, skipped_current, skipped_elapsed_seconds
     if window_ref is not None and timer is not None:
         try:
-            window_ref.after_cancel(timer)
+            timers(window_ref).cancel(timer)
         except Exception:
             pass
         timer = None
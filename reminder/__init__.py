@@ -1,2 +1,10 @@
 # reminder/__init__.py
-from .page import ReminderPage
+# The widgets over core.reminders. The page (and with it customtkinter) is
+# imported on first use, so importing this package stays cheap.
+
+
+def __getattr__(name):
+    if name == "ReminderPage":
+        from .page import ReminderPage
+        return ReminderPage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,95 @@
+from diagnostics.tracing import traced
+from shared import timers
+
+
+class _Group:
+    """Reminder firings that will be shown together in one toast."""
+    def __init__(self):
+        self.reminders = []
+        self.messages = []
+
+    def add(self, reminder, message):
+        self.reminders.append(reminder)
+        self.messages.append(message)
+
+    def merge(self, other):
+        self.reminders.extend(other.reminders)
+        self.messages.extend(other.messages)
+
+    def title(self):
+        count = len(self.reminders)
+        return "⏰ Reminder" if count == 1 else f"⏰ {count} Reminders"
+
+    def body(self, max_items=2):
+        if len(self.messages) == 1:
+            return self.messages[0]
+        shown = [f"• {m}" for m in self.messages[:max_items]]
+        extra = len(self.messages) - max_items
+        if extra > 0:
+            shown.append(f"+{extra} more")
+        return "\n".join(shown)
+
+
+class NotificationQueue:
+    """
+    Turns reminder firings into toasts.
+
+    Firings that arrive within `window_ms` of each other are coalesced into a
+    single summary toast, at most `max_visible` toasts are on screen at once,
+    and anything beyond that waits in a bounded queue (overflowing groups are
+    merged into the last queued one).
+    """
+    def __init__(self, toasts, on_close, on_present=None, on_snooze=None,
+                 window_ms=300, max_visible=3, max_queued=10):
+        self.toasts = toasts
+        self.on_close = on_close          # on_close(reminders, user_dismissed)
+        self.on_snooze = on_snooze        # on_snooze(reminders, minutes or None for custom)
+        self.on_present = on_present      # on_present(group_size), e.g. play a sound
+        self.window_ms = window_ms
+        self.max_visible = max_visible
+        self.max_queued = max_queued
+        self._collecting = None
+        self._flush_id = None
+        self._queue = []
+
+    def push(self, reminder, message):
+        """Record a firing; must be called on the Tk thread."""
+        if self._collecting is None:
+            self._collecting = _Group()
+            self._flush_id = timers(self.toasts.parent).call_later(self.window_ms, self._flush)
+        self._collecting.add(reminder, message)
+
+    def pending_count(self):
+        queued = sum(len(g.reminders) for g in self._queue)
+        return queued + (len(self._collecting.reminders) if self._collecting else 0)
+
+    def _flush(self):
+        self._flush_id = None
+        group, self._collecting = self._collecting, None
+        if not group:
+            return
+        if len(self._queue) >= self.max_queued:
+            self._queue[-1].merge(group)
+        else:
+            self._queue.append(group)
+        self._drain()
+
+    def _drain(self):
+        while self._queue and self.toasts.visible_count() < self.max_visible:
+            self._present(self._queue.pop(0))
+
+    @traced(cat="reminder")
+    def _present(self, group):
+        if self.on_present:
+            self.on_present(len(group.reminders))
+
+        def closed(user):
+            self.on_close(group.reminders, user)
+            self._drain()
+
+        def snoozed(minutes):
+            self.on_snooze(group.reminders, minutes)
+            self._drain()
+
+        self.toasts.show(group.title(), group.body(), on_close=closed,
+                         on_snooze=snoozed if self.on_snooze else None)
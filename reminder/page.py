@@ -1,57 +1,65 @@
 ﻿import customtkinter as ctk
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 from tkcalendar import Calendar
 from datetime import datetime, timedelta
-import json
+import io
 import os
 import threading
 import time
 
+from core.reminders import ReminderService, bulk, ics
+from core.reminders.recurrence import (
+    DAILY, MINUTELY, MONTHLY, MONTHLY_NTH, WEEKDAYS, WEEKLY, RecurrenceRule,
+)
+from diagnostics.tracing import traced
+from shared import IncrementalBuild, font, io_pool, render_scheduler, timers
 
-class Reminder:
-    """
-    Handles scheduling and displaying reminders.
-    """
-    def __init__(self, message, remind_time, repeat=False, interval_minutes=0, callback=None):
-        self.message = message
-        self.remind_time = remind_time
-        self.repeat = repeat
-        self.interval = timedelta(minutes=interval_minutes)
-        self.callback = callback  # Function to call for UI updates
-        self._stop_event = threading.Event()
-        self.thread = None
-
-    def start(self):
-        def run():
-            while not self._stop_event.is_set():
-                now = datetime.now()
-                wait_seconds = (self.remind_time - now).total_seconds()
-                if wait_seconds > 0:
-                    time.sleep(min(wait_seconds, 1))
-                    continue
-                if self.callback:
-                    self.callback(self, self.message)
-                if self.repeat:
-                    self.remind_time += self.interval
-                else:
-                    break
-        self.thread = threading.Thread(target=run, daemon=True)
-        self.thread.start()
+from .notifications import NotificationQueue
+from .reminder_list import VirtualReminderList
+from .toast import ToastManager
 
-    def stop(self):
-        self._stop_event.set()
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1)
+# Repeat menu label -> (recurrence frequency, unit shown after "every N")
+REPEAT_MODES = {
+    "Minutes": (MINUTELY, "minutes"),
+    "Days": (DAILY, "days"),
+    "Weekdays": (WEEKDAYS, ""),
+    "Weeks": (WEEKLY, "weeks"),
+    "Months (same date)": (MONTHLY, "months"),
+    "Months (same weekday)": (MONTHLY_NTH, "months"),
+}
 
 
-class ReminderPage(ctk.CTkFrame):
+def _read_text(path, newline=None):
+    with open(path, "r", encoding="utf-8-sig", newline=newline) as f:
+        return f.read()
+
+
+class ReminderPage(IncrementalBuild, ctk.CTkFrame):
     """
     The main page for setting reminders.
     """
-    def __init__(self, parent):
+    def __init__(self, parent, defer_build=False):
         super().__init__(parent)
-        self._storage_path = os.path.join(os.path.dirname(__file__), "reminders.json")
+        self.start_build(defer_build)
+
+    def build_steps(self):
+        """Build the page section by section (the app prewarms it in idle time)."""
+        # Store, scheduler, search, persistence and history; this page only draws them
+        self.service = ReminderService(
+            os.path.dirname(__file__), callback=self.show_reminder,
+            io=lambda key, write: io_pool().submit(write, key=key),
+        )
+        self.service.history.compact_async()
+        self._history_win = None
+        self._bulk_win = None
+        self._cal_win = None    # date picker popup, built on first use and reused
+        self._calendar = None
+        self._cal_events = {}   # date -> tkcalendar event id marking reminders due that day
+        self._loading = False   # reminders.json is being read; saves wait for it
+        self._save_after_load = False
+        self._due_watch = None  # timer handle for the next `_expect_firing`
+        self._due_held = False  # the app timer queue is polling for a firing
 
         # Main scrollable area (themed)
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
@@ -63,6 +71,7 @@ class ReminderPage(ctk.CTkFrame):
             font=("Helvetica", 18, "bold"),
         ).pack(pady=10)
 
+        yield
         # Reminder message input
         ctk.CTkLabel(self.scrollable_frame, text="Reminder Message:").pack()
         self.msg_entry = ctk.CTkEntry(self.scrollable_frame, width=300, placeholder_text="What should I remind you?")
@@ -112,6 +121,7 @@ class ReminderPage(ctk.CTkFrame):
         self.date_entry.bind('<KeyRelease>', format_date)
         ctk.CTkButton(date_row, text="📅", width=40, command=self.open_calendar).pack(side="left")
 
+        yield
         # Time picker (simple entry fields)
         ctk.CTkLabel(self.scrollable_frame, text="Time:").pack()
         time_frame = ctk.CTkFrame(self.scrollable_frame)
@@ -166,6 +176,7 @@ class ReminderPage(ctk.CTkFrame):
         self.ampm_combo.pack(side="left", padx=(5, 0))
 
 
+        yield
         # Remind after (minutes) input
         ctk.CTkLabel(self.scrollable_frame, text="Remind After (minutes):").pack()
 
@@ -177,35 +188,68 @@ class ReminderPage(ctk.CTkFrame):
         self.minutes_entry.configure(validate="key", validatecommand=(vcmd, "%P"))
         self.minutes_entry.pack(pady=5)
 
+        yield
         # Repeat checkbox and interval
         self.repeat_var = tk.BooleanVar()
         repeat_frame = ctk.CTkFrame(self.scrollable_frame)
         repeat_frame.pack(pady=5)
         ctk.CTkCheckBox(repeat_frame, text="Repeat", variable=self.repeat_var, command=self._on_repeat_toggle).pack(side="left")
-        ctk.CTkLabel(repeat_frame, text="every").pack(side="left", padx=(10, 0))
+        self.repeat_mode_var = tk.StringVar(value="Minutes")
+        self.repeat_mode_menu = ctk.CTkOptionMenu(
+            repeat_frame, variable=self.repeat_mode_var, values=list(REPEAT_MODES),
+            width=150, command=lambda _: self._on_repeat_toggle(),
+        )
+        self.repeat_mode_menu.pack(side="left", padx=(10, 0))
+
+        interval_frame = ctk.CTkFrame(self.scrollable_frame)
+        interval_frame.pack(pady=5)
+        ctk.CTkLabel(interval_frame, text="every").pack(side="left", padx=(10, 0))
         # Validation for repeat interval: positive integers only
         self._repeat_vcmd = self.register(_validate_positive)
-        self.repeat_interval_entry = ctk.CTkEntry(repeat_frame, width=60, placeholder_text="min")
+        self.repeat_interval_entry = ctk.CTkEntry(interval_frame, width=60, placeholder_text="min")
         self.repeat_interval_entry.configure(validate="key", validatecommand=(self._repeat_vcmd, "%P"))
         self.repeat_interval_entry.pack(side="left", padx=5)
-        ctk.CTkLabel(repeat_frame, text="minutes").pack(side="left")
+        self.repeat_unit_label = ctk.CTkLabel(interval_frame, text="minutes")
+        self.repeat_unit_label.pack(side="left")
+
+        # Optional end of the repeat: a number of times and/or a last date
+        end_frame = ctk.CTkFrame(self.scrollable_frame)
+        end_frame.pack(pady=5)
+        ctk.CTkLabel(end_frame, text="ends after").pack(side="left", padx=(10, 0))
+        self.repeat_count_entry = ctk.CTkEntry(end_frame, width=50, placeholder_text="times")
+        self.repeat_count_entry.configure(validate="key", validatecommand=(self._repeat_vcmd, "%P"))
+        self.repeat_count_entry.pack(side="left", padx=5)
+        ctk.CTkLabel(end_frame, text="or on").pack(side="left")
+        self.repeat_until_entry = ctk.CTkEntry(end_frame, width=100, placeholder_text="yyyy-mm-dd")
+        self.repeat_until_entry.pack(side="left", padx=5)
         # Initialize repeat interval disabled by default
         self._on_repeat_toggle()
 
         # Add Reminder button
         ctk.CTkButton(self.scrollable_frame, text="Set Reminder", command=self.add_reminder).pack(pady=10)
 
+        yield
         # Reminders section with border (card)
         reminders_card = ctk.CTkFrame(self.scrollable_frame, corner_radius=12, border_width=1)
         reminders_card.pack(pady=8, padx=8, fill="x")
-        ctk.CTkLabel(reminders_card, text="Your Reminders:", font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", padx=10, pady=(8, 0))
-        self.reminder_list = ctk.CTkScrollableFrame(reminders_card, height=180)
+        ctk.CTkLabel(reminders_card, text="Your Reminders:", font=font(size=13, weight="bold")).pack(anchor="w", padx=10, pady=(8, 0))
+        self.reminders = self.service.store   # Reminder instances sorted by next due time
+        self.scheduler = self.service.scheduler
+        self.selected_ids = set()             # ids of ticked reminders
+
+        self.search_var = tk.StringVar()
+        self.search_entry = ctk.CTkEntry(
+            reminders_card, textvariable=self.search_var,
+            placeholder_text='Search, e.g. "exam" or "next 7 days"',
+        )
+        self.search_entry.pack(padx=8, pady=(6, 0), fill="x")
+        self.search_entry.bind("<KeyRelease>", lambda e: self._refresh_list())
+        self.reminder_list = VirtualReminderList(
+            reminders_card, self.reminders, self.selected_ids,
+            on_toggle=self.update_delete_button_state, height=180,
+        )
         self.reminder_list.pack(padx=8, pady=8, fill="x")
 
-        self.reminder_vars = []      # BooleanVar for each reminder
-        self.reminder_widgets = []   # Checkbutton widget for each reminder row
-        self.reminders = []          # (Reminder instance, display_text)
-
         # Delete button for selected reminders
         self.delete_btn = ctk.CTkButton(
             self.scrollable_frame,
@@ -215,19 +259,79 @@ class ReminderPage(ctk.CTkFrame):
         )
         self.delete_btn.pack(pady=8)
 
+        yield
+        # iCalendar import / export
+        ics_row = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+        ics_row.pack(pady=(0, 8))
+        ctk.CTkButton(ics_row, text="Import .ics", width=110, command=self.import_ics).pack(side="left", padx=5)
+        ctk.CTkButton(ics_row, text="Export .ics", width=110, command=self.export_ics).pack(side="left", padx=5)
+        ctk.CTkButton(ics_row, text="History", width=110, command=self.open_history).pack(side="left", padx=5)
+        ctk.CTkButton(self.scrollable_frame, text="Bulk Add...", command=self.open_bulk_add).pack(pady=(0, 8))
+
+        # Toasts for due reminders; bursts are coalesced and rate limited
+        self._toasts = ToastManager(self.winfo_toplevel())
+        self._notifications = NotificationQueue(
+            self._toasts,
+            on_close=self._on_toast_closed,
+            on_present=self._play_notification_sound,
+            on_snooze=self._on_toast_snoozed,
+        )
+
+        yield
         # Load saved reminders from disk
         self.load_reminders()
 
     def show_reminder(self, reminder, message):
-        self.after(0, lambda: self._show_toast_notification(reminder, message))
+        # Called on the scheduler thread; hand over to the Tk thread
+        timers(self).call_soon(lambda: self._on_reminder_fired(reminder, message), owner=self)
+
+    @traced(cat="reminder")
+    def _on_reminder_fired(self, reminder, message):
+        # Repeating reminders have moved on to their next due time
+        if self.service.fired(reminder):
+            render_scheduler().render(self, "list", self._refresh_list)
+        self._notifications.push(reminder, message)
+        self._watch_due()
+
+    # The scheduler thread can't wake the Tk thread, so the app timer queue
+    # polls for its hand-over, but only from just before a due time until a
+    # little after it
+    DUE_GRACE_MS = 2000
+
+    def _watch_due(self):
+        """Plan the next polling window for the earliest pending reminder (after any change)."""
+        if self._due_held:
+            return   # the current window re-plans when it ends
+        service = timers(self)
+        service.cancel(self._due_watch)
+        self._due_watch = None
+        recent = time.time() - self.DUE_GRACE_MS / 1000
+        for reminder in self.reminders:   # due order; skip what is over or already overdue
+            if reminder.stopped or reminder.finished or reminder.due_ts < recent:
+                continue
+            delay = (reminder.due_ts - time.time()) * 1000 - service.poll_ms
+            self._due_watch = service.call_later(max(0, delay), self._expect_firing, owner=self)
+            return
 
-    # --- Phone-like toast notification ---
-    def _show_toast_notification(self, reminder, message):
-        if not hasattr(self, "_active_toasts"):
-            self._active_toasts = []
+    def _expect_firing(self):
+        service = timers(self)
+        service.hold()
+        self._due_held = True
 
-        parent = self.winfo_toplevel()
+        def done():
+            # Not tied to the page as owner: the hold must be released either way
+            service.release()
+            self._due_held = False
+            try:
+                alive = self.winfo_exists()
+            except Exception:
+                alive = False
+            if alive:
+                self._watch_due()
+        self._due_watch = service.call_later(service.poll_ms + self.DUE_GRACE_MS, done)
 
+    # --- Phone-like toast notification ---
+    def _play_notification_sound(self, count=1):
         # Play notification sound (non-blocking if possible)
         try:
             import sys
@@ -235,229 +339,270 @@ class ReminderPage(ctk.CTkFrame):
                 import winsound
                 winsound.MessageBeep(winsound.MB_ICONASTERISK) if hasattr(winsound, 'MessageBeep') else winsound.Beep(1000, 120)
             else:
-                parent.bell()
-        except Exception:
-            pass
-
-        toast = ctk.CTkToplevel(parent)
-        toast.overrideredirect(True)
-        try:
-            toast.attributes("-topmost", True, "-alpha", 0.0)
+                self.bell()
         except Exception:
             pass
 
-        # Content
-        container = ctk.CTkFrame(toast, corner_radius=14)
-        container.pack(fill="both", expand=True, padx=2, pady=2)
-        title = ctk.CTkLabel(container, text="⏰ Reminder", font=ctk.CTkFont(size=14, weight="bold"))
-        title.pack(anchor="w", padx=14, pady=(12, 2))
-        body = ctk.CTkLabel(container, text=message, wraplength=260, font=ctk.CTkFont(size=12))
-        body.pack(anchor="w", padx=14, pady=(0, 10))
-        btn_row = ctk.CTkFrame(container)
-        btn_row.pack(fill="x", padx=10, pady=(0, 10))
-        dismiss_btn = ctk.CTkButton(btn_row, text="Dismiss", width=90, command=lambda: _close(True))
-        dismiss_btn.pack(side="right", padx=6)
-
-        # Geometry: bottom-right inside the app window, stack upward
-        parent.update_idletasks()
-        px = parent.winfo_rootx()
-        py = parent.winfo_rooty()
-        pw = parent.winfo_width()
-        ph = parent.winfo_height()
-
-        width = 300
-        height = 110
-        gap = 8
-        margin = 16
-        stack_index = len(self._active_toasts)
-        x = px + pw - width - margin
-        target_y = py + ph - (height + margin) - stack_index * (height + gap)
-
-        # Start slightly below (for slide-up)
-        start_y = target_y + 30
-        toast.geometry(f"{width}x{height}+{x}+{start_y}")
-
-        # Track
-        record = {"win": toast, "target_y": target_y, "x": x, "height": height}
-        self._active_toasts.append(record)
-
-        # Slide + fade-in animation
-        def animate_step(alpha=0.0, y=start_y):
+    def _on_toast_closed(self, reminders, user):
+        # If user dismissed, cancel the reminders and remove from list (both repeating and non-repeating)
+        # For auto-close, only remove non-repeating reminders (repeating ones should continue)
+        finished = [r for r in reminders if user or not r.repeat or r.finished]
+        if user:
+            self.service.dismissed(reminders)
+        self._remove_reminder_instances(finished)
+
+    def _on_toast_snoozed(self, reminders, minutes):
+        if minutes is None:
+            answer = ctk.CTkInputDialog(text="Snooze for how many minutes?", title="Snooze").get_input()
             try:
-                toast.geometry(f"{width}x{height}+{x}+{int(y)}")
-                toast.attributes("-alpha", alpha)
-            except Exception:
+                minutes = int(answer)
+                if minutes <= 0:
+                    raise ValueError
+            except (TypeError, ValueError):
+                # Cancelled or invalid: behave as if the toast had closed by itself
+                self._on_toast_closed(reminders, False)
                 return
 
-            if alpha < 1.0 or y > target_y:
-                alpha = min(1.0, alpha + 0.12)
-                y = max(target_y, y - 8)
-                parent.after(16, lambda: animate_step(alpha, y))
-            else:
-                schedule_auto_close()
-
-        def schedule_auto_close():
-            toast.bind("<Enter>", lambda e: cancel_auto_close())
-            toast.bind("<Leave>", lambda e: schedule_again())
-            record["auto_id"] = parent.after(4500, lambda: _close(False))
-
-        def cancel_auto_close():
-            aid = record.get("auto_id")
-            if aid:
-                parent.after_cancel(aid)
-                record["auto_id"] = None
-
-        def schedule_again():
-            cancel_auto_close()
-            record["auto_id"] = parent.after(2000, lambda: _close(False))
-
-        def _close(user):
-            # If user dismissed, cancel the reminder and remove from list (both repeating and non-repeating)
-            if user:
-                reminder.stop()
-                self._remove_reminder_instance(reminder)
-            else:
-                # For auto-close, only remove non-repeating reminders (repeating ones should continue)
-                if not getattr(reminder, "repeat", False):
-                    reminder.stop()
-                    self._remove_reminder_instance(reminder)
-            cancel_auto_close()
-
-            # Fade-out and slide-down
-            def fade_out(alpha=1.0, y=target_y):
-                try:
-                    toast.attributes("-alpha", alpha)
-                    toast.geometry(f"{width}x{height}+{x}+{int(y)}")
-                except Exception:
-                    return _cleanup()
-                if alpha > 0.0:
-                    alpha = max(0.0, alpha - 0.15)
-                    y = y + 10
-                    parent.after(16, lambda: fade_out(alpha, y))
-                else:
-                    _cleanup()
-
-            def _cleanup():
-                toast.destroy()
-                if record in self._active_toasts:
-                    idx = self._active_toasts.index(record)
-                    self._active_toasts.pop(idx)
-                    _restack(idx)
-
-            fade_out()
-
-        def _restack(start_idx):
-            for i in range(start_idx, len(self._active_toasts)):
-                rec = self._active_toasts[i]
-                rec["target_y"] = rec["target_y"] + height + gap
-                _animate_to(rec)
-
-        def _animate_to(rec):
-            tw = rec["win"]
-            tx = rec["x"]
-            ty = rec["target_y"]
-            try:
-                geo = tw.geometry()
-                parts = geo.split("+")
-                cy = int(parts[-1]) if len(parts) >= 3 else ty
-            except Exception:
-                return
+        self.service.snooze(reminders, datetime.now() + timedelta(minutes=minutes))
+        self._refresh_list()
+        self._watch_due()
 
-            if cy < ty:
-                ny = min(ty, cy + 12)
-                try:
-                    tw.geometry(f"{width}x{height}+{tx}+{int(ny)}")
-                except Exception:
-                    return
-                parent.after(16, lambda: _animate_to(rec))
-            else:
-                tw.geometry(f"{width}x{height}+{tx}+{int(ty)}")
+    def _remove_reminder_instances(self, reminder_instances):
+        removed = self.service.remove_many(reminder_instances)
+        self.selected_ids.difference_update(removed)
 
-        animate_step()
+        if removed:
+            self._refresh_list()
+            self.update_delete_button_state()
+            self.save_reminders()
 
     def _remove_reminder_instance(self, reminder_instance):
-        try:
-            idx = next(i for i, (r, _) in enumerate(self.reminders) if r is reminder_instance)
-        except StopIteration:
-            return
-        
-        # Stop and remove reminder
-        reminder, _ = self.reminders[idx]
-        reminder.stop()
-        self.reminders.pop(idx)
-        
-        # Remove UI elements
-        self.reminder_vars.pop(idx)
-        checkbox = self.reminder_widgets.pop(idx)
-        checkbox.destroy()
-        
-        self.update_delete_button_state()
-        self.save_reminders()
+        self._remove_reminder_instances([reminder_instance])
 
     # --- UI helpers & persistence ---
-    def _add_ui_row(self, display_text):
-        var = tk.BooleanVar()
-        cb = ctk.CTkCheckBox(
-            self.reminder_list,
-            text=display_text,
-            variable=var,
-            command=self.update_delete_button_state
-        )
-        cb.pack(side="top", anchor="w", padx=2, pady=4)
-        self.reminder_vars.append(var)
-        self.reminder_widgets.append(cb)
+    def _refresh_list(self):
+        """Show the whole store, or the current search results if there is a query."""
+        query = self.search_var.get().strip()
+        if query:
+            self.reminder_list.set_source(self.service.search(query))
+        else:
+            self.reminder_list.set_source(self.reminders)
+        self._sync_calendar_events()
 
     def save_reminders(self):
-        try:
-            data = [{
-                "message": r.message,
-                "remind_time": r.remind_time.isoformat(),
-                "repeat": r.repeat,
-                "interval_minutes": int(r.interval.total_seconds() // 60) if r.repeat else 0,
-            } for r, _ in self.reminders]
-            os.makedirs(os.path.dirname(self._storage_path), exist_ok=True)
-            with open(self._storage_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+        """Write the store on the I/O pool; a burst of saves writes the file once."""
+        if self._loading:
+            self._save_after_load = True   # saving now would drop what is being loaded
+            return
+        storage = self.service.storage
+        io_pool().submit(storage.write, self.service.dump(), key=storage.path, coalesce=True)
+        self._watch_due()   # every change to the store ends in a save
 
     def load_reminders(self):
+        """Read reminders.json on the I/O pool, then add them here on the Tk thread."""
+        self._loading = True
+        io_pool().submit(
+            self.service.read, key=self.service.storage.path, widget=self,
+            on_done=self._on_reminders_loaded,
+            on_error=lambda e: self._on_reminders_loaded([]),
+        )
+
+    def _on_reminders_loaded(self, loaded):
+        self._loading = False
+        self.service.restore(loaded)
+        render_scheduler().render(self, "list", self._refresh_list)
+        self._watch_due()
+        if self._save_after_load:
+            self._save_after_load = False
+            self.save_reminders()
+
+    # --- iCalendar import / export ---
+    ICS_BATCH = 1000  # events parsed and added per event-loop turn
+    ICS_AHEAD = 2     # batches the parser may get ahead of the Tk thread
+
+    def import_ics(self):
+        path = filedialog.askopenfilename(
+            title="Import reminders", filetypes=[("iCalendar", "*.ics"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        stats = {"added": 0, "skipped": 0}
+        room = threading.Semaphore(self.ICS_AHEAD)
+
+        def parse():
+            """Stream the file on an I/O worker, handing over one batch of events at a time."""
+            with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+                batch = []
+                for event in ics.iter_events(f):
+                    batch.append(event)
+                    if len(batch) == self.ICS_BATCH:
+                        if not room.acquire(timeout=30):
+                            raise RuntimeError("import stopped: the reminder page is not responding")
+                        timers(self).call_soon(lambda b=batch: self._import_ics_batch(b, stats, room), owner=self)
+                        batch = []
+                return batch
+
+        io_pool().submit(
+            parse, key=path, widget=self,
+            on_done=lambda rest: self._import_ics_done(rest, stats),
+            on_error=lambda e: self._import_ics_done([], stats, e),
+        )
+
+    def _import_ics_batch(self, events, stats, room=None):
+        """Add one batch of parsed events (Tk thread); events that can't be read are skipped."""
         try:
-            if not os.path.exists(self._storage_path):
-                return
-            with open(self._storage_path, "r", encoding="utf-8") as f:
-                items = json.load(f)
-        except Exception:
+            now = datetime.now()
+            batch = []
+            for event in events:
+                try:
+                    reminder = self.service.from_event(event, now)
+                except ValueError:   # e.g. an RRULE with INTERVAL=0
+                    reminder = None
+                if reminder is None:
+                    stats["skipped"] += 1
+                else:
+                    batch.append(reminder)
+            if batch:
+                self.service.add_many(batch)
+                stats["added"] += len(batch)
+        finally:
+            if room is not None:
+                room.release()
+
+    def _import_ics_done(self, events, stats, error=None):
+        try:
+            self._import_ics_batch(events, stats)
+        except Exception as e:
+            error = error or e
+        self._refresh_list()
+        if stats["added"]:
+            self.save_reminders()
+        if error is not None:
+            messagebox.showerror("Import failed", f"{error}\n\nImported {stats['added']} reminder(s) before the error.")
             return
+        messagebox.showinfo(
+            "Import",
+            f"Imported {stats['added']} reminder(s)."
+            + (f" Skipped {stats['skipped']} past, duplicate or invalid event(s)." if stats["skipped"] else ""),
+        )
 
-        now = datetime.now()
-        for item in items:
-            try:
-                message = item.get("message", "")
-                remind_time = datetime.fromisoformat(item.get("remind_time"))
-                repeat = bool(item.get("repeat", False))
-                interval_minutes = int(item.get("interval_minutes", 0))
-
-                # Skip past non-repeating reminders
-                if not repeat and remind_time <= now:
-                    continue
-                
-                # Adjust repeating reminders to next occurrence
-                if repeat and interval_minutes > 0:
-                    while remind_time <= now:
-                        remind_time += timedelta(minutes=interval_minutes)
-
-                reminder = Reminder(message, remind_time, repeat, interval_minutes, self.show_reminder)
-                reminder.start()
-
-                display_text = f"{remind_time.strftime('%Y-%m-%d %H:%M')} | {message}"
-                if repeat:
-                    display_text += f" (every {interval_minutes} min)"
-
-                self.reminders.append((reminder, display_text))
-                self._add_ui_row(display_text)
-            except Exception:
-                continue
+    def export_ics(self):
+        if not len(self.reminders):
+            messagebox.showwarning("Warning", "There are no reminders to export.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Export reminders", defaultextension=".ics", filetypes=[("iCalendar", "*.ics")]
+        )
+        if not path:
+            return
+        snapshot = list(self.reminders)   # taken here; the worker streams it into the file
+
+        def write():
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                return ics.write_calendar(f, snapshot)
+
+        io_pool().submit(
+            write, key=path, widget=self,
+            on_done=lambda count: messagebox.showinfo("Export", f"Exported {count} reminder(s)."),
+            on_error=lambda e: messagebox.showerror("Export failed", str(e)),
+        )
+
+    # --- Bulk quick-add ---
+    def open_bulk_add(self):
+        if self._bulk_win is not None and self._bulk_win.winfo_exists():
+            self._bulk_win.deiconify()
+            self._bulk_win.lift()
+            return
+        self._bulk_win = ctk.CTkToplevel(self)
+        self._bulk_win.title("Bulk Add Reminders")
+        self._bulk_win.geometry("520x460")
+        ctk.CTkLabel(
+            self._bulk_win, justify="left",
+            text="One reminder per line:  yyyy-mm-dd hh:mm | message [| repeat]\n"
+                 "Repeat: daily, weekdays, weekly, monthly, hourly, every N minutes/hours/days/weeks/months",
+        ).pack(padx=10, pady=(10, 4), anchor="w")
+        self._bulk_text = ctk.CTkTextbox(self._bulk_win, height=220)
+        self._bulk_text.pack(padx=10, fill="both", expand=True)
+
+        btn_row = ctk.CTkFrame(self._bulk_win, fg_color="transparent")
+        btn_row.pack(pady=8)
+        ctk.CTkButton(btn_row, text="Load CSV...", width=110, command=self._bulk_load_csv).pack(side="left", padx=5)
+        ctk.CTkButton(btn_row, text="Add All", width=110, command=self._bulk_add_text).pack(side="left", padx=5)
+
+        self._bulk_report = ctk.CTkTextbox(self._bulk_win, height=100, state="disabled")
+        self._bulk_report.pack(padx=10, pady=(0, 10), fill="x")
+
+    def _bulk_add_text(self):
+        text = self._bulk_text.get("1.0", "end")
+        entries, errors = bulk.parse_text(text)
+        self._bulk_commit(entries, errors)
+        # Leave only the failed lines in the box so they can be fixed and re-added
+        self._bulk_text.delete("1.0", "end")
+        self._bulk_text.insert("1.0", "\n".join(e.text for e in errors))
+
+    def _bulk_load_csv(self):
+        path = filedialog.askopenfilename(
+            title="Bulk add from CSV", filetypes=[("CSV", "*.csv"), ("All files", "*.*")], parent=self._bulk_win
+        )
+        if not path:
+            return
+
+        def parsed(text):
+            entries, errors = bulk.parse_csv(io.StringIO(text, newline=""))
+            self._bulk_commit(entries, errors)
+
+        io_pool().submit(
+            _read_text, path, "", key=path, widget=self, on_done=parsed,
+            on_error=lambda e: messagebox.showerror("Bulk add", str(e), parent=self._bulk_win),
+        )
+
+    def _bulk_commit(self, entries, errors):
+        """Add every valid entry as one batch with a single save, then show the error report."""
+        batch = self.service.from_entries(entries)
+        if batch:
+            self.service.add_many(batch)
+            self._refresh_list()
+            self.save_reminders()
+
+        report = [f"Added {len(batch)} reminder(s)."]
+        if errors:
+            report.append(f"{len(errors)} line(s) were not added:")
+            report.extend(str(e) for e in errors)
+        self._bulk_report.configure(state="normal")
+        self._bulk_report.delete("1.0", "end")
+        self._bulk_report.insert("1.0", "\n".join(report))
+        self._bulk_report.configure(state="disabled")
+
+    # --- History ---
+    def open_history(self):
+        if self._history_win is None or not self._history_win.winfo_exists():
+            self._history_win = ctk.CTkToplevel(self)
+            self._history_win.title("Reminder History")
+            self._history_win.geometry("420x360")
+            self._history_win.protocol("WM_DELETE_WINDOW", self._history_win.withdraw)
+            self._history_range = ctk.CTkSegmentedButton(
+                self._history_win, values=["Today", "This week"], command=lambda _: self._show_history()
+            )
+            self._history_range.set("Today")
+            self._history_range.pack(pady=(10, 6))
+            self._history_text = ctk.CTkTextbox(self._history_win, wrap="word")
+            self._history_text.pack(padx=10, pady=(0, 10), fill="both", expand=True)
+        self._show_history()
+        self._history_win.deiconify()
+        self._history_win.lift()
+
+    def _show_history(self):
+        if self._history_range.get() == "This week":
+            entries = self.service.history.this_week()
+            fmt = "%a %H:%M"
+        else:
+            entries = self.service.history.today()
+            fmt = "%H:%M"
+        lines = [f"{e['t'].strftime(fmt)}  {e['event']:<9}  {e['message']}" for e in reversed(entries)]
+        self._history_text.configure(state="normal")
+        self._history_text.delete("1.0", "end")
+        self._history_text.insert("1.0", "\n".join(lines) if lines else "Nothing yet.")
+        self._history_text.configure(state="disabled")
 
     def add_reminder(self):
         try:
@@ -468,6 +613,7 @@ class ReminderPage(ctk.CTkFrame):
             minutes_str = self.minutes_entry.get().strip()
             repeat = self.repeat_var.get()
             interval_minutes = 0
+            rule = None
 
             if not message.strip():
                 messagebox.showwarning("Warning", "Please enter a reminder message.")
@@ -506,50 +652,70 @@ class ReminderPage(ctk.CTkFrame):
                 return
 
             if repeat:
+                freq = REPEAT_MODES[self.repeat_mode_var.get()][0]
                 interval_text = self.repeat_interval_entry.get().strip()
-                if not interval_text:
+                if freq == MINUTELY and not interval_text:
                     messagebox.showwarning("Warning", "Please enter a repeat interval in minutes.")
                     return
                 try:
-                    interval_minutes = int(interval_text)
-                    if interval_minutes <= 0:
+                    interval = int(interval_text or 1) if freq != WEEKDAYS else 1
+                    if interval <= 0:
                         messagebox.showwarning("Warning", "Repeat interval must be a positive number.")
                         return
                 except ValueError:
                     messagebox.showerror("Error", "Repeat interval must be a number.")
                     return
+                if freq == MINUTELY:
+                    interval_minutes = interval
 
-            reminder = Reminder(message, remind_time, repeat, interval_minutes, self.show_reminder)
-            reminder.start()
-
-            display_text = f"{remind_time.strftime('%Y-%m-%d %H:%M')} | {message}"
-            if repeat:
-                display_text += f" (every {interval_minutes} min)"
+                count_text = self.repeat_count_entry.get().strip()
+                until_text = self.repeat_until_entry.get().strip()
+                try:
+                    until = datetime.strptime(until_text, "%Y-%m-%d").replace(hour=23, minute=59) if until_text else None
+                    rule = RecurrenceRule(freq, interval, until=until, count=int(count_text) if count_text else None)
+                except ValueError as e:
+                    messagebox.showerror("Error", f"Invalid repeat end: {e}")
+                    return
 
-            self.reminders.append((reminder, display_text))
-            self._add_ui_row(display_text)
+            reminder = self.service.add(
+                self.service.new(message, remind_time, repeat, interval_minutes, rule=rule)
+            )
+            self.search_var.set("")
+            self._refresh_list()
+            self.reminder_list.scroll_to(self.reminders.index_of(reminder.id))
             self.update_delete_button_state()
             self.save_reminders()
 
             # Clear inputs for convenience
-            for entry in [self.msg_entry, self.minutes_entry, self.repeat_interval_entry]:
+            for entry in [self.msg_entry, self.minutes_entry, self.repeat_interval_entry,
+                          self.repeat_count_entry, self.repeat_until_entry]:
                 entry.delete(0, "end")
 
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
 
     def open_calendar(self):
-        # Avoid multiple popups
-        if hasattr(self, "_cal_win") and self._cal_win and self._cal_win.winfo_exists():
-            self._cal_win.lift()
-            return
+        # The popup is built once and then only hidden and shown again
+        if self._cal_win is None or not self._cal_win.winfo_exists():
+            self._build_calendar()
+        try:
+            self._calendar.selection_set(datetime.strptime(self.date_var.get().strip(), "%Y-%m-%d").date())
+        except ValueError:
+            self._calendar.selection_set(datetime.now().date())
+        self._sync_calendar_events()
+        self._cal_win.deiconify()
+        self._cal_win.lift()
+
+    def _build_calendar(self):
         self._cal_win = ctk.CTkToplevel(self)
         self._cal_win.title("Select Date")
         self._cal_win.resizable(False, False)
+        self._cal_win.protocol("WM_DELETE_WINDOW", self._cal_win.withdraw)
 
         # Colors aligned with CustomTkinter dark theme
         colors = {
-            "bg": "#1f1f1f", "fg": "#d6d6d6", "accent": "#1a2b4c", "sel": "#2f4b7a", "other": "#7a7a7a"
+            "bg": "#1f1f1f", "fg": "#d6d6d6", "accent": "#1a2b4c", "sel": "#2f4b7a", "other": "#7a7a7a",
+            "due": "#1f6aa5",
         }
         
         today = datetime.now().date()
@@ -561,36 +727,56 @@ class ReminderPage(ctk.CTkFrame):
             normalforeground=colors["fg"], headersforeground=colors["fg"], weekendforeground=colors["fg"],
             othermonthforeground=colors["other"], othermonthbackground=colors["bg"], othermonthwebackground=colors["bg"]
         )
+        self._calendar.tag_config("due", background=colors["due"], foreground="white")
         self._calendar.pack(padx=10, pady=(10, 6))
 
         btn_row = ctk.CTkFrame(self._cal_win)
         btn_row.pack(pady=(0, 10))
         ctk.CTkButton(btn_row, text="OK", command=self._on_calendar_ok, width=80).pack(side="left", padx=5)
-        ctk.CTkButton(btn_row, text="Cancel", command=self._cal_win.destroy, width=80).pack(side="left", padx=5)
+        ctk.CTkButton(btn_row, text="Cancel", command=self._cal_win.withdraw, width=80).pack(side="left", padx=5)
+
+        # A new widget starts without events: mark every day once, then only changed days
+        self._cal_events = {}
+        self.reminders.take_dirty_days()
+        self._sync_calendar_events(self.reminders.day_counts())
+
+    def _sync_calendar_events(self, days=None):
+        """Mark days that have reminders; by default only days whose due count changed."""
+        if self._calendar is None or not self._calendar.winfo_exists():
+            self.reminders.take_dirty_days()  # rebuilt from day_counts() when next built
+            return
+        for day in (self.reminders.take_dirty_days() if days is None else days):
+            event_id = self._cal_events.pop(day, None)
+            if event_id is not None:
+                self._calendar.calevent_remove(event_id)
+            count = self.reminders.day_count(day)
+            if count:
+                text = f"{count} reminder" + ("s" if count != 1 else "")
+                self._cal_events[day] = self._calendar.calevent_create(day, text, "due")
 
     def _on_calendar_ok(self):
         self.date_var.set(self._calendar.get_date())
-        if hasattr(self, "_cal_win") and self._cal_win and self._cal_win.winfo_exists():
-            self._cal_win.destroy()
+        if self._cal_win is not None and self._cal_win.winfo_exists():
+            self._cal_win.withdraw()
 
     def _on_repeat_toggle(self):
         state = "normal" if self.repeat_var.get() else "disabled"
-        self.repeat_interval_entry.configure(state=state)
+        freq, unit = REPEAT_MODES[self.repeat_mode_var.get()]
+        self.repeat_mode_menu.configure(state=state)
+        self.repeat_interval_entry.configure(state=state if freq != WEEKDAYS else "disabled")
+        self.repeat_unit_label.configure(text=unit)
+        self.repeat_count_entry.configure(state=state)
+        self.repeat_until_entry.configure(state=state)
 
 
     def update_delete_button_state(self):
-        self.delete_btn.configure(state="normal" if any(var.get() for var in self.reminder_vars) else "disabled")
+        self.delete_btn.configure(state="normal" if self.selected_ids else "disabled")
 
     def delete_selected_reminder(self):
-        to_delete = [i for i, var in enumerate(self.reminder_vars) if var.get()]
-        if not to_delete:
+        if not self.selected_ids:
             messagebox.showwarning("Warning", "Please tick reminder(s) to delete.")
             return
-        # Delete from highest index to lowest to avoid shifting issues
-        for idx in sorted(to_delete, reverse=True):
-            self.reminders[idx][0].stop()  # Stop reminder
-            self.reminders.pop(idx)
-            self.reminder_vars.pop(idx)
-            self.reminder_widgets.pop(idx).destroy()  # Destroy widget
+        to_delete = [self.reminders.get(rid) for rid in self.selected_ids if rid in self.reminders]
+        self._remove_reminder_instances(to_delete)
+        self.selected_ids.clear()
         self.update_delete_button_state()
-        self.save_reminders()
\ No newline at end of file
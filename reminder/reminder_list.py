@@ -0,0 +1,107 @@
+import customtkinter as ctk
+
+
+class VirtualReminderList(ctk.CTkFrame):
+    """
+    Scrollable list of reminder checkboxes that only builds widgets for the
+    rows that fit on screen. Rows are rebound to different reminders as the
+    list scrolls, so thousands of reminders cost the same as a handful.
+    """
+    ROW_HEIGHT = 30
+
+    def __init__(self, parent, store, selected, on_toggle=None, height=180):
+        super().__init__(parent, height=height)
+        self.pack_propagate(False)
+        self.store = store          # ReminderStore, read in due order
+        self.source = store         # what is listed: the store or a search result
+        self.selected = selected    # set of selected reminder ids, shared with the page
+        self.on_toggle = on_toggle
+        self._first = 0             # index of the reminder shown in the top row
+        self._rows = []             # [checkbox, bound reminder id]
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True, padx=(4, 0), pady=4)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", pady=4)
+
+        self.empty_label = ctk.CTkLabel(self.body, text="No reminders.", text_color="gray")
+
+        visible = max(1, (height - 8) // self.ROW_HEIGHT)
+        for i in range(visible):
+            cb = ctk.CTkCheckBox(self.body, text="", command=lambda i=i: self._on_row_toggled(i))
+            self._rows.append([cb, None])
+            for widget in (cb, self.body, self):
+                widget.bind("<MouseWheel>", self._on_mousewheel)
+                widget.bind("<Button-4>", lambda e: self.scroll_rows(-1))
+                widget.bind("<Button-5>", lambda e: self.scroll_rows(1))
+
+        self.refresh()
+
+    def visible_rows(self):
+        return len(self._rows)
+
+    def set_source(self, source):
+        """List `source` (any sized, sliceable sequence of reminders) instead."""
+        if source is not self.source:
+            self.source = source
+            self._first = 0
+        self.refresh()
+
+    def refresh(self):
+        """Rebind the visible rows to the current contents of the source."""
+        total = len(self.source)
+        self._first = max(0, min(self._first, total - len(self._rows)))
+        reminders = self.source[self._first:self._first + len(self._rows)]
+
+        for i, row in enumerate(self._rows):
+            cb = row[0]
+            if i < len(reminders):
+                reminder = reminders[i]
+                row[1] = reminder.id
+                cb.configure(text=reminder.display_text())
+                if reminder.id in self.selected:
+                    cb.select()
+                else:
+                    cb.deselect()
+                cb.place(x=2, y=i * self.ROW_HEIGHT)
+            else:
+                row[1] = None
+                cb.place_forget()
+
+        if total:
+            self.empty_label.place_forget()
+            self.scrollbar.set(self._first / total, min(1.0, (self._first + len(self._rows)) / total))
+        else:
+            self.empty_label.place(x=4, y=4)
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_rows(self, delta):
+        first = self._first
+        self._first = max(0, min(self._first + delta, len(self.source) - len(self._rows)))
+        if self._first != first:
+            self.refresh()
+
+    def scroll_to(self, index):
+        self._first = index
+        self.refresh()
+
+    def _on_mousewheel(self, event):
+        self.scroll_rows(-1 if event.delta > 0 else 1)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.source)))
+        elif action == "scroll":
+            step = len(self._rows) if unit == "pages" else 1
+            self.scroll_rows(step if float(amount) > 0 else -step)
+
+    def _on_row_toggled(self, i):
+        cb, reminder_id = self._rows[i]
+        if reminder_id is None:
+            return
+        if cb.get():
+            self.selected.add(reminder_id)
+        else:
+            self.selected.discard(reminder_id)
+        if self.on_toggle:
+            self.on_toggle()
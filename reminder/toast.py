@@ -0,0 +1,241 @@
+import customtkinter as ctk
+
+from diagnostics.tracing import traced
+from shared import font, timers
+
+
+class _ToastSlot:
+    """
+    A reusable toast window plus the numeric state of its animation.
+    """
+    def __init__(self, manager):
+        self.manager = manager
+        self.win = ctk.CTkToplevel(manager.parent)
+        self.win.withdraw()
+        self.win.overrideredirect(True)
+        try:
+            self.win.attributes("-topmost", True, "-alpha", 0.0)
+        except Exception:
+            pass
+
+        # Content (built once, text swapped on reuse)
+        container = ctk.CTkFrame(self.win, corner_radius=14)
+        container.pack(fill="both", expand=True, padx=2, pady=2)
+        self.title_label = ctk.CTkLabel(container, text="", font=font(size=14, weight="bold"))
+        self.title_label.pack(anchor="w", padx=14, pady=(12, 2))
+        self.body_label = ctk.CTkLabel(container, text="", wraplength=260, font=font(size=12))
+        self.body_label.pack(anchor="w", padx=14, pady=(0, 10))
+        self.btn_row = ctk.CTkFrame(container)
+        self.btn_row.pack(fill="x", padx=10, pady=(0, 10))
+        self.dismiss_btn = ctk.CTkButton(self.btn_row, text="Dismiss", width=70, command=lambda: manager.close(self, True))
+        self.dismiss_btn.pack(side="right", padx=6)
+        # Snooze choices; None asks for a custom number of minutes
+        self.snooze_btns = [
+            ctk.CTkButton(self.btn_row, text=text, width=40, fg_color="gray30", hover_color="gray40",
+                          command=lambda m=minutes: manager.snooze(self, m))
+            for text, minutes in (("5m", 5), ("10m", 10), ("30m", 30), ("…", None))
+        ]
+
+        self.win.bind("<Enter>", lambda e: manager._on_enter(self))
+        self.win.bind("<Leave>", lambda e: manager._on_leave(self))
+        self.reset()
+
+    def reset(self):
+        self.x = 0
+        self.y = 0
+        self.target_y = 0
+        self.alpha = 0.0
+        self.speed = 8
+        self.closing = False
+        self.settled = False
+        self.on_close = None
+        self.on_snooze = None
+        self.auto_id = None
+        self._applied = None
+
+    def apply(self):
+        """Push position and alpha to Tk, skipping frames where nothing changed."""
+        state = (self.x, int(self.y), round(self.alpha, 2))
+        if state == self._applied:
+            return True
+        m = self.manager
+        try:
+            if self._applied is None or self._applied[:2] != state[:2]:
+                self.win.geometry(f"{m.WIDTH}x{m.HEIGHT}+{state[0]}+{state[1]}")
+            if self._applied is None or self._applied[2] != state[2]:
+                self.win.attributes("-alpha", state[2])
+        except Exception:
+            return False
+        self._applied = state
+        return True
+
+
+class ToastManager:
+    """
+    Shows phone-like toasts stacked in the bottom-right of the app window.
+
+    Toast windows are pooled and reused, and every running animation is
+    advanced from one frame callback that stops when nothing is moving.
+    """
+    WIDTH = 300
+    HEIGHT = 110
+    GAP = 8
+    MARGIN = 16
+    FRAME_MS = 16
+    AUTO_CLOSE_MS = 4500
+    LEAVE_CLOSE_MS = 2000
+
+    def __init__(self, parent, pool_size=3):
+        self.parent = parent
+        self.pool_size = pool_size
+        self._pool = []      # hidden, ready-to-use slots
+        self._active = []    # visible slots, index 0 is the bottom of the stack
+        self._frame_id = None
+
+    def show(self, title, message, on_close=None, on_snooze=None):
+        """
+        Show a toast; on_close(user_dismissed) is called once when it starts
+        closing. With on_snooze, snooze buttons are shown and a snooze calls
+        on_snooze(minutes) instead of on_close (minutes is None for "custom").
+        """
+        slot = self._pool.pop() if self._pool else _ToastSlot(self)
+        slot.reset()
+        slot.on_close = on_close
+        slot.on_snooze = on_snooze
+        slot.title_label.configure(text=title)
+        slot.body_label.configure(text=message)
+        for btn in slot.snooze_btns:
+            btn.pack_forget()
+            if on_snooze:
+                btn.pack(side="left", padx=(4, 0))
+
+        x, target_y = self._stack_position(len(self._active))
+        slot.x = x
+        slot.target_y = target_y
+        slot.y = target_y + 30  # start slightly below for the slide-up
+        self._active.append(slot)
+
+        slot.apply()
+        slot.win.deiconify()
+        try:
+            slot.win.attributes("-topmost", True)
+        except Exception:
+            pass
+        self._ensure_running()
+        return slot
+
+    def close(self, slot, user=False):
+        """Start the fade-out of a toast and notify its owner."""
+        if slot.closing or slot not in self._active:
+            return
+        slot.closing = True
+        self._cancel_auto_close(slot)
+        callback, slot.on_close = slot.on_close, None
+        if callback:
+            callback(user)
+        self._ensure_running()
+
+    def snooze(self, slot, minutes):
+        """Close a toast through its snooze action rather than on_close."""
+        if slot.closing or slot not in self._active:
+            return
+        callback, slot.on_snooze = slot.on_snooze, None
+        slot.on_close = None
+        self.close(slot)
+        if callback:
+            callback(minutes)
+
+    def visible_count(self):
+        return sum(1 for s in self._active if not s.closing)
+
+    # --- Layout ---
+    def _stack_position(self, index):
+        self.parent.update_idletasks()
+        px = self.parent.winfo_rootx()
+        py = self.parent.winfo_rooty()
+        pw = self.parent.winfo_width()
+        ph = self.parent.winfo_height()
+        x = px + pw - self.WIDTH - self.MARGIN
+        y = py + ph - (self.HEIGHT + self.MARGIN) - index * (self.HEIGHT + self.GAP)
+        return x, y
+
+    def _restack(self):
+        for i, slot in enumerate(self._active):
+            if slot.closing:
+                continue
+            slot.x, slot.target_y = self._stack_position(i)
+            slot.speed = 12
+        self._ensure_running()
+
+    # --- Frame loop ---
+    def _ensure_running(self):
+        if self._frame_id is None:
+            self._frame_id = timers(self.parent).call_later(self.FRAME_MS, self._tick)
+
+    @traced("ToastManager._tick", cat="toast")
+    def _tick(self):
+        self._frame_id = None
+        moving = False
+        for slot in list(self._active):
+            if slot.closing:
+                slot.alpha = max(0.0, slot.alpha - 0.15)
+                slot.y += 10
+                if slot.alpha <= 0.0 or not slot.apply():
+                    self._release(slot)
+                    continue
+                moving = True
+                continue
+
+            if slot.y > slot.target_y:
+                slot.y = max(slot.target_y, slot.y - slot.speed)
+            elif slot.y < slot.target_y:
+                slot.y = min(slot.target_y, slot.y + slot.speed)
+            if slot.alpha < 1.0:
+                slot.alpha = min(1.0, slot.alpha + 0.12)
+
+            if not slot.apply():
+                self._release(slot)
+                continue
+            if slot.y != slot.target_y or slot.alpha < 1.0:
+                moving = True
+            elif not slot.settled:
+                slot.settled = True
+                self._schedule_auto_close(slot, self.AUTO_CLOSE_MS)
+
+        if moving:
+            self._ensure_running()
+
+    def _release(self, slot):
+        """Hide a finished toast and return its window to the pool."""
+        self._cancel_auto_close(slot)
+        if slot in self._active:
+            self._active.remove(slot)
+        try:
+            slot.win.withdraw()
+            slot.win.attributes("-alpha", 0.0)
+        except Exception:
+            pass
+        else:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(slot)
+            else:
+                slot.win.destroy()
+        self._restack()
+
+    # --- Auto-close ---
+    def _schedule_auto_close(self, slot, delay):
+        self._cancel_auto_close(slot)
+        slot.auto_id = timers(self.parent).call_later(delay, lambda: self.close(slot, False))
+
+    def _cancel_auto_close(self, slot):
+        if slot.auto_id:
+            timers(self.parent).cancel(slot.auto_id)
+            slot.auto_id = None
+
+    def _on_enter(self, slot):
+        if slot.settled and not slot.closing:
+            self._cancel_auto_close(slot)
+
+    def _on_leave(self, slot):
+        if slot.settled and not slot.closing:
+            self._schedule_auto_close(slot, self.LEAVE_CLOSE_MS)
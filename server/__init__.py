@@ -0,0 +1,6 @@
+# server/__init__.py
+"""Local asyncio HTTP/JSON API over the headless core (run with `python -m server`)."""
+
+from .api import ApiServer
+
+__all__ = ['ApiServer']
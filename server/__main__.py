@@ -0,0 +1,56 @@
+"""
+Run the API server:
+
+    python -m server                          # 127.0.0.1:8765, data in server/data
+    python -m server --port 9000 --data /srv/gpa --workers 4
+"""
+import argparse
+import asyncio
+import os
+import signal
+
+from .api import ApiServer
+from .protocol import MAX_HEADER, serve_connection
+
+
+async def serve(host, port, data_dir, workers, idle_after=600):
+    api = ApiServer(data_dir, workers, idle_after)
+    loop = asyncio.get_running_loop()
+    api.start(loop)
+    server = await asyncio.start_server(
+        lambda r, w: serve_connection(api.router, r, w), host, port, limit=MAX_HEADER, backlog=1024,
+    )
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
+    print(f"Serving on http://{host}:{port} (data: {data_dir})", flush=True)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        server.close()
+        api.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON API for GPA and reminders.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--data", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"),
+                        help="data directory (students/ transcripts, reminders/ partitions)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes for cohort CGPA (default: CPU count, 0 = run inline)")
+    parser.add_argument("--idle-after", type=float, default=600,
+                        help="seconds before an inactive student is unloaded from memory")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.data, args.workers, args.idle_after))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,454 @@
+"""
+JSON API over core.gpa and core.reminders for many students on one machine.
+
+Transcripts live in data/students/<id>/transcript.json and are cached
+while in use. Reminders are partitions of one TenantReminderService under
+data/reminders/<id>/, all fired by a single shared scheduler, and idle
+students are unloaded from both. Cohort-wide CGPA runs in a process pool
+so that it does not block other requests, and file I/O (transcripts and
+reminder partitions) runs on executor threads rather than the event loop.
+"""
+import asyncio
+import functools
+import os
+import re
+import statistics
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from core.gpa import Transcript, cgpa_many, load_json, make_subject, save_json
+from core.reminders import TenantReminderService, bulk, zones
+
+from .protocol import HttpError, Router, json_response
+
+_ID_RE = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+COHORT_CHUNK = 500   # transcripts per worker task
+MAX_POLL_SECONDS = 60
+MAX_PENDING = 100    # undelivered notifications kept per student
+
+
+def semester_json(index, sem):
+    return {"number": index + 1, "name": sem["name"], "gpa": sem["gpa"], "subjects": sem["subjects"]}
+
+
+def reminder_json(r):
+    return {
+        "id": r.id,
+        "message": r.message,
+        "remind_time": r.remind_time.isoformat(timespec="minutes"),
+        "due_utc": zones.utc_iso(r.due_ts),
+        "tz": r.tz,
+        "repeat": r.rule.describe(r.start_time) if r.repeat else None,
+    }
+
+
+class Student:
+    """One student's transcript, cached while the student is active."""
+    def __init__(self, student_id, directory):
+        self.id = student_id
+        self._transcript_path = os.path.join(directory, "transcript.json")
+        self.transcript = Transcript(load_json(self._transcript_path))
+        self.last_used = time.monotonic()
+        self._save_lock = asyncio.Lock()
+
+    async def save_transcript(self, loop):
+        """Snapshot the semesters here and write them on an executor thread, one save at a time."""
+        semesters = [dict(sem, subjects=list(sem["subjects"])) for sem in self.transcript.semesters]
+        async with self._save_lock:
+            await loop.run_in_executor(None, save_json, semesters, self._transcript_path)
+
+
+class ApiServer:
+    """Routes, per-student state and the worker pool for cohort computations."""
+    def __init__(self, data_dir, workers=None, idle_after=600):
+        self.data_dir = data_dir
+        self.workers = workers
+        self.idle_after = idle_after
+        self.students = {}     # cached transcripts
+        self._loading = {}     # student id -> future of a transcript being read
+        self.reminders = None
+        self.pending = {}      # student id -> deque of fired reminders not yet polled
+        self._waiters = {}     # student id -> futures of polls waiting for a firing
+        self.pool = None
+        self.router = Router()
+        self._loop = None
+        self._evict_task = None
+        self._add_routes()
+
+    # --- Lifecycle ---
+    def start(self, loop):
+        self._loop = loop
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.reminders = TenantReminderService(
+            os.path.join(self.data_dir, "reminders"), on_fire=self._on_fired, idle_after=self.idle_after,
+        )
+        self.reminders.start()
+        self._evict_task = loop.create_task(self._evict_idle())
+        if self.workers != 0:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def close(self):
+        if self._evict_task is not None:
+            self._evict_task.cancel()
+        self.students.clear()
+        if self.reminders is not None:
+            self.reminders.close()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    async def student(self, student_id):
+        self._check_id(student_id)
+        student = self.students.get(student_id)
+        if student is None:
+            # Concurrent requests for one student share a single read
+            loading = self._loading.get(student_id)
+            if loading is None:
+                directory = os.path.join(self.data_dir, "students", student_id)
+                loading = self._loop.run_in_executor(None, Student, student_id, directory)
+                self._loading[student_id] = loading
+                loading.add_done_callback(lambda f: self._loading.pop(student_id, None))
+            student = self.students.setdefault(student_id, await loading)
+        student.last_used = time.monotonic()
+        return student
+
+    async def user_reminders(self, student_id, work):
+        """
+        `work(reminders)` with that student's ReminderService, on an executor
+        thread: it may load or save the partition or wait for the sweep.
+        """
+        self._check_id(student_id)
+        return await self._loop.run_in_executor(None, self._with_reminders, student_id, work)
+
+    def _with_reminders(self, student_id, work):
+        with self.reminders.user(student_id) as reminders:
+            return work(reminders)
+
+    @staticmethod
+    def _check_id(student_id):
+        if not _ID_RE.match(student_id):
+            raise HttpError(400, "student id may only use letters, digits, '.', '_' and '-'")
+
+    async def _evict_idle(self):
+        """Drop cached transcripts of idle students (reminders are unloaded by their own sweep)."""
+        while True:
+            await asyncio.sleep(min(60, self.idle_after))
+            idle_before = time.monotonic() - self.idle_after
+            for sid in [sid for sid, st in self.students.items() if st.last_used < idle_before]:
+                del self.students[sid]
+
+    # --- Due notifications ---
+    def _on_fired(self, student_id, reminder, message):
+        # Scheduler thread: hand over to the event loop
+        self._loop.call_soon_threadsafe(self._deliver, student_id, reminder, message)
+
+    def _deliver(self, student_id, reminder, message):
+        item = reminder_json(reminder)
+        item["message"] = message
+        item["fired_at"] = datetime.now().isoformat(timespec="seconds")
+        self.pending.setdefault(student_id, deque(maxlen=MAX_PENDING)).append(item)
+        # Like a toast closing by itself: one-off reminders are done once delivered
+        if not reminder.repeat or reminder.finished:
+            remove = functools.partial(_remove, [reminder])
+            self._loop.run_in_executor(None, self._with_reminders, student_id, remove)
+        for fut in self._waiters.pop(student_id, []):
+            if not fut.done():
+                fut.set_result(None)
+
+    async def wait_due(self, student_id, timeout):
+        """Fired reminders since the last poll, waiting up to `timeout` seconds for one."""
+        if not self.pending.get(student_id) and timeout > 0:
+            fut = self._loop.create_future()
+            self._waiters.setdefault(student_id, []).append(fut)
+            try:
+                await asyncio.wait_for(fut, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                waiters = self._waiters.get(student_id)
+                if waiters and fut in waiters:
+                    waiters.remove(fut)
+                    if not waiters:
+                        del self._waiters[student_id]
+        return list(self.pending.pop(student_id, ()))
+
+    def _add_routes(self):
+        add = self.router.add
+        add("GET", "/health", self.health)
+        add("GET", "/students/{sid}/transcript", self.get_transcript)
+        add("GET", "/students/{sid}/cgpa", self.get_cgpa)
+        add("POST", "/students/{sid}/semesters", self.add_semester)
+        add("GET", "/students/{sid}/semesters/{n}", self.get_semester)
+        add("PUT", "/students/{sid}/semesters/{n}", self.put_semester)
+        add("DELETE", "/students/{sid}/semesters/{n}", self.delete_semester)
+        add("POST", "/students/{sid}/semesters/{n}/subjects", self.add_subject)
+        add("PUT", "/students/{sid}/semesters/{n}/subjects/{i}", self.put_subject)
+        add("DELETE", "/students/{sid}/semesters/{n}/subjects/{i}", self.delete_subject)
+        add("GET", "/students/{sid}/reminders", self.list_reminders)
+        add("POST", "/students/{sid}/reminders", self.add_reminder)
+        add("GET", "/students/{sid}/reminders/due", self.poll_due)
+        add("GET", "/students/{sid}/reminders/{rid}", self.get_reminder)
+        add("PUT", "/students/{sid}/reminders/{rid}", self.put_reminder)
+        add("DELETE", "/students/{sid}/reminders/{rid}", self.delete_reminder)
+        add("POST", "/students/{sid}/reminders/{rid}/snooze", self.snooze_reminder)
+        add("POST", "/cohort/cgpa", self.cohort_cgpa)
+
+    async def health(self, req):
+        return {
+            "status": "ok",
+            "students_loaded": len(self.students),
+            "reminder_users_loaded": len(self.reminders.loaded_users()),
+            "workers": self.workers,
+        }
+
+    # --- Transcript ---
+    def _semester_index(self, student, req):
+        try:
+            index = int(req.params["n"]) - 1
+        except ValueError:
+            raise HttpError(404)
+        if not 0 <= index < len(student.transcript.semesters):
+            raise HttpError(404, "no such semester")
+        return index
+
+    async def _changed(self, student, index=None, status=200):
+        """Save the transcript and answer with the semester (if any) and the new CGPA."""
+        await student.save_transcript(self._loop)
+        body = {"cgpa": student.transcript.cgpa()}
+        if index is not None:
+            body["semester"] = semester_json(index, student.transcript.semesters[index])
+        return json_response(body, status)
+
+    @staticmethod
+    def _subjects(data):
+        subjects = data.get("subjects", [])
+        if not isinstance(subjects, list):
+            raise HttpError(400, "'subjects' must be a list")
+        return [_subject(s) for s in subjects]
+
+    async def get_transcript(self, req):
+        return (await self.student(req.params["sid"])).transcript.to_dict()
+
+    async def get_cgpa(self, req):
+        return {"cgpa": (await self.student(req.params["sid"])).transcript.cgpa()}
+
+    async def add_semester(self, req):
+        student = await self.student(req.params["sid"])
+        student.transcript.add_semester(self._subjects(req.json()))
+        return await self._changed(student, len(student.transcript.semesters) - 1, 201)
+
+    async def get_semester(self, req):
+        student = await self.student(req.params["sid"])
+        index = self._semester_index(student, req)
+        return semester_json(index, student.transcript.semesters[index])
+
+    async def put_semester(self, req):
+        student = await self.student(req.params["sid"])
+        index = self._semester_index(student, req)
+        student.transcript.set_subjects(index, self._subjects(req.json()))
+        return await self._changed(student, index)
+
+    async def delete_semester(self, req):
+        student = await self.student(req.params["sid"])
+        student.transcript.remove_semester(self._semester_index(student, req))
+        return await self._changed(student)
+
+    def _subject_index(self, subjects, req):
+        try:
+            i = int(req.params["i"]) - 1
+        except ValueError:
+            raise HttpError(404)
+        if not 0 <= i < len(subjects):
+            raise HttpError(404, "no such subject")
+        return i
+
+    async def add_subject(self, req):
+        student = await self.student(req.params["sid"])
+        index = self._semester_index(student, req)
+        subjects = student.transcript.semesters[index]["subjects"] + [_subject(req.json())]
+        student.transcript.set_subjects(index, subjects)
+        return await self._changed(student, index, 201)
+
+    async def put_subject(self, req):
+        student = await self.student(req.params["sid"])
+        index = self._semester_index(student, req)
+        subjects = list(student.transcript.semesters[index]["subjects"])
+        subjects[self._subject_index(subjects, req)] = _subject(req.json())
+        student.transcript.set_subjects(index, subjects)
+        return await self._changed(student, index)
+
+    async def delete_subject(self, req):
+        student = await self.student(req.params["sid"])
+        index = self._semester_index(student, req)
+        subjects = list(student.transcript.semesters[index]["subjects"])
+        del subjects[self._subject_index(subjects, req)]
+        student.transcript.set_subjects(index, subjects)
+        return await self._changed(student, index)
+
+    # --- Reminders ---
+    @staticmethod
+    def _reminder(reminders, req):
+        reminder = reminders.get(req.params["rid"])
+        if reminder is None:
+            raise HttpError(404, "no such reminder")
+        return reminder
+
+    @staticmethod
+    def _build_reminder(reminders, data, reminder_id=None):
+        message = str(data.get("message", "")).strip()
+        if not message:
+            raise HttpError(400, "'message' is required")
+        remind_time = _parse_when(data)
+        rule = bulk.parse_repeat(str(data.get("repeat") or ""))
+        reminder = reminders.new(message, remind_time, rule=rule, reminder_id=reminder_id)
+        if not reminder.catch_up(datetime.now()):
+            raise HttpError(400, "time is in the past")
+        return reminder
+
+    async def list_reminders(self, req):
+        limit = max(1, min(req.arg("limit", 100, int), 1000))
+        query = req.arg("q", "").strip()
+
+        def work(reminders):
+            found = reminders.search(query, limit=limit) if query else reminders.store[:limit]
+            return {"total": len(reminders.store), "reminders": [reminder_json(r) for r in found]}
+        return await self.user_reminders(req.params["sid"], work)
+
+    async def add_reminder(self, req):
+        data = req.json()
+
+        def work(reminders):
+            reminder = reminders.add(self._build_reminder(reminders, data))
+            reminders.save()
+            return json_response(reminder_json(reminder), 201)
+        return await self.user_reminders(req.params["sid"], work)
+
+    async def get_reminder(self, req):
+        def work(reminders):
+            return reminder_json(self._reminder(reminders, req))
+        return await self.user_reminders(req.params["sid"], work)
+
+    async def put_reminder(self, req):
+        data = req.json()
+
+        def work(reminders):
+            old = self._reminder(reminders, req)
+            data.setdefault("message", old.message)
+            if "remind_time" not in data and "in_minutes" not in data:
+                data["remind_time"] = old.remind_time.isoformat()
+            # Replace in place: same id, new time and rule
+            reminder = self._build_reminder(reminders, data, reminder_id=old.id)
+            reminders.remove_many([old])
+            reminders.add(reminder)
+            reminders.save()
+            return reminder_json(reminder)
+        return await self.user_reminders(req.params["sid"], work)
+
+    async def delete_reminder(self, req):
+        def work(reminders):
+            _remove([self._reminder(reminders, req)], reminders)
+        await self.user_reminders(req.params["sid"], work)
+        return json_response({}, 200)
+
+    async def snooze_reminder(self, req):
+        minutes = req.json().get("minutes", 5)
+        if not isinstance(minutes, int) or minutes <= 0:
+            raise HttpError(400, "'minutes' must be a positive integer")
+
+        def work(reminders):
+            reminder = self._reminder(reminders, req)
+            reminders.snooze([reminder], datetime.now() + timedelta(minutes=minutes))
+            return reminder_json(reminder)
+        return await self.user_reminders(req.params["sid"], work)
+
+    async def poll_due(self, req):
+        """Long-poll: returns as soon as a reminder fires, or [] after `timeout` seconds."""
+        sid = req.params["sid"]
+        self._check_id(sid)
+        timeout = max(0.0, min(req.arg("timeout", 30.0, float), MAX_POLL_SECONDS))
+        return {"due": await self.wait_due(sid, timeout)}
+
+    # --- Cohort ---
+    async def cohort_cgpa(self, req):
+        """
+        CGPA for many students at once: the transcripts in the body
+        ({"students": {id: [subjects]}}) or, without one, every student on disk.
+        """
+        data = req.json()
+        if "students" in data:
+            if not isinstance(data["students"], dict):
+                raise HttpError(400, "'students' must map ids to subject lists")
+            ids = list(data["students"])
+            subject_lists = [[_subject(s) for s in subs] for subs in data["students"].values()]
+        else:
+            # Loaded students are read here; the rest are read from disk off the event loop
+            loaded = {sid: st.transcript.all_subjects() for sid, st in self.students.items()}
+            ids, subject_lists = await self._loop.run_in_executor(None, self._saved_transcripts, loaded)
+
+        chunks = [subject_lists[i:i + COHORT_CHUNK] for i in range(0, len(subject_lists), COHORT_CHUNK)]
+        if self.pool is not None:
+            parts = await asyncio.gather(*(self._loop.run_in_executor(self.pool, cgpa_many, c) for c in chunks))
+        else:
+            parts = [cgpa_many(c) for c in chunks]
+        values = [v for part in parts for v in part]
+
+        summary = {"count": len(values)}
+        if values:
+            summary.update(mean=statistics.fmean(values), median=statistics.median(values),
+                           min=min(values), max=max(values))
+        return {"summary": summary, "students": dict(zip(ids, values))}
+
+    def _saved_transcripts(self, loaded):
+        """(ids, subject lists) of every student with subjects, preferring `loaded` over disk."""
+        root = os.path.join(self.data_dir, "students")
+        try:
+            names = set(os.listdir(root)) | set(loaded)
+        except OSError:
+            names = set(loaded)
+        ids, subject_lists = [], []
+        for name in sorted(names):
+            subjects = loaded.get(name)
+            if subjects is None:
+                try:
+                    semesters = load_json(os.path.join(root, name, "transcript.json"))
+                except (OSError, ValueError):
+                    continue
+                subjects = [subj for sem in semesters for subj in sem["subjects"]]
+            if subjects:
+                ids.append(name)
+                subject_lists.append(subjects)
+        return ids, subject_lists
+
+
+def _subject(data):
+    if not isinstance(data, dict):
+        raise HttpError(400, "a subject must be an object with name, credit and grade")
+    try:
+        return make_subject(data["name"], data["credit"], data["grade"])
+    except KeyError as e:
+        raise HttpError(400, f"subject is missing {e}")
+    except TypeError:
+        raise HttpError(400, "invalid subject")
+
+
+def _remove(found, reminders):
+    reminders.remove_many(found)
+    reminders.save()
+
+
+def _parse_when(data):
+    """'remind_time' (ISO; naive means server-local) or 'in_minutes' -> naive local datetime."""
+    if data.get("in_minutes") is not None:
+        try:
+            return datetime.now() + timedelta(minutes=float(data["in_minutes"]))
+        except (TypeError, ValueError):
+            raise HttpError(400, "'in_minutes' must be a number")
+    text = data.get("remind_time")
+    if not text:
+        raise HttpError(400, "'remind_time' or 'in_minutes' is required")
+    try:
+        return zones.parse_stored(str(text))
+    except ValueError:
+        raise HttpError(400, "'remind_time' must be an ISO date and time")
@@ -0,0 +1,183 @@
+"""
+A small HTTP/1.1 server on asyncio streams, just enough for a local JSON
+API: keep-alive connections, Content-Length bodies and `{name}` path
+parameters. There is no TLS or chunked request support; put a real proxy in
+front of it if it ever leaves localhost.
+"""
+import asyncio
+import json
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+MAX_HEADER = 16 * 1024
+MAX_BODY = 1024 * 1024
+
+
+class HttpError(Exception):
+    """Raised by a handler to answer with `status` and a JSON error message."""
+    def __init__(self, status, message=None):
+        super().__init__(message or HTTPStatus(status).phrase)
+        self.status = status
+
+
+class Request:
+    __slots__ = ("method", "path", "query", "headers", "body", "params")
+
+    def __init__(self, method, target, headers, body):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = unquote(parts.path)
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+        self.params = {}
+
+    def json(self):
+        """The body parsed as a JSON object ({} when empty)."""
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except ValueError:
+            raise HttpError(400, "body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HttpError(400, "body must be a JSON object")
+        return data
+
+    def arg(self, name, default=None, type=str):
+        """A query-string argument converted with `type`, or `default` if missing."""
+        if name not in self.query:
+            return default
+        try:
+            return type(self.query[name])
+        except ValueError:
+            raise HttpError(400, f"invalid value for '{name}'")
+
+
+class Response:
+    __slots__ = ("status", "body", "content_type")
+
+    def __init__(self, status=200, body=b"", content_type="application/json"):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+
+
+def json_response(data, status=200):
+    return Response(status, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+class Router:
+    """Maps (method, '/path/{param}') to async handlers taking a Request."""
+    def __init__(self):
+        self._routes = []   # (segments, {method: handler})
+
+    def add(self, method, pattern, handler):
+        segments = tuple(pattern.strip("/").split("/"))
+        for existing, methods in self._routes:
+            if existing == segments:
+                methods[method] = handler
+                return
+        self._routes.append((segments, {method: handler}))
+
+    def match(self, method, path):
+        parts = path.strip("/").split("/")
+        for segments, methods in self._routes:
+            if len(segments) != len(parts):
+                continue
+            params = {}
+            for seg, part in zip(segments, parts):
+                if seg.startswith("{"):
+                    params[seg[1:-1]] = part
+                elif seg != part:
+                    break
+            else:
+                if method not in methods:
+                    raise HttpError(405)
+                return methods[method], params
+        raise HttpError(404)
+
+
+async def _read_request(reader):
+    """Next request on the connection, or None when the client has gone."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise HttpError(431)
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HttpError(400, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", ""):
+        raise HttpError(411)
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY:
+        raise HttpError(413)
+    body = await reader.readexactly(length) if length else b""
+    request = Request(method.upper(), target, headers, body)
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    return request, keep_alive
+
+
+def _encode(response, keep_alive):
+    phrase = HTTPStatus(response.status).phrase
+    head = (
+        f"HTTP/1.1 {response.status} {phrase}\r\n"
+        f"Content-Type: {response.content_type}\r\n"
+        f"Content-Length: {len(response.body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + response.body
+
+
+async def dispatch(router, request):
+    """Run the matching handler and turn its result or error into a Response."""
+    try:
+        handler, request.params = router.match(request.method, request.path)
+        result = await handler(request)
+    except HttpError as e:
+        return json_response({"error": str(e)}, e.status)
+    except ValueError as e:   # validation errors from core (bad grade, credit, date, ...)
+        return json_response({"error": str(e)}, 400)
+    except Exception as e:
+        return json_response({"error": f"{type(e).__name__}: {e}"}, 500)
+    if isinstance(result, Response):
+        return result
+    return json_response(result)
+
+
+async def serve_connection(router, reader, writer, idle_timeout=75):
+    """Answer requests on one connection until the client closes it or goes idle."""
+    try:
+        while True:
+            try:
+                parsed = await asyncio.wait_for(_read_request(reader), idle_timeout)
+            except HttpError as e:
+                writer.write(_encode(json_response({"error": str(e)}, e.status), False))
+                break
+            except (asyncio.TimeoutError, ConnectionError, ValueError):
+                break
+            if parsed is None:
+                break
+            request, keep_alive = parsed
+            response = await dispatch(router, request)
+            writer.write(_encode(response, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, OSError, asyncio.CancelledError):
+            pass  # client gone, or the server is shutting down
@@ -0,0 +1,17 @@
+# shared/__init__.py
+"""
+Resources shared by every page: one CTkFont per style, cached icons, theme
+colours, idle-time prewarming, visibility-aware rendering, the app-wide
+timer queue and the background I/O pool.
+"""
+
+from .prewarm import IncrementalBuild, Prewarmer
+from .resources import COLORS, font, icon, stats
+from .timers import TimerService, timers
+from .visibility import RenderScheduler, render_scheduler
+from .workers import IOPool, io_pool
+
+__all__ = [
+    'COLORS', 'IOPool', 'IncrementalBuild', 'Prewarmer', 'RenderScheduler', 'TimerService',
+    'font', 'icon', 'io_pool', 'render_scheduler', 'stats', 'timers',
+]
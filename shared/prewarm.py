@@ -0,0 +1,113 @@
+"""
+Idle-time prewarming: build pages and import heavy modules in small slices
+after the first window is drawn, so the first switch to a page is instant.
+
+Pages that can be built a piece at a time mix in IncrementalBuild and put
+their widget construction in a `build_steps()` generator that yields between
+sections. The Prewarmer runs queued work from Tk idle callbacks and stops each
+slice once `budget_ms` (less than a 60 Hz frame) is used, so input and redraws
+are serviced between slices.
+"""
+import time
+from collections import deque
+
+from diagnostics.tracing import span
+
+
+class IncrementalBuild:
+    """
+    Mixin for frames whose widgets are built by a `build_steps()` generator.
+    Call `start_build(defer)` from __init__; with defer=True nothing is built
+    until build_step() or finish_build() is called.
+    """
+    _build_iter = None
+
+    def build_steps(self):
+        return iter(())
+
+    def start_build(self, defer=False):
+        self._build_iter = self.build_steps()
+        if not defer:
+            self.finish_build()
+
+    def build_step(self):
+        """Build the next section; returns True while more sections are left."""
+        if self._build_iter is None:
+            return False
+        try:
+            next(self._build_iter)
+            return True
+        except StopIteration:
+            self._build_iter = None
+            return False
+
+    def finish_build(self):
+        while self.build_step():
+            pass
+
+    @property
+    def built(self):
+        return self._build_iter is None
+
+
+class Prewarmer:
+    """
+    Runs queued work from Tk idle callbacks in slices of at most `budget_ms`.
+
+    A work item is a callable that returns True while it has more to do (it
+    is then called again later) and anything false once it is finished. A
+    single call can't be interrupted, so items should keep each call short;
+    the slowest call is kept in `slowest` as (ms, name) to spot ones that don't.
+    """
+    def __init__(self, root, budget_ms=12, gap_ms=15):
+        self.root = root
+        self.budget_ms = budget_ms
+        self.gap_ms = gap_ms
+        self.slowest = (0.0, None)
+        self._queue = deque()   # (name, callable)
+        self._after_id = None
+
+    def add(self, name, work):
+        self._queue.append((name, work))
+
+    def start(self, delay_ms=0):
+        if self._queue and self._after_id is None:
+            self._after_id = self.root.after(delay_ms, self._schedule_slice)
+
+    def cancel(self):
+        self._queue.clear()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    @property
+    def pending(self):
+        return len(self._queue)
+
+    def _schedule_slice(self):
+        # Wait until the event queue is empty, then run one slice
+        self._after_id = self.root.after_idle(self._slice)
+
+    def _slice(self):
+        self._after_id = None
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        with span("prewarm.slice", cat="app"):
+            while self._queue:
+                name, work = self._queue[0]
+                start = time.perf_counter()
+                try:
+                    more = work()
+                except Exception:
+                    more = False   # a failed item is simply built on demand later
+                ms = (time.perf_counter() - start) * 1000
+                if ms > self.slowest[0]:
+                    self.slowest = (ms, name)
+                if not more:
+                    self._queue.popleft()
+                if time.perf_counter() >= deadline:
+                    break
+        if self._queue:
+            self._after_id = self.root.after(self.gap_ms, self._schedule_slice)
@@ -0,0 +1,78 @@
+"""
+App-wide cache for fonts, icons and theme colours.
+
+Every `ctk.CTkFont(...)` is a separate Tk named font that CustomTkinter
+rescales and tracks on its own, so building one per widget adds several
+objects to each subject row or semester card. `font()` hands out a
+single CTkFont for each (family, size, weight, slant) instead. The shared
+fonts must not be reconfigured in place; ask for another style instead.
+
+`icon()` opens each PNG once, shrinks it to what the largest (2x) scaling
+can show and caches the CTkImage by (path, size). customtkinter and PIL
+are imported on first use so the module can be imported headless.
+"""
+import os
+
+# Colours repeated across pages (the Pomodoro themes live in pomodoro.constants)
+COLORS = {
+    "text": "#ffffff",
+    "text_muted": "#d1d5db",
+    "accent": "#1a2b4c",
+    "danger": "#dc2626",
+    "danger_hover": "#b91c1c",
+    "error_banner": "#ff4757",
+    "primary": "#4A90E2",
+    "primary_hover": "#357ABD",
+}
+
+MAX_SCALING = 2.0   # icons are pre-scaled for up to 200% widget scaling
+
+_fonts = {}       # (family, size, weight, slant) -> CTkFont
+_icons = {}       # (abs path, size) -> CTkImage
+_requests = {"fonts": 0, "icons": 0}
+
+
+def font(size, weight="normal", slant="roman", family=None):
+    """The shared CTkFont for this style, created on first request."""
+    _requests["fonts"] += 1
+    key = (family, size, weight, slant)
+    cached = _fonts.get(key)
+    if cached is None:
+        import customtkinter as ctk
+
+        options = {"size": size, "weight": weight, "slant": slant}
+        if family:
+            options["family"] = family
+        cached = _fonts[key] = ctk.CTkFont(**options)
+    return cached
+
+
+def icon(path, size):
+    """A CTkImage of the PNG at `path` shown at `size` (width, height), loaded once."""
+    _requests["icons"] += 1
+    size = tuple(size)
+    key = (os.path.abspath(path), size)
+    cached = _icons.get(key)
+    if cached is None:
+        import customtkinter as ctk
+        from PIL import Image
+
+        with Image.open(path) as img:
+            img.load()
+            largest = (round(size[0] * MAX_SCALING), round(size[1] * MAX_SCALING))
+            if img.width > largest[0] or img.height > largest[1]:
+                img = img.resize(largest, Image.LANCZOS)
+            else:
+                img = img.copy()
+        cached = _icons[key] = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+    return cached
+
+
+def stats():
+    """How many fonts and icons were asked for versus actually created."""
+    created = {"fonts": len(_fonts), "icons": len(_icons)}
+    return {
+        "requested": dict(_requests),
+        "created": created,
+        "saved": sum(_requests.values()) - sum(created.values()),
+    }
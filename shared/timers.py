@@ -0,0 +1,238 @@
+"""
+One timer queue for the whole app.
+
+Pomodoro ticks, toast animation frames and auto-close timers, notification
+batching, error banners and reminder dispatch all schedule through the
+TimerService of their Tk root instead of their own `after` chains. Callbacks
+sit in one heap ordered by deadline and a single `after` is armed for the
+earliest one. Wakeups are rounded up to a frame boundary (`frame_ms`), so
+callbacks due in the same frame run together from one wakeup.
+
+A callback scheduled from inside another timer callback is timed from that
+callback's deadline rather than the (up to a frame later) moment it ran, so
+a 1 s chain like the Pomodoro countdown doesn't drift.
+
+Only the Tk thread talks to Tk. Other threads (the reminder scheduler, I/O
+workers) just push onto the heap under the lock and flag it; a light poll
+the Tk thread owns (`poll_ms`) picks the flag up and re-arms the `after`.
+The poll only runs while someone on the Tk thread `hold()`s it because
+another thread is expected to post (an I/O job with callbacks in flight, a
+reminder about to fire), so an idle app has no wakeups at all.
+"""
+import heapq
+import itertools
+import math
+import sys
+import threading
+import time
+
+from diagnostics.tracing import span
+
+
+class TimerService:
+    FRAME_MS = 16
+    POLL_MS = 50
+
+    def __init__(self, root, frame_ms=FRAME_MS, poll_ms=POLL_MS, tk_thread=None):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.poll_ms = poll_ms
+        self._tk_thread = tk_thread or threading.main_thread().ident
+        self._heap = []         # (deadline_ms, handle)
+        self._callbacks = {}    # handle -> (callback, owner); cancelled handles are dropped here
+        self._handles = itertools.count(1)
+        self._lock = threading.Lock()   # guards the heap and callbacks only; Tk is never called under it
+        self._poked = False     # another thread pushed an entry the armed `after` may not cover
+        self._holds = 0         # hold() calls not yet released; the poll runs while > 0
+        # Tk-thread state
+        self._after_id = None
+        self._armed_at = None   # frame-aligned time the pending `after` fires at
+        self._poll_id = None
+        self._base = None       # deadline of the callback being run, see module docstring
+        self.slowest = None     # (callback, ms) of the slowest callback in the last wakeup
+        self.ran = 0
+        self.wakeups = 0
+        self.polls = 0
+
+    @staticmethod
+    def now_ms():
+        return time.monotonic() * 1000
+
+    def call_later(self, delay_ms, callback, owner=None):
+        """
+        Run `callback()` after `delay_ms` on the Tk thread; returns a handle
+        for `cancel`. With `owner`, the callback is skipped if that widget has
+        been destroyed by then. Safe to call from any thread.
+        """
+        now = self.now_ms()
+        on_tk = self.on_tk_thread()
+        base = now
+        if on_tk and self._base is not None:
+            base = max(self._base, now - self.frame_ms)
+        deadline = base + max(0, delay_ms)
+        with self._lock:
+            handle = next(self._handles)
+            self._callbacks[handle] = (callback, owner)
+            heapq.heappush(self._heap, (deadline, handle))
+            if not on_tk:
+                self._poked = True
+                poked = False
+            else:
+                poked, self._poked = self._poked, False
+        if poked:
+            self._rearm()   # entries from other threads arrived while nothing polled
+        elif on_tk:
+            self._arm(deadline, now)
+        return handle
+
+    def call_soon(self, callback, owner=None):
+        return self.call_later(0, callback, owner)
+
+    def cancel(self, handle):
+        if handle is not None:
+            with self._lock:
+                self._callbacks.pop(handle, None)
+
+    def pending(self):
+        return len(self._callbacks)
+
+    def on_tk_thread(self):
+        return threading.get_ident() == self._tk_thread
+
+    def hold(self):
+        """
+        Keep polling for entries from other threads until the matching
+        `release()`. Call it on the Tk thread; from another thread it only
+        counts, and the poll starts the next time the Tk thread looks.
+        """
+        with self._lock:
+            self._holds += 1
+        self.start()
+
+    def release(self):
+        """End a `hold()`; the poll stops by itself once nothing holds it. Safe from any thread."""
+        with self._lock:
+            self._holds = max(0, self._holds - 1)
+
+    def start(self):
+        """Start the poll if it is held or entries are waiting (Tk thread only)."""
+        if self._poll_id is None and self.on_tk_thread() and (self._holds or self._poked):
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def stop(self):
+        for after_id in (self._poll_id, self._after_id):
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._poll_id = self._after_id = None
+
+    def stats(self):
+        """
+        Callbacks run, Tk wakeups (every `after` that fired, poll ticks
+        included), the net wakeups saved against one `after` per callback
+        (negative when polling cost more than batching saved), and poll ticks.
+        """
+        return {"ran": self.ran, "wakeups": self.wakeups, "saved": self.ran - self.wakeups,
+                "polls": self.polls}
+
+    def report(self):
+        s = self.stats()
+        return (f"timers: {s['ran']} callbacks in {s['wakeups']} wakeups "
+                f"({s['polls']} of them cross-thread polls), net {s['saved']:+d} wakeups saved")
+
+    # --- Internals ---
+    def _frame(self, t):
+        return math.ceil(t / self.frame_ms) * self.frame_ms
+
+    def _arm(self, deadline, now):
+        """Make sure an `after` fires by `deadline`'s frame (Tk thread, without the lock)."""
+        at = self._frame(deadline)
+        if self._after_id is not None:
+            if self._armed_at <= at:
+                return
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._armed_at = at
+        self._after_id = self.root.after(max(0, int(at - now)), self._wake)
+
+    def _rearm(self):
+        """Arm for the earliest live entry (Tk thread)."""
+        with self._lock:
+            # Drop cancelled heads so a dead entry doesn't cause a wakeup
+            while self._heap and self._heap[0][1] not in self._callbacks:
+                heapq.heappop(self._heap)
+            head = self._heap[0][0] if self._heap else None
+        if head is not None:
+            self._arm(head, self.now_ms())
+
+    def _poll(self):
+        self.polls += 1
+        self.wakeups += 1
+        with self._lock:
+            poked, self._poked = self._poked, False
+            held = self._holds > 0
+        self._poll_id = self.root.after(self.poll_ms, self._poll) if held else None
+        if poked:
+            self._rearm()
+
+    def _wake(self):
+        now = self.now_ms()
+        self._after_id = None
+        self.wakeups += 1
+        self.slowest = None
+        with self._lock:
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                deadline, handle = heapq.heappop(self._heap)
+                entry = self._callbacks.pop(handle, None)
+                if entry is not None:
+                    due.append((deadline, entry))
+        if due:
+            with span("timers.batch", cat="app", n=len(due)):
+                for deadline, (callback, owner) in due:
+                    self._run(deadline, callback, owner)
+        if self._after_id is None:
+            self._rearm()
+
+    def _run(self, deadline, callback, owner):
+        try:
+            if owner is not None and not owner.winfo_exists():
+                return
+        except Exception:
+            return   # Tk already tore the widget down
+        self.ran += 1
+        self._base = deadline
+        start = time.perf_counter()
+        try:
+            callback()
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+        finally:
+            self._base = None
+            # Lets a latency monitor name the callback behind a slow wakeup
+            ms = (time.perf_counter() - start) * 1000
+            if self.slowest is None or ms > self.slowest[1]:
+                self.slowest = (callback, ms)
+
+
+_create_lock = threading.Lock()
+
+
+def timers(widget):
+    """
+    The TimerService of `widget`'s Tk root, created on first use. Other
+    threads may look it up but its poll only starts on the Tk thread.
+    """
+    root = widget._root()
+    service = getattr(root, "_timer_service", None)
+    if service is None:
+        with _create_lock:
+            service = getattr(root, "_timer_service", None)
+            if service is None:
+                service = root._timer_service = TimerService(root)
+    service.start()
+    return service
@@ -0,0 +1,99 @@
+"""
+Page visibility and deferred rendering.
+
+The app tells the RenderScheduler which pages are shown and hidden. Pages
+route non-essential drawing (clock faces, charts, list refreshes) through
+`render(widget, key, draw)`: on a visible page `draw` runs at once, on a
+hidden page it is kept, one per key with the latest call winning, and run
+once when the page is shown again. Timers and state changes keep running
+as usual; only the drawing waits.
+
+Widgets are matched to the nearest registered ancestor (or themselves), so a
+page's canvases and labels follow the page. Widgets outside any registered
+page are treated as visible. Pages are held weakly and dropped, with their
+pending draws, when they are destroyed.
+"""
+import weakref
+
+
+class RenderScheduler:
+    def __init__(self):
+        self._visible = weakref.WeakKeyDictionary()   # registered widget -> bool
+        self._pending = weakref.WeakKeyDictionary()   # registered widget -> {key: draw}
+        self.deferred = 0    # draws skipped while hidden (superseded ones included)
+        self.flushed = 0     # draws run as catch-up on show
+
+    def register(self, page, visible=False):
+        if page not in self._visible and hasattr(page, "bind"):
+            # Pending draws are usually the page's own methods, which would keep it alive
+            page.bind("<Destroy>", lambda e, ref=weakref.ref(page): self._destroyed(ref), add="+")
+        self._visible[page] = visible
+
+    def unregister(self, page):
+        self._visible.pop(page, None)
+        self._pending.pop(page, None)
+
+    def set_visible(self, page, visible):
+        """
+        Mark a registered page shown or hidden. Calls the page's `on_shown()`
+        or `on_hidden()` hook if it has one, and on show runs the draws that
+        were deferred while it was hidden.
+        """
+        was = self._visible.get(page)
+        self._visible[page] = visible
+        if was == visible:
+            return
+        hook = getattr(page, "on_shown" if visible else "on_hidden", None)
+        if hook is not None:
+            hook()
+        if visible:
+            self.flush(page)
+
+    def is_visible(self, widget):
+        owner = self._owner(widget)
+        return owner is None or self._visible[owner]
+
+    def render(self, widget, key, draw):
+        """Run `draw()` now if `widget` is on a visible page, else once the page is shown."""
+        owner = self._owner(widget)
+        if owner is None or self._visible[owner]:
+            draw()
+        else:
+            self._pending.setdefault(owner, {})[key] = draw
+            self.deferred += 1
+
+    def cancel(self, widget, key):
+        owner = self._owner(widget)
+        if owner is not None:
+            self._pending.get(owner, {}).pop(key, None)
+
+    def flush(self, page):
+        for draw in self._pending.pop(page, {}).values():
+            self.flushed += 1
+            try:
+                draw()
+            except Exception:
+                pass   # the widget may have been destroyed meanwhile
+
+    def _destroyed(self, ref):
+        page = ref()
+        if page is not None:
+            self.unregister(page)
+
+    def _owner(self, widget):
+        while widget is not None:
+            if widget in self._visible:
+                return widget
+            widget = getattr(widget, "master", None)
+        return None
+
+
+_render_scheduler = None
+
+
+def render_scheduler():
+    """Process-wide RenderScheduler shared by the app and its pages."""
+    global _render_scheduler
+    if _render_scheduler is None:
+        _render_scheduler = RenderScheduler()
+    return _render_scheduler
@@ -0,0 +1,155 @@
+"""
+App-wide worker pool for blocking file I/O.
+
+Pages snapshot what they want to save on the Tk thread and hand the write to
+`io_pool().submit(...)`; loads are read and parsed on a worker the same way.
+Jobs with the same `key` (normally the file path) run one after another, so
+two saves of one file never overlap and a load can't race a save. With
+`coalesce=True` a job replaces a same-key job that is still waiting, so a
+burst of saves writes the file once with the latest data. `on_done(result)`
+and `on_error(exc)` are posted back to the Tk thread through the timer
+queue of `widget`, which keeps polling for them only while such a job is
+in flight.
+"""
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .timers import timers
+
+
+class _Job:
+    __slots__ = ("func", "args", "key", "widget", "on_done", "on_error", "coalesce", "future", "timers")
+
+    def __init__(self, func, args, key, widget, on_done, on_error, coalesce):
+        self.func = func
+        self.args = args
+        self.key = key
+        self.widget = widget
+        self.on_done = on_done
+        self.on_error = on_error
+        self.coalesce = coalesce
+        self.future = Future()
+        self.timers = None   # TimerService held for the callbacks, if there are any
+
+
+class IOPool:
+    def __init__(self, max_workers=2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="io")
+        self._cond = threading.Condition()
+        self._waiting = {}      # key -> deque of jobs queued behind the running one
+        self._running = set()   # keys with a job on a worker
+        self._pending = 0       # jobs submitted and not yet finished
+        self._closed = False
+
+    def submit(self, func, *args, key=None, widget=None, on_done=None, on_error=None, coalesce=False):
+        """
+        Run `func(*args)` on a worker and return a Future. Callbacks run on the
+        Tk thread of `widget` (and are dropped if it has been destroyed);
+        without a widget they run on the worker.
+        """
+        job = _Job(func, args, key, widget, on_done, on_error, coalesce)
+        if widget is not None and (on_done is not None or on_error is not None):
+            job.timers = timers(widget)
+            job.timers.hold()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("IOPool is shut down")
+            if key is not None and key in self._running:
+                queue = self._waiting.setdefault(key, deque())
+                if coalesce and queue and queue[-1].coalesce:
+                    # Take over the waiting job's place; it resolves with this one's result
+                    replaced = queue.pop()
+                    job.future.add_done_callback(lambda f, old=replaced.future: _chain(f, old))
+                    if replaced.timers is not None:
+                        replaced.timers.release()   # its callbacks will never be posted
+                else:
+                    self._pending += 1
+                queue.append(job)
+                return job.future
+            self._pending += 1
+            if key is not None:
+                self._running.add(key)
+        self._executor.submit(self._run, job)
+        return job.future
+
+    def pending(self):
+        return self._pending
+
+    def wait(self, timeout=None):
+        """Block until every submitted job has finished; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending, timeout)
+
+    def shutdown(self, wait=True):
+        """Stop taking jobs; with `wait`, let queued ones (pending saves) finish first."""
+        with self._cond:
+            self._closed = True
+        if wait:
+            self.wait()
+        self._executor.shutdown(wait=wait)
+
+    # --- Internals ---
+    def _run(self, job):
+        try:
+            result = job.func(*job.args)
+        except BaseException as e:
+            job.future.set_exception(e)
+            self._deliver(job, job.on_error, e)
+        else:
+            job.future.set_result(result)
+            self._deliver(job, job.on_done, result)
+        finally:
+            self._next(job.key)
+
+    def _deliver(self, job, callback, value):
+        if job.timers is None:
+            if callback is not None:
+                callback(value)
+            return
+
+        def deliver():
+            job.timers.release()
+            try:
+                alive = job.widget.winfo_exists()
+            except Exception:
+                alive = False   # Tk already tore the widget down
+            if callback is not None and alive:
+                callback(value)
+        job.timers.call_soon(deliver)
+
+    def _next(self, key):
+        with self._cond:
+            self._pending -= 1
+            nxt = None
+            if key is not None:
+                queue = self._waiting.get(key)
+                if queue:
+                    nxt = queue.popleft()
+                    if not queue:
+                        del self._waiting[key]
+                else:
+                    self._running.discard(key)
+            self._cond.notify_all()
+        if nxt is not None:
+            self._executor.submit(self._run, nxt)
+
+
+def _chain(source, target):
+    if source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+_io_pool = None
+_io_pool_lock = threading.Lock()
+
+
+def io_pool():
+    """Process-wide IOPool shared by every page."""
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = IOPool()
+        return _io_pool
@@ -0,0 +1,45 @@
+"""A stand-in for a Tk root, so the timer queue and I/O pool run headless."""
+import itertools
+import time
+import traceback
+
+
+class FakeRoot:
+    """Runs `after` callbacks from `run()` on the calling (Tk) thread."""
+    def __init__(self):
+        self._afters = {}   # id -> (monotonic deadline, callback)
+        self._ids = itertools.count(1)
+        self.alive = True
+        self.errors = []
+
+    def _root(self):
+        return self
+
+    def winfo_exists(self):
+        return self.alive
+
+    def after(self, ms, callback):
+        after_id = f"after#{next(self._ids)}"
+        self._afters[after_id] = (time.monotonic() + ms / 1000, callback)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self._afters.pop(after_id, None)
+
+    def pending_afters(self):
+        return len(self._afters)
+
+    def report_callback_exception(self, *exc):
+        self.errors.append("".join(traceback.format_exception(*exc)))
+
+    def run(self, seconds, until=None):
+        """Run due `after` callbacks for up to `seconds`, or until `until()` is true."""
+        end = time.monotonic() + seconds
+        while time.monotonic() < end and not (until and until()):
+            due = [(d, i) for i, (d, _) in self._afters.items() if d <= time.monotonic()]
+            if not due:
+                time.sleep(0.002)
+                continue
+            _, after_id = min(due)
+            _, callback = self._afters.pop(after_id)
+            callback()
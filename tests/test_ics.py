@@ -0,0 +1,103 @@
+import io
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from core.reminders import ics, zones
+from core.reminders.models import Reminder
+from core.reminders.recurrence import DAILY, WEEKLY, RecurrenceRule
+from core.reminders.scheduler import ReminderScheduler
+from core.reminders.services import ReminderService
+
+NEW_YORK = "America/New_York"
+BERLIN = "Europe/Berlin"
+
+
+def local_zone(name):
+    return mock.patch.object(zones, "_local_name", name)
+
+
+def events(text):
+    return list(ics.iter_events(io.StringIO(text)))
+
+
+class ParserTest(unittest.TestCase):
+    def setUp(self):
+        patcher = local_zone(BERLIN)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_folded_escaped_summary_and_alarm(self):
+        [event] = events(
+            "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:abc@example.com\r\n"
+            "SUMMARY:Read chapter 3\\, then\r\n  the exercises\\nquickly\r\n"
+            "DTSTART:20260310T090000\r\n"
+            "BEGIN:VALARM\r\nTRIGGER:-PT15M\r\nEND:VALARM\r\n"
+            "END:VEVENT\r\nEND:VCALENDAR\r\n")
+        self.assertEqual(event.summary, "Read chapter 3, then the exercises\nquickly")
+        self.assertEqual(event.remind_time(), datetime(2026, 3, 10, 8, 45))
+        self.assertIsNone(event.tzid)
+
+    def test_utc_and_tzid_become_local_wall_time(self):
+        self.assertEqual(ics.parse_datetime("20260310T130000Z"), datetime(2026, 3, 10, 14))
+        self.assertEqual(ics.parse_datetime("20260310T090000", {"TZID": NEW_YORK}),
+                         datetime(2026, 3, 10, 14))
+        # An unknown zone is read as floating local time
+        self.assertEqual(ics.parse_datetime("20260310T090000", {"TZID": "Mars/Olympus"}),
+                         datetime(2026, 3, 10, 9))
+
+    def test_bad_rrule_values_raise(self):
+        start = datetime(2026, 3, 10, 9)
+        for rrule in ("FREQ=DAILY;INTERVAL=0", "FREQ=DAILY;COUNT=0", "FREQ=DAILY;INTERVAL=x"):
+            with self.subTest(rrule=rrule), self.assertRaises(ValueError):
+                ics.rule_from_rrule(rrule, start)
+
+    def test_unsupported_rrule_is_none(self):
+        self.assertIsNone(ics.rule_from_rrule("FREQ=YEARLY", datetime(2026, 3, 10, 9)))
+
+
+class ExportTest(unittest.TestCase):
+    def export(self, reminders):
+        f = io.StringIO()
+        ics.write_calendar(f, reminders)
+        return f.getvalue()
+
+    def test_dtstart_carries_zone_and_until_is_utc(self):
+        with local_zone(NEW_YORK):
+            rule = RecurrenceRule(WEEKLY, until=datetime(2026, 6, 2, 9))
+            r = Reminder("Lab", datetime(2026, 3, 10, 9), rule=rule,
+                         scheduler=ReminderScheduler())
+            text = self.export([r])
+        self.assertIn("DTSTART;TZID=America/New_York:20260310T090000\r\n", text)
+        self.assertIn("RRULE:FREQ=WEEKLY;INTERVAL=1;BYDAY=TU;UNTIL=20260602T130000Z\r\n", text)
+
+    def test_round_trip_across_zones(self):
+        with local_zone(NEW_YORK):
+            r = Reminder("Standup", datetime(2026, 3, 10, 9), rule=RecurrenceRule(DAILY),
+                         scheduler=ReminderScheduler())
+            text = self.export([r])
+        with local_zone(BERLIN), tempfile.TemporaryDirectory() as directory:
+            service = ReminderService(directory)
+            [event] = events(text)
+            imported = service.from_event(event, now=datetime(2026, 3, 1))
+            # 09:00 EDT is 14:00 CET: the same instant ...
+            self.assertEqual(imported.remind_time, datetime(2026, 3, 10, 14))
+            self.assertEqual(imported.tz, NEW_YORK)
+            # ... and after Berlin's own DST change it still follows New York's clock
+            imported.catch_up(datetime(2026, 3, 30, 14, 30))
+            self.assertEqual(imported.remind_time, datetime(2026, 3, 30, 15))
+
+    def test_one_off_without_zone_is_written_in_utc(self):
+        with local_zone(NEW_YORK):
+            r = Reminder("Submit", datetime(2026, 3, 10, 9), scheduler=ReminderScheduler())
+            r.tz = None
+            text = self.export([r])
+        self.assertIn("DTSTART:20260310T130000Z\r\n", text)
+        with local_zone(BERLIN):
+            [event] = events(text)
+        self.assertEqual(event.remind_time(), datetime(2026, 3, 10, 14))
+
+
+if __name__ == "__main__":
+    unittest.main()
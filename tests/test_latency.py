@@ -0,0 +1,50 @@
+import threading
+import time
+import tkinter as tk
+import unittest
+
+from diagnostics.latency import LatencyMonitor
+from shared.timers import TimerService
+
+from .fakes import FakeRoot
+
+
+def slow_refresh():
+    time.sleep(0.03)
+
+
+def quick_tick():
+    pass
+
+
+class LatencyMonitorTest(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.timers = TimerService(self.root, tk_thread=threading.get_ident())
+        self.monitor = LatencyMonitor(self.root, stall_ms=20)
+        # Time Tk callbacks without the heartbeat, which needs a real event loop
+        self.monitor._running = True
+        self.monitor._patch_callwrapper()
+        self.addCleanup(self.monitor.stop)
+
+    def tk_call(self, func):
+        """Call `func` the way Tk does, through tkinter's CallWrapper."""
+        tk.CallWrapper(func, None, self.root)()
+
+    def test_timer_stall_names_the_slowest_callback(self):
+        self.timers.call_soon(quick_tick)
+        self.timers.call_soon(slow_refresh)
+        self.timers.call_soon(quick_tick)
+        time.sleep(0.01)
+        self.tk_call(self.timers._wake)
+        self.assertEqual(list(self.monitor.stall_counts), ["slow_refresh (timer)"])
+        self.assertEqual(self.timers.ran, 3)
+
+    def test_other_stalls_keep_their_own_name(self):
+        self.tk_call(slow_refresh)
+        self.tk_call(quick_tick)
+        self.assertEqual(list(self.monitor.stall_counts), ["slow_refresh"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from diagnostics.leaks import LeakTracker
+
+
+class Widget:
+    """Stands in for tk.BaseWidget: the tracker patches __init__ and destroy."""
+    def __init__(self, master=None):
+        self.master = master
+
+    def destroy(self):
+        pass
+
+
+class Page(Widget):
+    pass
+
+
+class LeakTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker = LeakTracker(grace_s=0)
+        self.tracker.start(classes=(Widget,))
+        self.addCleanup(self.tracker.stop)
+
+    def test_counts_live_widgets_by_class(self):
+        page = Page()
+        labels = [Widget(page) for _ in range(3)]
+        self.assertEqual(self.tracker.live_counts(), {"Widget": 3, "Page": 1})
+        labels[0].destroy()
+        self.assertEqual(self.tracker.live_counts()["Widget"], 2)
+
+    def test_destroyed_and_freed_widgets_are_forgotten(self):
+        page = Page()
+        page.destroy()
+        del page
+        self.assertEqual(self.tracker.outlived(), [])
+        self.assertEqual(len(self.tracker._records), 0)
+
+    def test_destroyed_widget_still_referenced_is_reported(self):
+        semester = {"detail_page": Page()}
+        semester["detail_page"].destroy()
+        [(label, _, hint)] = self.tracker.outlived()
+        self.assertEqual(label, "Page")
+        self.assertIn("dict['detail_page']", hint)
+        self.assertIn("1 object(s) outlived their widget", self.tracker.report())
+
+    def test_tracked_objects_go_with_their_owner(self):
+        page = Page()
+
+        class Chart:
+            pass
+        chart = Chart()
+        self.tracker.track(chart, owner=page)
+        page.destroy()
+        del page
+        self.assertEqual([label for label, _, _ in self.tracker.outlived()], ["Chart"])
+
+    def test_stop_restores_the_classes(self):
+        self.tracker.stop()
+        Widget()
+        self.assertEqual(self.tracker.live_counts(), {})
+        self.assertNotIn("__wrapped__", vars(Widget.__init__))
+
+
+if __name__ == "__main__":
+    unittest.main()
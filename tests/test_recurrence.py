@@ -0,0 +1,67 @@
+import itertools
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from core.reminders import zones
+from core.reminders.models import Reminder
+from core.reminders.recurrence import DAILY, MINUTELY, RecurrenceRule
+from core.reminders.scheduler import ReminderScheduler
+from core.reminders.storage import ReminderStorage
+
+NEW_YORK = "America/New_York"
+
+
+class CompiledRecurrenceDstTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(zones, "_local_name", NEW_YORK)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def occurrences(self, start, n):
+        rule = RecurrenceRule(DAILY, tz=NEW_YORK).compile(start)
+        return [rule.occurrence(k) for k in range(n)]
+
+    def test_start_in_gap_keeps_wall_time(self):
+        # 02:30 doesn't exist on 2025-03-09; only that day moves to 03:30
+        self.assertEqual(self.occurrences(datetime(2025, 3, 9, 2, 30), 3), [
+            datetime(2025, 3, 9, 3, 30),
+            datetime(2025, 3, 10, 2, 30),
+            datetime(2025, 3, 11, 2, 30),
+        ])
+
+    def test_gap_and_fold_resolved_per_day(self):
+        self.assertEqual(self.occurrences(datetime(2025, 3, 8, 2, 30), 3)[1:], [
+            datetime(2025, 3, 9, 3, 30),
+            datetime(2025, 3, 10, 2, 30),
+        ])
+        # 01:30 happens twice on 2025-11-02: the occurrence is the earlier one
+        fold = self.occurrences(datetime(2025, 11, 1, 1, 30), 3)
+        self.assertEqual(fold[1:], [datetime(2025, 11, 2, 1, 30), datetime(2025, 11, 3, 1, 30)])
+        self.assertEqual(zones.get(NEW_YORK).from_wall(fold[1]),
+                         datetime.fromisoformat("2025-11-02T01:30-04:00").timestamp())
+
+    def test_next_after_skips_nothing_across_the_gap(self):
+        rule = RecurrenceRule(DAILY, tz=NEW_YORK).compile(datetime(2025, 3, 9, 2, 30))
+        self.assertEqual(list(itertools.islice(rule, 2)), [datetime(2025, 3, 9, 3, 30), datetime(2025, 3, 10, 2, 30)])
+
+    def test_minute_steps_cover_the_repeated_hour(self):
+        # Clocks go back at 02:00 EDT on 2025-11-02, so 01:00-02:00 local happens twice
+        reminder = Reminder("stretch", datetime(2025, 11, 2, 0, 30), rule=RecurrenceRule(MINUTELY, 30),
+                            scheduler=ReminderScheduler(), tz=NEW_YORK)
+        due, walls, saved = [reminder.due_ts], [reminder.remind_time], None
+        for _ in range(5):
+            self.assertTrue(reminder.advance())
+            due.append(reminder.due_ts)
+            walls.append(reminder.remind_time)
+            if len(due) == 5:   # the second 01:30
+                saved = ReminderStorage.to_item(reminder)
+        start = datetime.fromisoformat("2025-11-02T04:30+00:00").timestamp()
+        self.assertEqual(due, [start + 1800 * i for i in range(6)])
+        self.assertEqual([w.strftime("%H:%M") for w in walls], ["00:30", "01:00", "01:30", "01:00", "01:30", "02:00"])
+        # Saving and loading keeps it in the second pass
+        self.assertEqual(ReminderStorage.from_item(saved, scheduler=reminder.scheduler).due_ts, due[4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from core.reminders.models import Reminder
+from core.reminders.search import ReminderIndex
+from core.reminders.store import ReminderStore
+
+BASE = datetime(2026, 1, 5, 9, 0)
+
+
+def build(messages):
+    reminders = [Reminder(m, BASE + timedelta(minutes=i), tz="UTC") for i, m in enumerate(messages)]
+    store = ReminderStore()
+    store.add_many(reminders)
+    index = ReminderIndex(store)
+    index.add_many(reminders)
+    return index, reminders
+
+
+class ReminderIndexSearchTest(unittest.TestCase):
+    def test_prefix_matches_every_word(self):
+        index, reminders = build(f"w{i:03d} task" for i in range(120))
+        found = index.search("w", limit=500, now=BASE)
+        self.assertEqual([r.id for r in found], [r.id for r in reminders])
+
+    def test_common_word_walks_due_order(self):
+        index, reminders = build("exam prep" if i % 7 == 0 else "gym" for i in range(21000))
+        # Ordering 3000 matches by due time costs far more than walking ~3500 steps
+        with mock.patch("core.reminders.search.heapq.nsmallest", side_effect=AssertionError("sorted")):
+            found = index.search("exam", limit=500, now=BASE)
+        expected = [r.id for r in reminders if r.message.startswith("exam")][:500]
+        self.assertEqual([r.id for r in found], expected)
+
+    def test_plans_agree(self):
+        words = ["exam", "study", "call", "lab", "quiz"]
+        messages = [" ".join(words[j] for j in range(5) if (i >> j) & 1) or "none" for i in range(3000)]
+        index, reminders = build(messages)
+        for query in ("exam", "exam study", "exam study call lab", "qu", "lab 2026-01-06"):
+            terms = query.split()
+            day = "2026-01-06" in terms
+            if day:
+                terms.remove("2026-01-06")
+
+            def matches(r):
+                tokens = r.message.split()
+                return (all(t in tokens for t in terms[:-1]) and any(t.startswith(terms[-1]) for t in tokens)
+                        and (not day or r.remind_time.date() == BASE.date() + timedelta(days=1)))
+            expected = [r.id for r in reminders if matches(r)][:200]
+            self.assertEqual([r.id for r in index.search(query, limit=200, now=BASE)], expected, query)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from core.reminders.scheduler import ReminderScheduler
+from core.reminders.services import ReminderService
+
+
+class ReminderServiceTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+
+    def test_shared_scheduler_is_used(self):
+        shared = ReminderScheduler()   # empty, so falsy through __len__
+        self.addCleanup(shared.shutdown)
+        a = ReminderService(f"{self.directory}/a", scheduler=shared)
+        b = ReminderService(f"{self.directory}/b", scheduler=shared)
+        self.assertIs(a.scheduler, shared)
+        self.assertIs(b.scheduler, shared)
+
+        later = datetime.now() + timedelta(days=1)
+        first = a.add(a.new("a", later))
+        batch = [b.new(f"b{i}", later + timedelta(minutes=i)) for i in range(3)]
+        b.add_many(batch)
+        self.assertEqual(len(shared), 4)
+        self.assertIn(first.id, shared)
+        self.assertTrue(all(r.id in shared for r in batch))
+
+    def test_default_scheduler_is_private(self):
+        a = ReminderService(f"{self.directory}/a")
+        b = ReminderService(f"{self.directory}/b")
+        self.addCleanup(a.scheduler.shutdown)
+        self.addCleanup(b.scheduler.shutdown)
+        self.assertIsNot(a.scheduler, b.scheduler)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from core.reminders.models import Reminder
+from core.reminders.scheduler import ReminderScheduler
+from core.reminders.storage import ReminderStorage
+
+NOW = datetime(2026, 3, 10, 8)
+
+
+class JournalReplayTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.storage = ReminderStorage(os.path.join(directory.name, "reminders.json"))
+        self.reminder = Reminder("Essay", datetime(2026, 3, 10, 9), scheduler=ReminderScheduler())
+
+    def loaded_time(self):
+        [loaded] = self.storage.load(now=NOW)
+        return loaded.remind_time
+
+    def age(self, path, seconds):
+        """Backdate `path`, as if it was written `seconds` ago."""
+        t = os.path.getmtime(path) - seconds
+        os.utime(path, (t, t))
+
+    def test_snooze_after_save_is_replayed(self):
+        self.storage.save([self.reminder])
+        self.age(self.storage.path, 5)
+        self.reminder.snooze(datetime(2026, 3, 10, 9, 10))
+        self.storage.log_snooze(self.reminder)
+        self.assertEqual(self.loaded_time(), datetime(2026, 3, 10, 9, 10))
+
+    def test_crash_before_clear_keeps_the_newer_save(self):
+        self.storage.save([self.reminder])
+        self.reminder.snooze(datetime(2026, 3, 10, 9, 10))
+        self.storage.log_snooze(self.reminder)
+        # Edited and saved again, but the process died before the journal was cleared
+        self.reminder.snooze(datetime(2026, 3, 10, 11))
+        with mock.patch.object(self.storage.journal, "clear"):
+            self.storage.save([self.reminder])
+        self.assertTrue(self.storage.journal.entries())
+        self.assertEqual(self.loaded_time(), datetime(2026, 3, 10, 11))
+
+    def test_entries_from_older_versions_still_apply(self):
+        self.storage.save([self.reminder])
+        self.reminder.snooze(self.reminder.remind_time + timedelta(minutes=5))
+        entry = self.storage.to_item(self.reminder)
+        with open(self.storage.journal.path, "w", encoding="utf-8") as f:
+            f.write('{"op": "snooze", "id": "%s", "remind_time": "%s"}\n'
+                    % (self.reminder.id, entry["remind_time"]))
+        self.assertEqual(self.loaded_time(), datetime(2026, 3, 10, 9, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
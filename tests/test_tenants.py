@@ -0,0 +1,61 @@
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from core.reminders.tenants import TenantReminderService
+
+
+class TenantSweepTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.service = self.open()
+
+    def open(self):
+        service = TenantReminderService(self.directory, horizon=timedelta(hours=1), idle_after=0)
+        self.addCleanup(service.close)
+        return service
+
+    def add(self, user_id, due_in):
+        with self.service.user(user_id) as reminders:
+            reminder = reminders.add(reminders.new("r", datetime.now() + due_in))
+            reminders.save()
+        return reminder
+
+    def test_idle_user_is_unloaded_and_woken_near_their_next_reminder(self):
+        reminder = self.add("alice", timedelta(hours=2))
+        self.assertEqual(self.service.sweep(), (0, 1))
+        self.assertFalse(self.service.is_loaded("alice"))
+        self.assertEqual(self.service.sweep(), (0, 0))   # not due yet: stays unloaded
+
+        self.assertEqual(self.service.sweep(time.time() + 1.5 * 3600), (1, 0))
+        self.assertTrue(self.service.is_loaded("alice"))
+        with self.service.user("alice") as reminders:
+            self.assertIn(reminder.id, reminders.store)
+
+    def test_user_with_something_due_soon_stays_loaded(self):
+        self.add("bob", timedelta(minutes=10))
+        self.assertEqual(self.service.sweep(), (0, 0))
+        self.assertTrue(self.service.is_loaded("bob"))
+
+    def test_finished_or_stopped_reminders_dont_wake_the_user(self):
+        finished = self.add("carol", timedelta(minutes=10))
+        finished.finished = True
+        stopped = self.add("carol", timedelta(minutes=20))
+        stopped.stopped = True
+        self.assertEqual(self.service.sweep(), (0, 1))
+        self.assertEqual(len(self.service.wake), 0)
+        self.assertEqual(self.service.sweep(), (0, 0))
+
+    def test_wake_index_survives_a_clean_restart(self):
+        self.add("dave", timedelta(hours=2))
+        self.service.close()
+        self.service = self.open()
+        self.assertFalse(self.service.is_loaded("dave"))
+        self.assertEqual(self.service.sweep(time.time() + 1.5 * 3600), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
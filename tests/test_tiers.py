@@ -0,0 +1,93 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from core.reminders.models import Reminder
+from core.reminders.tiers import ColdIndex, TieredScheduler
+
+
+class ColdIndexTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cold = ColdIndex(os.path.join(directory.name, "cold.db"))
+        self.addCleanup(self.cold.close)
+
+    def test_take_due_is_earliest_first_and_removes(self):
+        self.cold.put_many([("c", 30.0), ("a", 10.0), ("b", 20.0), ("late", 99.0)])
+        self.assertEqual(self.cold.take_due(30.0, 2), ["a", "b"])
+        self.assertEqual(self.cold.take_due(30.0, 2), ["c"])
+        self.assertEqual(self.cold.next_due(), 99.0)
+        self.assertEqual(len(self.cold), 1)
+
+    def test_put_moves_an_existing_id(self):
+        self.cold.put_many([("a", 10.0)])
+        self.cold.put_many([("a", 50.0)])
+        self.assertEqual(len(self.cold), 1)
+        self.assertEqual(self.cold.take_due(40.0, 10), [])
+
+
+class TieredSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.reminders = {}
+        self.scheduler = TieredScheduler(os.path.join(directory.name, "cold.db"),
+                                         self.reminders.get, horizon=timedelta(hours=1),
+                                         batch_size=2)
+        self.addCleanup(self.scheduler.shutdown)
+
+    def reminder(self, due_in):
+        r = Reminder("r", datetime.now() + due_in, scheduler=self.scheduler)
+        self.reminders[r.id] = r
+        return r
+
+    def advance_to(self, now):
+        with self.scheduler._cond:
+            self.scheduler._before_wait(now)
+
+    def test_later_reminders_are_parked_cold(self):
+        soon = self.reminder(timedelta(minutes=10))
+        later = [self.reminder(timedelta(hours=h)) for h in (2, 3, 4)]
+        self.scheduler.schedule_many([soon, *later])
+        self.assertEqual((self.scheduler.hot_count(), len(self.scheduler)), (1, 4))
+        self.assertIn(soon.id, self.scheduler)
+        self.assertNotIn(later[0].id, self.scheduler)
+
+    def test_promoted_in_batches_as_the_horizon_moves(self):
+        later = [self.reminder(timedelta(hours=2, minutes=m)) for m in range(5)]
+        self.scheduler.schedule_many(later)
+        self.assertEqual(self.scheduler.hot_count(), 0)
+        # An hour and a half on, all five are within the horizon: batches of 2 drain them
+        self.advance_to(time.time() + 1.5 * 3600)
+        self.assertEqual(self.scheduler.hot_count(), 5)
+        self.assertEqual(len(self.scheduler.cold), 0)
+        self.assertIsNone(self.scheduler._cold_next)
+
+    def test_only_reminders_inside_the_horizon_are_promoted(self):
+        two, four = self.reminder(timedelta(hours=2)), self.reminder(timedelta(hours=4))
+        self.scheduler.schedule_many([two, four])
+        self.advance_to(time.time() + 1.5 * 3600)
+        self.assertIn(two.id, self.scheduler)
+        self.assertNotIn(four.id, self.scheduler)
+        self.assertEqual(self.scheduler._cold_next, four.due_ts)
+
+    def test_stopped_or_gone_reminders_are_dropped(self):
+        stopped, gone = self.reminder(timedelta(hours=2)), self.reminder(timedelta(hours=2))
+        self.scheduler.schedule_many([stopped, gone])
+        stopped.stopped = True
+        del self.reminders[gone.id]
+        self.advance_to(time.time() + 1.5 * 3600)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_cancel_removes_a_cold_entry(self):
+        later = self.reminder(timedelta(hours=2))
+        self.scheduler.schedule_many([later])
+        self.scheduler.cancel(later.id)
+        self.assertEqual(len(self.scheduler), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
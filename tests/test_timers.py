@@ -0,0 +1,54 @@
+import threading
+import time
+import unittest
+
+from shared.timers import TimerService
+
+from .fakes import FakeRoot
+
+
+class TimerServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.timers = TimerService(self.root, poll_ms=10, tk_thread=threading.get_ident())
+
+    def test_idle_has_no_wakeups(self):
+        self.timers.start()
+        self.root.run(0.1)
+        self.assertEqual(self.root.pending_afters(), 0)
+        self.assertEqual(self.timers.stats()["wakeups"], 0)
+
+    def test_batches_callbacks_due_in_one_frame(self):
+        ran = []
+        for i in range(5):
+            self.timers.call_later(20, lambda i=i: ran.append(i))
+        self.root.run(0.5, until=lambda: len(ran) == 5)
+        self.assertEqual(ran, [0, 1, 2, 3, 4])
+        self.assertEqual(self.timers.stats(), {"ran": 5, "wakeups": 1, "saved": 4, "polls": 0})
+
+    def test_polls_only_while_held(self):
+        ran = []
+        self.timers.hold()
+        threading.Thread(target=lambda: self.timers.call_soon(lambda: ran.append(threading.get_ident()))).start()
+        self.root.run(1, until=lambda: ran)
+        self.assertEqual(ran, [threading.get_ident()])   # ran on the "Tk" thread
+        self.timers.release()
+        self.root.run(0.1)
+        self.assertEqual(self.root.pending_afters(), 0)   # the poll stopped
+        stats = self.timers.stats()
+        self.assertGreater(stats["polls"], 0)
+        self.assertEqual(stats["wakeups"], stats["polls"] + 1)
+        self.assertEqual(stats["saved"], 1 - stats["wakeups"])   # polling shows up as a net loss
+
+    def test_unpolled_entries_run_with_the_next_tk_timer(self):
+        ran = []
+        thread = threading.Thread(target=lambda: self.timers.call_soon(lambda: ran.append("other")))
+        thread.start()
+        thread.join()
+        self.timers.call_later(0, lambda: ran.append("tk"))
+        self.root.run(0.5, until=lambda: len(ran) == 2)
+        self.assertEqual(sorted(ran), ["other", "tk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from core.reminders.models import Reminder
+from core.reminders.services import ReminderService
+from core.reminders.timing_wheel import TimingWheel, TimingWheelScheduler
+
+DAY = 86400
+START = 40 * 512 * DAY   # lines up with slot 0 on every level
+
+
+class TimingWheelTest(unittest.TestCase):
+    def assert_fires_at(self, wheel, item_id, due):
+        self.assertNotIn(item_id, wheel.advance(due - 1))
+        self.assertEqual(wheel.advance(due), [item_id])
+
+    def test_cascade_across_levels(self):
+        wheel = TimingWheel(START)
+        dues = {"second": START + 5, "minute": START + 125, "hour": START + 2 * 3600 + 7,
+                "day": START + 3 * DAY + 11}
+        for name, due in dues.items():
+            wheel.add(name, due, name)
+        self.assertEqual([wheel._where[n] is b for n, b in (
+            ("second", wheel._levels[0][5]), ("minute", wheel._levels[1][2]),
+            ("hour", wheel._levels[2][2]), ("day", wheel._levels[3][3]),
+        )], [True] * 4)
+        for name, due in sorted(dues.items(), key=lambda kv: kv[1]):
+            self.assert_fires_at(wheel, name, due)
+        self.assertEqual(len(wheel), 0)
+
+    def test_overflow_is_rehomed(self):
+        wheel = TimingWheel(START)
+        due = START + 600 * DAY + 30
+        wheel.add("far", due, "far")
+        self.assertIn("far", wheel._overflow)
+        self.assert_fires_at(wheel, "far", due)
+
+    def test_cancel_after_cascade(self):
+        wheel = TimingWheel(START)
+        wheel.add("x", START + 3700, "x")
+        self.assertEqual(wheel.advance(START + 3600), [])
+        self.assertNotIn("x", wheel._levels[2][1])   # now in a finer level
+        wheel.cancel("x")
+        self.assertEqual(wheel.advance(START + 4000), [])
+        self.assertEqual((len(wheel), wheel._counts), (0, [0, 0, 0, 0]))
+
+    def test_never_fires_early(self):
+        wheel = TimingWheel(START)
+        wheel.add("x", START + 10.5, "x")
+        self.assertEqual(wheel.advance(START + 10), [])
+        self.assertEqual(wheel.advance(START + 11), ["x"])
+
+
+class TimingWheelSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TimingWheelScheduler()
+        self.addCleanup(self.scheduler.shutdown)
+
+    def test_service_backend(self):
+        with tempfile.TemporaryDirectory() as directory:
+            service = ReminderService(directory, scheduler=self.scheduler)
+            later = datetime.now() + timedelta(days=1)
+            service.add_many([service.new(f"r{i}", later + timedelta(minutes=i)) for i in range(20)])
+            service.save()
+            reloaded = ReminderService(directory, scheduler=TimingWheelScheduler())
+            self.addCleanup(reloaded.scheduler.shutdown)
+            reloaded.load()
+            self.assertEqual((len(self.scheduler), len(reloaded.scheduler)), (20, 20))
+
+    def test_moved_entry_is_not_fired_at_its_old_time(self):
+        fired = []
+        reminder = Reminder("x", datetime.now() - timedelta(seconds=1), scheduler=self.scheduler,
+                            callback=lambda r, message: fired.append(time.time()))
+        with self.scheduler._cond:
+            self.scheduler._push(reminder)
+            # The worker took the entry off the wheel, then the reminder was snoozed
+            self.scheduler._ready.extend(self.scheduler.wheel.advance(time.time()))
+        reminder.snooze(datetime.now() + timedelta(seconds=1.5))
+        due = reminder.due_ts
+        deadline = time.time() + 5
+        while not fired and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(len(fired), 1)
+        self.assertGreaterEqual(fired[0], due)
+
+
+if __name__ == "__main__":
+    unittest.main()
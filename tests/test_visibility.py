@@ -0,0 +1,61 @@
+import gc
+import unittest
+
+from shared.visibility import RenderScheduler
+
+
+class FakeWidget:
+    def __init__(self, master=None):
+        self.master = master
+        self.bindings = {}
+
+    def bind(self, sequence, func, add=None):
+        self.bindings.setdefault(sequence, []).append(func)
+
+    def destroy(self):
+        for func in self.bindings.get("<Destroy>", []):
+            func(None)
+
+
+class FakePage(FakeWidget):
+    def draw(self):
+        pass
+
+
+class RenderSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.render = RenderScheduler()
+
+    def test_hidden_page_defers_the_latest_draw_per_key(self):
+        page = FakePage()
+        canvas = FakeWidget(master=page)
+        self.render.register(page)
+        drawn = []
+        self.render.render(canvas, "clock", lambda: drawn.append(1))
+        self.render.render(canvas, "clock", lambda: drawn.append(2))
+        self.assertEqual(drawn, [])
+        self.render.set_visible(page, True)
+        self.assertEqual(drawn, [2])
+        self.render.render(canvas, "clock", lambda: drawn.append(3))
+        self.assertEqual(drawn, [2, 3])
+
+    def test_destroyed_page_is_dropped_with_its_draws(self):
+        page = FakePage()
+        self.render.register(page)
+        self.render.register(page, visible=True)   # re-registering binds once
+        self.assertEqual(len(page.bindings["<Destroy>"]), 1)
+        self.render.set_visible(page, False)
+        self.render.render(page, "draw", page.draw)
+        page.destroy()
+        self.assertEqual((len(self.render._visible), len(self.render._pending)), (0, 0))
+
+    def test_pages_are_not_kept_alive(self):
+        page = FakePage()
+        self.render.register(page)
+        del page
+        gc.collect()
+        self.assertEqual(len(self.render._visible), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
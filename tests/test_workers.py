@@ -0,0 +1,92 @@
+import threading
+import time
+import unittest
+
+from shared.workers import IOPool
+
+from .fakes import FakeRoot
+
+
+class IOPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = IOPool(max_workers=4)
+        self.addCleanup(self.pool.shutdown)
+        self.log = []
+        self.lock = threading.Lock()
+
+    def job(self, name, gate=None, result=None):
+        def run():
+            with self.lock:
+                self.log.append(("start", name))
+            if gate is not None:
+                gate.wait(5)
+            with self.lock:
+                self.log.append(("end", name))
+            return result if result is not None else name
+        return run
+
+    def test_same_key_runs_in_order_without_overlap(self):
+        gate = threading.Event()
+        futures = [self.pool.submit(self.job("a", gate), key="f")]
+        futures += [self.pool.submit(self.job(n), key="f") for n in "bcd"]
+        time.sleep(0.05)
+        self.assertEqual(self.log, [("start", "a")])   # the rest wait behind it
+        gate.set()
+        self.assertTrue(self.pool.wait(5))
+        self.assertEqual(self.log, [(s, n) for n in "abcd" for s in ("start", "end")])
+        self.assertEqual([f.result() for f in futures], list("abcd"))
+
+    def test_other_keys_run_alongside(self):
+        gate = threading.Event()
+        self.pool.submit(self.job("a", gate), key="f")
+        done = self.pool.submit(self.job("b"), key="g")
+        self.assertEqual(done.result(5), "b")
+        gate.set()
+        self.assertTrue(self.pool.wait(5))
+
+    def test_coalesced_saves_write_once_with_the_latest(self):
+        gate = threading.Event()
+        self.pool.submit(self.job("first", gate), key="f", coalesce=True)
+        waiting = [self.pool.submit(self.job(n), key="f", coalesce=True) for n in ("v1", "v2", "v3")]
+        gate.set()
+        self.assertTrue(self.pool.wait(5))
+        self.assertEqual([n for s, n in self.log if s == "start"], ["first", "v3"])
+        # Replaced jobs resolve with the result of the one that took their place
+        self.assertEqual([f.result() for f in waiting], ["v3"] * 3)
+        self.assertEqual(self.pool.pending(), 0)
+
+    def test_plain_job_is_not_swallowed_by_a_coalesced_one(self):
+        gate = threading.Event()
+        self.pool.submit(self.job("first", gate), key="f")
+        self.pool.submit(self.job("load"), key="f")
+        self.pool.submit(self.job("save"), key="f", coalesce=True)
+        gate.set()
+        self.assertTrue(self.pool.wait(5))
+        self.assertEqual([n for s, n in self.log if s == "start"], ["first", "load", "save"])
+
+    def test_callbacks_run_on_the_tk_thread_and_release_the_poll(self):
+        root = FakeRoot()
+        results, errors = [], []
+        self.pool.submit(lambda: 42, widget=root, on_done=lambda r: results.append((r, threading.get_ident())))
+        self.pool.submit(lambda: 1 / 0, widget=root, on_error=errors.append)
+        root.run(2, until=lambda: results and errors)
+        self.assertEqual(results, [(42, threading.get_ident())])
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+        root.run(0.1)
+        self.assertEqual(root.pending_afters(), 0)
+
+    def test_callbacks_are_dropped_for_a_destroyed_widget(self):
+        root = FakeRoot()
+        gate = threading.Event()
+        results = []
+        self.pool.submit(self.job("a", gate), widget=root, on_done=results.append)
+        root.alive = False
+        gate.set()
+        self.assertTrue(self.pool.wait(5))
+        root.run(0.2)
+        self.assertEqual(results, [])
+        self.assertEqual(root.pending_afters(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()